@@ -0,0 +1,25 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+
+VELOX = pathlib.Path(__file__).resolve().parent.parent / 'velox' / 'velox.py'
+
+sys.path.insert(0, str(VELOX.parent))
+
+
+@pytest.fixture
+def run_velox(tmp_path):
+    def run(source, *args):
+        script = tmp_path / 'main.lox'
+        script.write_text(source)
+
+        return subprocess.run(
+            [sys.executable, str(VELOX), *args, str(script)],
+            capture_output=True,
+            text=True,
+        )
+
+    return run
@@ -0,0 +1,52 @@
+METHODS = '''
+class Counter {
+  init() {
+    this.count = 0;
+  }
+
+  add(amount) {
+    this.count = this.count + amount;
+  }
+}
+
+var counter = Counter();
+
+for (var i = 0; i < 50000; i = i + 1) {
+  var add = counter.add;
+  add(i);
+}
+
+print counter.count;
+'''
+
+
+def test_counts_allocations_by_kind(run_velox):
+    result = run_velox(METHODS, '--profile-allocations')
+
+    assert result.returncode == 0
+    assert result.stdout == '1249975000\n'
+
+    rows = {
+        line[:26].strip(): line[26:].split()
+        for line in result.stderr.splitlines()[2:]
+    }
+
+    assert rows['bound method'][1] == '50000'
+    assert rows['instance'][1] == '1'
+    assert rows['Counter'] == ['1', '1']
+
+
+def test_periodic_reports_while_allocating(run_velox):
+    result = run_velox(METHODS, '--profile-interval', '0.001')
+
+    assert result.returncode == 0
+    assert result.stdout == '1249975000\n'
+    assert 'Traceback' not in result.stderr
+    assert result.stderr.startswith('Allocations\n')
+
+
+def test_sites_point_at_the_allocating_line(run_velox):
+    result = run_velox('for (var i = 0; i < 5000; i = i + 1) {\n  var a = array.new(1);\n}', '--profile-allocations')
+
+    assert result.returncode == 0
+    assert result.stderr.splitlines()[-1].split() == ['line', '2', 'array', '0', '4992']
@@ -0,0 +1,166 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+
+from interpreter_pool import InterpreterPool
+from velox import Velox
+
+
+TEMPLATES = [
+    '''
+fun make_counter(start) {
+  var count = start;
+
+  fun next() {
+    count = count + 1;
+    return count;
+  }
+
+  return next;
+}
+
+var next = make_counter({seed});
+var total = 0;
+
+for (var i = 0; i < {loops}; i = i + 1) {
+  total = total + next();
+}
+
+print total;
+''',
+    '''
+class Counter {
+  init(start) {
+    this.count = start;
+  }
+
+  add(amount) {
+    this.count = this.count + amount;
+  }
+}
+
+class Doubler < Counter {
+  add(amount) {
+    super.add(amount * 2);
+  }
+}
+
+var counter = Doubler({seed});
+
+for (var i = 0; i < {loops}; i = i + 1) {
+  counter.add(i);
+}
+
+print counter.count;
+''',
+    '''
+fun numbers(count) {
+  var i = 0;
+
+  while (i < count) {
+    yield i + {seed};
+    i = i + 1;
+  }
+}
+
+var total = 0;
+
+for (var value in numbers({loops})) {
+  total = total + value;
+}
+
+print total;
+''',
+    '''
+var values = array.new(0);
+var table = map.new();
+
+for (var i = 0; i < {loops}; i = i + 1) {
+  array.push(values, i * {seed});
+  map.set(table, i, i + {seed});
+}
+
+var total = 0;
+
+for (var key in table) {
+  total = total + map.get(table, key);
+}
+
+print array.sum(values);
+print total;
+''',
+    '''
+var text = "";
+
+for (var i = 0; i < {seed}; i = i + 1) {
+  text = text + "ab";
+}
+
+var rebound = 0;
+
+fun rebind(value) {
+  rebound = rebound + value;
+}
+
+var i = 0;
+
+while (i < {loops}) {
+  rebind(i);
+  i = i + 1;
+}
+
+print text;
+print rebound;
+''',
+    '''
+fun fib(n) {
+  if (n < 2) return n;
+
+  return fib(n - 1) + fib(n - 2);
+}
+
+print fib({small});
+print undefined_{seed};
+''',
+]
+
+SCRIPTS = [
+    template
+    .replace('{seed}', str(seed))
+    .replace('{small}', str(seed % 12 + 5))
+    .replace('{loops}', str(seed * 61 % 1100))
+    for seed in range(1, 51)
+    for template in TEMPLATES
+]
+
+
+def execute(source):
+    output = io.StringIO()
+    exit_code = Velox(False, output).execute_source(source)
+
+    return exit_code, output.getvalue()
+
+
+def test_threads_match_single_threaded_runs():
+    expected = [execute(source) for source in SCRIPTS]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(execute, SCRIPTS))
+
+    assert results == expected
+
+
+def test_pooled_interpreters_match_single_threaded_runs():
+    pool = InterpreterPool(size=4)
+    programs = [pool.compile(source) for source in SCRIPTS]
+
+    def run(program):
+        result = pool.run(program)
+
+        return result.exit_code, result.output, result.errors
+
+    expected = [run(program) for program in programs]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(run, programs))
+
+    assert results == expected
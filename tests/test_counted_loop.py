@@ -0,0 +1,137 @@
+import io
+
+import pytest
+
+from counted_loop import CountedLoop
+from execution_limits import ExecutionLimits
+from velox import Velox
+
+
+SCRIPTS = {
+    'counter captured by a closure': ('''
+var first;
+var last;
+
+for (var i = 0; i < 3; i = i + 1) {
+  fun get() {
+    return i;
+  }
+
+  if (i == 0) first = get;
+  print get();
+  last = get;
+}
+
+print first();
+print last();
+''', 0, '0\n1\n2\n3\n3\n'),
+    'counter changed in the body': ('''
+for (var i = 0; i < 10; i = i + 1) {
+  print i;
+  i = i * 3;
+}
+
+var limit = 5;
+
+for (var i = 0; i < limit; i = i + 1) {
+  limit = limit - 1;
+  print i;
+}
+
+for (var i = 0; i <= 4; i = i + 1) {
+  if (i == 1) {
+    i = 3.5;
+  }
+
+  print i;
+}
+''', 0, '0\n1\n4\n0\n1\n2\n0\n3.5\n'),
+    'non-integer and non-finite bounds': ('''
+var total = 0;
+
+for (var i = 0.5; i < 3; i = i + 1) total = total + i;
+
+print total;
+
+total = 0;
+
+for (var i = 0; i <= 1; i = i + 0.1) total = total + 1;
+
+print total;
+
+for (var i = 0; i < 2.5; i = i + 1) print i;
+
+var nan = math.inf - math.inf;
+
+for (var i = 0; i < nan; i = i + 1) print "nan";
+for (var i = nan; i < 3; i = i + 1) print "nan counter";
+
+var negative = -math.inf;
+
+for (var i = 0; i < negative; i = i + 1) print "negative";
+
+var text = "3";
+
+for (var i = 0; i < text; i = i + 1) print i;
+''', 70, '4.5\n11\n0\n1\n2\nOperands must be numbers.\n[line 27]\n'),
+}
+
+INFINITE = '''
+var limit = math.inf;
+var total = 0;
+
+for (var i = 0; i < limit; i = i + 1) {
+  total = total + i;
+}
+'''
+
+
+def run(source, hot_threshold, limits=None):
+    output = io.StringIO()
+    velox = Velox(False, output)
+    velox.interpreter.hot_threshold = hot_threshold
+
+    budget = None
+
+    if limits != None:
+        budget = limits.apply(velox.interpreter)
+
+    exit_code = velox.execute_source(source)
+
+    return exit_code, output.getvalue(), budget.steps if budget != None else None
+
+
+def disable_counted_loops(monkeypatch):
+    monkeypatch.setattr(CountedLoop, 'match', staticmethod(lambda stmt: None))
+
+
+@pytest.mark.parametrize('hot_threshold', [0, 1, None])
+@pytest.mark.parametrize('name', list(SCRIPTS))
+def test_counted_run_matches_general_loop(name, hot_threshold, monkeypatch):
+    source, exit_code, expected = SCRIPTS[name]
+
+    counted = run(source, hot_threshold)
+
+    disable_counted_loops(monkeypatch)
+
+    assert run(source, hot_threshold) == counted == (exit_code, expected, None)
+
+
+@pytest.mark.parametrize('hot_threshold', [0, 1, None])
+def test_step_limit_stops_infinite_counted_loop(hot_threshold, monkeypatch):
+    limits = ExecutionLimits(max_steps=1000)
+
+    counted = run(INFINITE, hot_threshold, limits)
+
+    disable_counted_loops(monkeypatch)
+
+    assert run(INFINITE, hot_threshold, limits) == counted
+    assert counted == (70, 'Instruction budget exceeded.\n[line 5]\n', 1001)
+
+
+@pytest.mark.parametrize('hot_threshold', [0, 1, None])
+def test_timeout_stops_infinite_counted_loop(hot_threshold):
+    exit_code, output, _ = run(INFINITE, hot_threshold, ExecutionLimits(timeout=0.05))
+
+    assert exit_code == 70
+    assert output == 'Time limit exceeded.\n[line 5]\n'
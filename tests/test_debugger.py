@@ -0,0 +1,51 @@
+import io
+
+from debugger import Debugger
+from program import Program
+from velox import Velox
+
+
+SOURCE = '''var x = 1;
+if (x > 0)
+  { print "a"; }
+print "b";
+{
+  print "c";
+}
+'''
+
+
+def debug(breakpoints, commands):
+    output = io.StringIO()
+    velox = Velox(False, output)
+    program = Program.compile(SOURCE, velox.reporter)
+
+    Debugger(velox.interpreter, SOURCE, io.StringIO(commands), output).run(program.statements, breakpoints)
+
+    return output.getvalue()
+
+
+def test_breakpoint_on_block_line_stops_once():
+    assert debug([3], 'step\nstep\ncontinue\n') == (
+        '[line 3] { print "a"; }\n(vdb) a\n'
+        '[line 4] print "b";\n(vdb) b\n'
+        '[line 6] print "c";\n(vdb) c\n'
+    )
+
+
+def test_stepping_skips_blocks():
+    assert debug([], 'step\n' * 5 + 'continue\n') == (
+        'Type \'help\' for a list of commands.\n(vdb) '
+        '[line 1] var x = 1;\n(vdb) '
+        '[line 2] if (x > 0)\n(vdb) '
+        '[line 3] { print "a"; }\n(vdb) a\n'
+        '[line 4] print "b";\n(vdb) b\n'
+        '[line 6] print "c";\n(vdb) c\n'
+    )
+
+
+def test_block_line_is_not_a_breakpoint_line():
+    assert debug([5, 6], 'continue\n') == (
+        'No statement on line 5.\na\nb\n'
+        '[line 6] print "c";\n(vdb) c\n'
+    )
@@ -0,0 +1,80 @@
+SAVE = '''
+var numbers = array.new(3);
+array.set(numbers, 1, 2);
+var items = map.new();
+map.set(items, "key", "value");
+var doubled = vector.mul(vector.range(3), 2);
+var add = vector.add;
+var root = math.sqrt;
+var upper = string.upper;
+var started = time.clock() > 0;
+var has_next = iterator.has_next;
+'''
+
+LOAD = '''
+print array.get(numbers, 1);
+print map.get(items, "key");
+print vector.sum(add(doubled, 1));
+print root(16);
+print upper("done");
+print started;
+print has_next;
+print vector;
+'''
+
+
+def test_snapshot_with_every_native_module(run_velox, tmp_path):
+    snapshot = str(tmp_path / 'heap.snapshot')
+
+    saved = run_velox(SAVE, '--save-snapshot', snapshot)
+
+    assert saved.returncode == 0
+    assert saved.stdout == ''
+
+    loaded = run_velox(LOAD, '--load-snapshot', snapshot)
+
+    assert loaded.returncode == 0
+    assert loaded.stdout == '2\nvalue\n9\n4\nDONE\ntrue\n<native fn>\n<native module vector>\n'
+
+
+def test_unpicklable_global_is_reported(run_velox, tmp_path):
+    snapshot = str(tmp_path / 'heap.snapshot')
+
+    result = run_velox('fun numbers() { yield 1; }\nvar pending = numbers();', '--save-snapshot', snapshot)
+
+    assert result.returncode == 74
+    assert result.stdout.startswith('Could not save snapshot: ')
+
+
+def test_snapshot_of_deep_linked_structure(run_velox, tmp_path):
+    snapshot = str(tmp_path / 'heap.snapshot')
+
+    saved = run_velox('''
+class Node {
+  init(next) {
+    this.next = next;
+  }
+}
+
+var head = nil;
+
+for (var i = 0; i < 20000; i = i + 1) {
+  head = Node(head);
+}
+''', '--save-snapshot', snapshot)
+
+    assert saved.returncode == 0
+    assert saved.stdout == ''
+
+    loaded = run_velox('''
+var count = 0;
+
+for (var node = head; node != nil; node = node.next) {
+  count = count + 1;
+}
+
+print count;
+''', '--load-snapshot', snapshot)
+
+    assert loaded.returncode == 0
+    assert loaded.stdout == '20000\n'
@@ -0,0 +1,489 @@
+import io
+
+import pytest
+
+from velox import Velox
+
+
+def test_clock_returns_seconds(run_velox):
+    result = run_velox('print clock() > 0;')
+
+    assert result.returncode == 0
+    assert result.stdout == 'true\n'
+
+
+def test_undefined_property_is_a_runtime_error(run_velox):
+    result = run_velox('class A {}\nA().missing;')
+
+    assert result.returncode == 70
+    assert result.stdout == 'Undefined property \'missing\'.\n[line 2]\n'
+
+
+HOT_THRESHOLDS = [0, 1, None]
+
+
+def run(
+    source,
+    hot_threshold=None,
+    lazy_functions=False,
+):
+    output = io.StringIO()
+    velox = Velox(lazy_functions, output)
+    velox.interpreter.hot_threshold = hot_threshold
+
+    return velox.execute_source(source), output.getvalue()
+
+
+TIERING_SCRIPTS = {
+    'closures': ('''
+fun make_counter() {
+  var count = 0;
+
+  fun next() {
+    count = count + 1;
+    return count;
+  }
+
+  return next;
+}
+
+var a = make_counter();
+var b = make_counter();
+
+for (var i = 0; i < 5; i = i + 1) {
+  a();
+}
+
+print a();
+print b();
+
+var sum = 0;
+
+for (var i = 0; i < 3; i = i + 1) {
+  fun add() {
+    sum = sum + i;
+  }
+
+  add();
+}
+
+print sum;
+''', '6\n1\n3\n'),
+    'super in nested function': ('''
+class A {
+  greet() {
+    return "A";
+  }
+}
+
+class B < A {
+  greet() {
+    fun inner() {
+      return super.greet() + "B";
+    }
+
+    return inner();
+  }
+}
+
+var b = B();
+var out = "";
+
+for (var i = 0; i < 3; i = i + 1) {
+  out = out + b.greet();
+}
+
+print out;
+''', 'ABABAB\n'),
+    'generators': ('''
+fun range(n) {
+  for (var i = 0; i < n; i = i + 1) {
+    yield i;
+  }
+}
+
+var total = 0;
+
+for (var x in range(10)) {
+  total = total + x;
+}
+
+print total;
+''', '45\n'),
+    'early return from nested blocks': ('''
+fun find(limit) {
+  for (var i = 0; i < 100; i = i + 1) {
+    {
+      if (i * i > limit) {
+        while (true) {
+          return i;
+        }
+      }
+    }
+  }
+
+  return -1;
+}
+
+for (var j = 0; j < 3; j = j + 1) {
+  print find(j * 10);
+}
+''', '1\n4\n5\n'),
+    'counted loops': ('''
+var sum = 0;
+
+for (var i = 0; i < 10; i = i + 1) sum = sum + i;
+for (var i = 1; i <= 10; i = i + 2) sum = sum + i;
+for (var i = 0; i < 2.5; i = i + 0.5) sum = sum + i;
+
+var n = 4;
+
+for (var i = 0; i < n; i = i + 1) {
+  n = n - 1;
+  sum = sum + 100;
+}
+
+print sum;
+''', '275\n'),
+}
+
+
+@pytest.mark.parametrize('hot_threshold', HOT_THRESHOLDS)
+@pytest.mark.parametrize('name', list(TIERING_SCRIPTS))
+def test_compiled_and_tree_walked_runs_agree(name, hot_threshold):
+    source, expected = TIERING_SCRIPTS[name]
+
+    assert run(source, hot_threshold) == (0, expected)
+
+
+GENERATOR_SCRIPTS = {
+    'yield in nested blocks and loops': ('''
+fun walk(rows, columns) {
+  for (var row = 0; row < rows; row = row + 1) {
+    {
+      var column = 0;
+
+      while (column < columns) {
+        if (column != row) {
+          {
+            yield row * 10 + column;
+          }
+        }
+
+        column = column + 1;
+      }
+    }
+  }
+
+  yield -1;
+}
+
+for (var value in walk(3, 3)) {
+  print value;
+}
+''', '1\n2\n10\n12\n20\n21\n-1\n'),
+    'return inside a generator': ('''
+fun until(limit) {
+  var i = 0;
+
+  while (true) {
+    {
+      if (i == limit) return;
+    }
+
+    yield i;
+    i = i + 1;
+  }
+
+  yield "unreachable";
+}
+
+fun first(values) {
+  for (var value in values) {
+    return value;
+  }
+}
+
+for (var value in until(3)) {
+  print value;
+}
+
+print first(until(5));
+
+for (var value in until(0)) {
+  print value;
+}
+
+print "done";
+''', '0\n1\n2\n0\ndone\n'),
+    'for-in over arrays, maps and generators': ('''
+var values = array.new(0);
+array.push(values, 1);
+array.push(values, 2);
+array.push(values, 3);
+
+var table = map.new();
+map.set(table, "a", 10);
+map.set(table, "b", 20);
+
+fun pairs(table) {
+  for (var key in table) {
+    yield key;
+    yield map.get(table, key);
+  }
+}
+
+var total = 0;
+
+for (var value in values) {
+  total = total + value;
+}
+
+print total;
+
+for (var key in table) {
+  print key;
+}
+
+for (var item in pairs(table)) {
+  print item;
+}
+
+for (var value in values) {
+  for (var item in pairs(table)) {
+    print item;
+  }
+}
+''', '6\na\nb\na\n10\nb\n20\na\n10\nb\n20\na\n10\nb\n20\na\n10\nb\n20\n'),
+    'generator captures loop variables': ('''
+fun getters(n) {
+  for (var i = 0; i < n; i = i + 1) {
+    var captured = i;
+
+    fun get() {
+      return captured * 10 + i;
+    }
+
+    yield get;
+  }
+}
+
+var later = map.new();
+var count = 0;
+
+for (var get in getters(3)) {
+  print get();
+  map.set(later, count, get);
+  count = count + 1;
+}
+
+for (var key in later) {
+  print map.get(later, key)();
+}
+
+fun makers() {
+  var gens = map.new();
+
+  for (var i = 0; i < 3; i = i + 1) {
+    var j = i;
+
+    fun gen() {
+      yield j;
+      yield j + 100;
+    }
+
+    map.set(gens, i, gen);
+  }
+
+  return gens;
+}
+
+var gens = makers();
+
+for (var key in gens) {
+  for (var value in map.get(gens, key)()) {
+    print value;
+  }
+}
+''', '0\n11\n22\n3\n13\n23\n0\n100\n1\n101\n2\n102\n'),
+}
+
+
+@pytest.mark.parametrize('lazy_functions', [False, True])
+@pytest.mark.parametrize('hot_threshold', HOT_THRESHOLDS)
+@pytest.mark.parametrize('name', list(GENERATOR_SCRIPTS))
+def test_generators_and_for_in(name, hot_threshold, lazy_functions):
+    source, expected = GENERATOR_SCRIPTS[name]
+
+    assert run(source, hot_threshold, lazy_functions) == (0, expected)
+
+
+INVOKE_SCRIPTS = {
+    'field holding a function': ('''
+fun shout(text) {
+  return text + "!";
+}
+
+class Box {
+  init() {
+    this.call = shout;
+  }
+
+  call(text) {
+    return "method " + text;
+  }
+
+  other(text) {
+    return "other " + text;
+  }
+}
+
+var box = Box();
+
+print box.call("field");
+print box.other("method");
+
+box.other = box.call;
+print box.other("swapped");
+
+fun make_adder(n) {
+  fun add(x) {
+    return x + n;
+  }
+
+  return add;
+}
+
+box.add = make_adder(10);
+print box.add(5);
+
+class Maker {
+  init() {
+    this.klass = Box;
+  }
+}
+
+print Maker().klass().other("class");
+''', 'field!\nother method\nswapped!\n15\nother class\n'),
+    'super calls': ('''
+class A {
+  init(name) {
+    this.name = name;
+  }
+
+  describe(prefix) {
+    return prefix + this.name;
+  }
+
+  twice(prefix) {
+    return this.describe(prefix) + this.describe(prefix);
+  }
+}
+
+class B < A {
+  init(name) {
+    super.init(name + "b");
+  }
+
+  describe(prefix) {
+    return "<" + super.describe(prefix) + ">";
+  }
+}
+
+class C < B {
+  describe(prefix) {
+    var method = super.describe;
+
+    return method(prefix + "c");
+  }
+}
+
+print B("x").describe("-");
+print B("y").twice("+");
+print C("z").describe("=");
+print C("w").twice("");
+''', '<-xb>\n<+yb><+yb>\n<=czb>\n<cwb><cwb>\n'),
+    'bound methods called later': ('''
+class Counter {
+  init() {
+    this.count = 0;
+  }
+
+  add(n) {
+    this.count = this.count + n;
+    return this;
+  }
+}
+
+var a = Counter();
+var b = Counter();
+
+var add_a = a.add;
+var add_b = b.add;
+
+for (var i = 0; i < 3; i = i + 1) {
+  add_a(i);
+  add_b(10);
+}
+
+var holder = Counter();
+holder.callback = add_a;
+holder.callback(100);
+
+print a.count;
+print b.count;
+print holder.count;
+print add_a(1).add(1).count;
+print add_a;
+''', '103\n30\n0\n105\n<fn add>\n'),
+}
+
+ARITY_PRELUDE = '''
+class A {
+  method(a, b) {
+    return a + b;
+  }
+}
+
+class B < A {
+  method(a) {
+    return super.method(a);
+  }
+}
+
+fun two(a, b) {
+  return a + b;
+}
+
+var a = A();
+a.field = two;
+
+print a.method(1, 2);
+'''
+
+ARITY_ERRORS = [
+    ('a.method(1);', 'Expected 2 arguments but got 1.\n[line 22]\n'),
+    ('a.field(1, 2, 3);', 'Expected 2 arguments but got 3.\n[line 22]\n'),
+    ('B().method(1);', 'Expected 2 arguments but got 1.\n[line 10]\n'),
+    ('var m = a.method; m();', 'Expected 2 arguments but got 0.\n[line 22]\n'),
+    ('A(1);', 'Expected 0 arguments but got 1.\n[line 22]\n'),
+    ('math.floor(1, 2);', 'Expected 1 arguments but got 2.\n[line 22]\n'),
+    ('a.method(1, 2)(3);', 'Can only call functions and classes.\n[line 22]\n'),
+]
+
+
+@pytest.mark.parametrize('lazy_functions', [False, True])
+@pytest.mark.parametrize('hot_threshold', HOT_THRESHOLDS)
+@pytest.mark.parametrize('name', list(INVOKE_SCRIPTS))
+def test_invoke(name, hot_threshold, lazy_functions):
+    source, expected = INVOKE_SCRIPTS[name]
+
+    assert run(source, hot_threshold, lazy_functions) == (0, expected)
+
+
+@pytest.mark.parametrize('hot_threshold', HOT_THRESHOLDS)
+@pytest.mark.parametrize('statement, error', ARITY_ERRORS)
+def test_invoke_arity_errors(statement, error, hot_threshold):
+    source = ARITY_PRELUDE + statement
+
+    assert run(source, hot_threshold) == (70, '3\n' + error)
@@ -0,0 +1,106 @@
+import pytest
+
+from execution_limits import ExecutionLimits
+from interpreter_pool import InterpreterPool
+
+
+PRELUDE = '''
+print "prelude loaded";
+
+class Box {}
+
+var shared = Box();
+shared.value = 0;
+
+var total = 0;
+
+fun make_counter() {
+  var count = 0;
+
+  fun next() {
+    count = count + 1;
+    return count;
+  }
+
+  return next;
+}
+
+var counter = make_counter();
+'''
+
+LOOPS = '''
+fun f(n) {
+  return n;
+}
+
+var total = 0;
+
+for (var i = 0; i < 300; i = i + 1) {
+  var j = 0;
+
+  while (j < 7) {
+    total = total + f(j);
+    j = j + 1;
+  }
+}
+
+print total;
+'''
+
+
+def test_runs_get_fresh_prelude_state():
+    pool = InterpreterPool(size=1, prelude=PRELUDE)
+    program = pool.compile('''
+shared.value = shared.value + 1;
+total = total + 1;
+print shared.value;
+print total;
+print counter();
+''')
+
+    for _ in range(2):
+        result = pool.run(program)
+
+        assert result.exit_code == 0
+        assert result.output == '1\n1\n1\n'
+
+
+
+def test_host_exception_is_reported_as_runtime_error():
+    result = InterpreterPool(size=1).run('print "a";\nprint 1 / 0;')
+
+    assert result.exit_code == 70
+    assert result.output == 'a\n'
+    assert result.errors == 'ZeroDivisionError: float division by zero\n'
+
+
+def test_lazy_body_syntax_error_exits_like_cli():
+    pool = InterpreterPool(size=1, lazy_functions=True)
+
+    result = pool.run('fun broken() {\n  1 = 2;\n}\nbroken();')
+
+    assert result.exit_code == 65
+    assert result.errors.startswith('[line 2] Error at \'=\': Invalid assignment target.\n')
+
+
+def test_step_count_matches_loop_iterations_and_calls():
+    result = InterpreterPool(size=1).run(LOOPS, ExecutionLimits())
+
+    assert result.exit_code == 0
+    assert result.steps == 300 + 300 * 7 * 2
+
+
+@pytest.mark.parametrize('max_steps', [0, 1, 63, 64, 65, 1000, 4499])
+def test_step_limit_stops_at_the_exact_step(max_steps):
+    result = InterpreterPool(size=1).run(LOOPS, ExecutionLimits(max_steps=max_steps))
+
+    assert result.exit_code == 70
+    assert result.steps == max_steps + 1
+    assert result.errors.startswith('Instruction budget exceeded.')
+
+
+def test_step_limit_allows_the_last_step():
+    result = InterpreterPool(size=1).run(LOOPS, ExecutionLimits(max_steps=4500))
+
+    assert result.exit_code == 0
+    assert result.output == '6300\n'
@@ -0,0 +1,47 @@
+import pytest
+
+from interpreter_pool import InterpreterPool
+from module_loader import ModuleLoader
+
+
+COUNTER = '''
+print "counter loaded";
+
+var count = 0;
+
+fun next() {
+  count = count + 1;
+  return count;
+}
+'''
+
+
+@pytest.fixture(autouse=True)
+def clear_module_cache():
+    ModuleLoader.clear()
+
+    yield
+
+    ModuleLoader.clear()
+
+
+def test_each_pool_run_gets_fresh_module_state(tmp_path):
+    (tmp_path / 'counter.lox').write_text(COUNTER)
+
+    pool = InterpreterPool(size=1)
+    program = pool.compile('import counter;\nprint counter.next();\nprint counter.next();')
+
+    for _ in range(2):
+        result = pool.run(program, directory=str(tmp_path))
+
+        assert result.exit_code == 0
+        assert result.output == 'counter loaded\n1\n2\n'
+
+
+def test_module_runs_once_per_run(run_velox, tmp_path):
+    (tmp_path / 'counter.lox').write_text(COUNTER)
+
+    result = run_velox('import counter;\n{\n  import counter;\n  print counter.next();\n}\nprint counter.next();')
+
+    assert result.returncode == 0
+    assert result.stdout == 'counter loaded\n1\n2\n'
@@ -0,0 +1,47 @@
+import pytest
+
+
+@pytest.mark.parametrize('function', ['ceil', 'floor', 'round'])
+def test_rounding_keeps_infinities(run_velox, function):
+    result = run_velox(f'print math.{function}(math.inf);\nprint math.{function}(-math.inf);')
+
+    assert result.returncode == 0
+    assert result.stdout == 'inf\n-inf\n'
+
+
+@pytest.mark.parametrize('function', ['ceil', 'floor', 'round'])
+def test_rounding_keeps_nan(run_velox, function):
+    result = run_velox(f'var nan = math.inf - math.inf;\nprint math.{function}(nan);')
+
+    assert result.returncode == 0
+    assert result.stdout == 'nan\n'
+
+
+@pytest.mark.parametrize('call', [
+    'math.sin(math.inf)',
+    'math.cos(-math.inf)',
+    'math.tan(math.inf - math.inf)',
+    'math.mod(math.inf, 2)',
+    'math.mod(-math.inf, 2)',
+])
+def test_undefined_result_is_nan(run_velox, call):
+    result = run_velox(f'print {call};')
+
+    assert result.returncode == 0
+    assert result.stdout == 'nan\n'
+
+
+@pytest.mark.parametrize('call, message', [
+    ('array.get(array.new(2), math.inf)', 'Index must be a whole number.'),
+    ('array.new(math.inf - math.inf)', 'Size must be a non-negative whole number.'),
+    ('array.slice(array.new(2), 0, math.inf)', 'Slice bounds must be whole numbers.'),
+    ('string.char_at("abc", -math.inf)', 'Index must be a whole number.'),
+    ('string.repeat("a", math.inf)', 'Size must be a non-negative whole number.'),
+    ('time.sleep(math.inf)', 'Argument 1 of \'time.sleep\' must be finite.'),
+    ('time.sleep(math.inf - math.inf)', 'Argument 1 of \'time.sleep\' must be finite.'),
+])
+def test_non_finite_argument_is_a_runtime_error(run_velox, call, message):
+    result = run_velox(f'print {call};')
+
+    assert result.returncode == 70
+    assert result.stdout == f'{message}\n[line 1]\n'
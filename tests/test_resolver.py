@@ -0,0 +1,36 @@
+def test_shadowed_local_resolves_to_innermost_declaration(run_velox):
+    source = '''
+{
+  var a = "outer";
+  {
+    var a = "inner";
+    print a;
+  }
+  print a;
+}
+'''
+    result = run_velox(source)
+
+    assert result.returncode == 0
+    assert result.stdout == 'inner\nouter\n'
+
+
+def test_closure_captures_innermost_declaration(run_velox):
+    source = '''
+fun make() {
+  var value = "outer";
+  fun read() {
+    var value = "inner";
+    fun get() {
+      return value;
+    }
+    return get;
+  }
+  return read();
+}
+print make()();
+'''
+    result = run_velox(source)
+
+    assert result.returncode == 0
+    assert result.stdout == 'inner\n'
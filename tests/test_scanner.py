@@ -0,0 +1,12 @@
+def test_fractional_number_literal(run_velox):
+    result = run_velox('print 3.5 + 1.25;')
+
+    assert result.returncode == 0
+    assert result.stdout == '4.75\n'
+
+
+def test_fractional_number_literal_at_end_of_source(run_velox):
+    result = run_velox('print 2.5 * 2;\nprint 0.5')
+
+    assert result.returncode == 65
+    assert result.stdout == '[line 2] Error at end: Expected \';\' after value.\n'
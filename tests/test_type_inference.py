@@ -0,0 +1,97 @@
+import io
+
+import pytest
+
+from type_inference import TypeInference
+from velox import Velox
+
+
+SCRIPTS = {
+    'type changes inside a loop': ('''
+var v = 1;
+
+for (var i = 0; i < 3; i = i + 1) {
+  print v + v;
+  v = "ab";
+}
+
+var x = 1;
+
+for (var i = 0; i < 4; i = i + 1) {
+  print x + 1;
+
+  if (i == 1) x = "s";
+  else x = 2;
+}
+''', '2\nabab\nabab\n2\n3\nOperands must be two numbers or two strings.\n[line 12]\n'),
+    'closure reassigns a captured variable': ('''
+fun outer() {
+  var x = 1;
+  var y = 1;
+
+  fun change() {
+    x = "x";
+    y = -y;
+  }
+
+  print x + x;
+  print -y;
+  change();
+  print x + x;
+  print -y;
+  change();
+  x = 2;
+  print x * 3;
+}
+
+outer();
+
+fun broken() {
+  var n = 1;
+
+  fun change() {
+    n = "text";
+  }
+
+  change();
+  print n - 1;
+}
+
+broken();
+''', '2\n-1\nxx\n1\n6\nOperands must be numbers.\n[line 31]\n'),
+    'global rebound from a function': ('''
+var g = 1;
+var s = "a";
+
+fun rebind() {
+  g = "text";
+  s = 2;
+}
+
+print g * 2;
+print s + s;
+rebind();
+print s + s;
+print g * 2;
+''', '2\naa\n4\nOperands must be numbers.\n[line 14]\n'),
+}
+
+
+def run(source, hot_threshold):
+    output = io.StringIO()
+    velox = Velox(False, output)
+    velox.interpreter.hot_threshold = hot_threshold
+
+    return velox.execute_source(source), output.getvalue()
+
+
+@pytest.mark.parametrize('hot_threshold', [0, 1, None])
+@pytest.mark.parametrize('name', list(SCRIPTS))
+def test_inferred_run_matches_run_without_inference(name, hot_threshold, monkeypatch):
+    source, expected = SCRIPTS[name]
+
+    inferred = run(source, hot_threshold)
+
+    monkeypatch.setattr(TypeInference, 'infer', lambda self, *statements: None)
+
+    assert run(source, hot_threshold) == inferred == (70, expected)
@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import time
+
+import pytest
+
+from velox import Velox
+from velox_client import VeloxClient
+from velox_daemon import SocketOutput, VeloxDaemon
+
+
+DAEMON = pathlib.Path(__file__).resolve().parent.parent / 'velox' / 'velox_daemon.py'
+
+
+def execute(
+    daemon,
+    request,
+):
+    writer = io.BytesIO()
+    output = SocketOutput(writer)
+
+    output.finish(daemon.execute(request, output))
+
+    messages = [json.loads(line) for line in writer.getvalue().splitlines()]
+
+    return (
+        messages[-1]['exit_code'],
+        ''.join(message.get('output', '') for message in messages),
+    )
+
+
+@pytest.mark.parametrize('name', ['missing.lox', '.'])
+def test_unreadable_script_matches_cli(tmp_path, name):
+    path = str(tmp_path / name)
+    output = io.StringIO()
+
+    exit_code = Velox(output=output).execute_file(path)
+
+    assert exit_code == 66
+    assert execute(VeloxDaemon(str(tmp_path / 'socket'), 1), {'path': path}) == (66, output.getvalue())
+
+
+def test_runs_script(tmp_path):
+    path = tmp_path / 'main.lox'
+    path.write_text('print 1 + 2;')
+
+    assert execute(VeloxDaemon(str(tmp_path / 'socket'), 1), {'path': str(path)}) == (0, '3\n')
+
+
+def test_cached_lazy_body_errors_match_cli(tmp_path):
+    path = tmp_path / 'main.lox'
+    path.write_text('fun broken() {\n  1 = 2;\n}\nprint "before";\nbroken();')
+
+    output = io.StringIO()
+    exit_code = Velox(True, output).execute_file(str(path))
+
+    assert exit_code == 65
+
+    daemon = VeloxDaemon(str(tmp_path / 'socket'), 1)
+
+    for _ in range(2):
+        assert execute(daemon, {'path': str(path), 'lazy': True}) == (65, output.getvalue())
+
+
+def test_failed_request_still_sends_exit_code(tmp_path):
+    socket_path = str(tmp_path / 'socket')
+    server = subprocess.Popen([sys.executable, str(DAEMON), '--socket', socket_path, '--pool', '1'])
+
+    try:
+        deadline = time.monotonic() + 10
+
+        while not os.path.exists(socket_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        output = io.StringIO()
+
+        assert VeloxClient(socket_path).run([], output) == 70
+        assert output.getvalue() == 'AttributeError: \'list\' object has no attribute \'get\'\n'
+    finally:
+        server.terminate()
+        server.wait()
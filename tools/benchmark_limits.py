@@ -0,0 +1,78 @@
+import gc
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'velox'))
+
+from execution_limits import ExecutionLimits
+from velox import Velox
+
+
+class BenchmarkLimits:
+    LIMITS = ExecutionLimits(max_steps=1 << 62, timeout=1e9, max_call_depth=1 << 20)
+
+
+    # Public methods
+
+    @staticmethod
+    def run(
+        repeats: int,
+        paths: list[str],
+    ) -> int:
+        print(f'{"script":<24} {"disabled":>10} {"enabled":>10} {"overhead":>10}')
+
+        for path in paths:
+            with open(path, 'r') as in_file:
+                source = in_file.read()
+
+            disabled = enabled = None
+
+            for _ in range(repeats):
+                elapsed = BenchmarkLimits.__time(source, None)
+                disabled = elapsed if disabled == None else min(disabled, elapsed)
+
+                elapsed = BenchmarkLimits.__time(source, BenchmarkLimits.LIMITS)
+                enabled = elapsed if enabled == None else min(enabled, elapsed)
+
+            overhead = (enabled / disabled - 1) * 100
+
+            print(f'{os.path.basename(path):<24} {disabled:>9.3f}s {enabled:>9.3f}s {overhead:>9.1f}%')
+
+        return 0
+
+
+    # Private methods
+
+    @staticmethod
+    def __time(
+        source: str,
+        limits: ExecutionLimits,
+    ) -> float:
+        velox = Velox(False, io.StringIO())
+
+        if limits != None:
+            limits.apply(velox.interpreter)
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+
+            velox.execute_source(source)
+
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+
+if __name__ == '__main__':
+    _, *args = sys.argv
+
+    if len(args) < 2:
+        print('Usage benchmark_limits <repeats> <script> [script ...]')
+        sys.exit(64)
+    else:
+        sys.exit(BenchmarkLimits.run(int(args[0]), args[1:]))
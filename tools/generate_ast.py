@@ -28,6 +28,8 @@ class GenerateAst:
             writer.write('\n\n')
 
             writer.write(f'class {base_name}:\n')
+            writer.write('    fields = ()\n')
+            writer.write('\n')
             writer.write('    # Public methods\n')
             writer.write('\n')
             writer.write('    def accept(\n')
@@ -38,11 +40,13 @@ class GenerateAst:
 
             for type in types:
                 class_name, fields = type.split(':')
+                fields, _, annotations = fields.partition('|')
                 GenerateAst.__define_type(
                     writer,
                     base_name,
                     class_name.strip(),
                     fields.strip(),
+                    annotations.strip(),
                 )
                 writer.write('\n\n')
 
@@ -61,10 +65,14 @@ class GenerateAst:
         base_name: str,
         class_name: str,
         field_list: str,
+        annotation_list: str,
     ) -> None:
         fields = field_list.split(', ')
+        names = [repr(field.split(' ')[1]) for field in fields]
 
         writer.write(f'class {base_name}{class_name}({base_name}):\n')
+        writer.write(f'    fields = ({", ".join(names)}{"," if len(names) == 1 else ""})\n')
+        writer.write('\n')
         writer.write('    # Lifecycle methods\n')
         writer.write('\n')
         writer.write('    def __init__(\n')
@@ -80,8 +88,35 @@ class GenerateAst:
             _, name = field.split(' ')
 
             writer.write(f'        self.{name} = {name}\n')
+
+        transients = []
+
+        if annotation_list:
+            writer.write('\n')
+
+            for annotation in annotation_list.split(', '):
+                annotation, _, default = annotation.partition(' = ')
+                *modifiers, type, name = annotation.split(' ')
+
+                if 'transient' in modifiers:
+                    transients.append((name, default or 'None'))
+
+                writer.write(f'        self.{name}: {type} = {default or "None"}\n')
         writer.write('\n\n')
 
+        if transients:
+            writer.write('    def __getstate__(\n')
+            writer.write('        self,\n')
+            writer.write('    ) -> dict[str, Any]:\n')
+            writer.write('        state = dict(self.__dict__)\n')
+
+            for name, default in transients:
+                writer.write(f'        state[\'{name}\'] = {default}\n')
+
+            writer.write('\n')
+            writer.write('        return state\n')
+            writer.write('\n\n')
+
         writer.write('    # Public methods\n')
         writer.write('\n')
 
@@ -124,38 +159,44 @@ if __name__ == '__main__':
 
         GenerateAst.define_ast(output_directory, 'Expr',
             [
-                'Assign   : Token name, Expr value',
-                'Binary   : Expr left, Token operator, Expr right',
+                'Assign   : Token name, Expr value | int depth, Binding binding',
+                'Binary   : Expr left, Token operator, Expr right | Callable numeric',
                 'Call     : Expr callee, Token paren, list[Expr] arguments',
                 'Get      : Expr object, Token name',
                 'Grouping : Expr expression',
+                'Invoke   : Expr object, Token name, Token paren, list[Expr] arguments',
                 'Literal  : Any value',
                 'Logical  : Expr left, Token operator, Expr right',
                 'Set      : Expr object, Token name, Expr value',
-                'Super    : Token keyword, Token method',
-                'This     : Token keyword',
-                'Unary    : Token operator, Expr right',
-                'Variable : Token name',
+                'Super    : Token keyword, Token method | int depth',
+                'This     : Token keyword | int depth',
+                'Unary    : Token operator, Expr right | bool numeric',
+                'Variable : Token name | int depth, Binding binding',
             ],
             [
-                'token : Token',
+                'velox_token : Token',
             ],
         )
 
         GenerateAst.define_ast(output_directory, 'Stmt',
             [
-                'Block      : list[Stmt] statements',
+                'Block      : list[Stmt] statements | bool flat, bool reusable',
                 'Class      : Token name, ExprVariable superclass, list[Stmt] methods',
                 'Expression : Expr expression',
-                'Function   : Token name, list[Token] params, list[Stmt] body',
+                'For        : Token keyword, Stmt initializer, Expr condition, Expr increment, Stmt body | int heat = 0, CountedLoop counted, StmtFunction function, transient Callable compiled, transient Callable resume',
+                'ForIn      : Token name, Expr iterable, Stmt body | bool reusable, Binding binding, StmtFunction function',
+                'Function   : Token name, list[Token] params, list[Stmt] body, bool is_generator | tuple names, int heat = 0, transient Callable compiled',
                 'If         : Expr condition, Stmt then_branch, Stmt else_branch',
-                'Print      : Expr expression',
+                'Import     : Token keyword, Token name | Binding binding',
+                'Print      : Token keyword, Expr expression',
                 'Return     : Token keyword, Expr value',
-                'Var        : Token name, Expr initializer',
-                'While      : Expr condition, Stmt body',
+                'Var        : Token name, Expr initializer | Binding binding',
+                'While      : Token keyword, Expr condition, Stmt body | int heat = 0, StmtFunction function, transient Callable compiled',
+                'Yield      : Token keyword, Expr value',
             ],
             [
+                'counted_loop : CountedLoop',
                 'expr : Expr, ExprVariable',
-                'token : Token',
+                'velox_token : Token',
             ],
         )
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'velox'))
+
+from velox import Velox
+
+
+class StressInterpreters:
+    # Public methods
+
+    @staticmethod
+    def run(
+        copies: int,
+        paths: list[str],
+    ) -> int:
+        sources = []
+        expected = []
+        checked = []
+
+        for path in paths:
+            with open(path, 'r') as in_file:
+                source = in_file.read()
+
+            result = StressInterpreters.__execute(source)
+
+            if result != StressInterpreters.__execute(source):
+                print(f'Skipping {path}: its output differs between runs.')
+
+                continue
+
+            sources.append(source)
+            expected.append(result)
+            checked.append(path)
+
+        if not sources:
+            print('No deterministic scripts to compare.')
+
+            return 1
+
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            results = list(executor.map(StressInterpreters.__execute, sources * copies))
+
+        mismatches = 0
+
+        for index, result in enumerate(results):
+            if result != expected[index % len(sources)]:
+                mismatches += 1
+
+                print(f'Mismatch in run {index} of {checked[index % len(checked)]}.')
+
+        print(f'{len(results)} runs, {mismatches} mismatches.')
+
+        return 1 if mismatches else 0
+
+
+    # Private methods
+
+    @staticmethod
+    def __execute(
+        source: str,
+    ) -> tuple[int, str]:
+        output = io.StringIO()
+
+        exit_code = Velox(False, output).execute_source(source)
+
+        return exit_code, output.getvalue()
+
+
+if __name__ == '__main__':
+    _, *args = sys.argv
+
+    if len(args) < 2:
+        print('Usage stress_interpreters <copies> <script> [script ...]')
+        sys.exit(64)
+    else:
+        sys.exit(StressInterpreters.run(int(args[0]), args[1:]))
@@ -0,0 +1,305 @@
+import collections
+import gc
+import sys
+import threading
+import weakref
+from typing import Any, Callable, Optional, TextIO
+
+from callables import VeloxFunction
+from environment import Environment
+import expr as Expr
+import stmt as Stmt
+from velox_array import VeloxArray
+from velox_generator import VeloxGenerator
+from velox_instance import VeloxInstance
+from velox_map import VeloxMap
+from velox_module import VeloxModule
+from velox_rope import VeloxRope
+from velox_token import Token
+from velox_vector import VeloxVector
+
+
+class AllocationProfiler:
+    KINDS = {
+        Environment: 'environment',
+        VeloxArray: 'array',
+        VeloxFunction: 'function',
+        VeloxGenerator: 'generator',
+        VeloxInstance: 'instance',
+        VeloxMap: 'map',
+        VeloxModule: 'module',
+        VeloxRope: 'string',
+        VeloxVector: 'vector',
+    }
+    MAX_FRAMES = 24
+    MAX_SITES = 20
+    SAMPLE_INTERVAL = 64
+
+    active = None
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        sample_interval: int = SAMPLE_INTERVAL,
+    ) -> None:
+        self.__sample_interval = max(sample_interval, 1)
+        self.__totals = {}
+        self.__classes = collections.Counter()
+        self.__sites = collections.Counter()
+        self.__samples = []
+        self.__lock = threading.Lock()
+        self.__originals = {}
+        self.__reporter = None
+
+
+    # Public methods
+
+    def report(
+        self,
+        output: TextIO = None,
+    ) -> None:
+        output = output or sys.stderr
+
+        live, live_classes = self.__count_live()
+
+        with self.__lock:
+            live_sites = self.__count_live_sites()
+            totals = collections.Counter({kind: count[0] for kind, count in self.__totals.items() if count[0] != 0})
+            classes = self.__classes.copy()
+            sites = self.__sites.copy()
+
+        lines = ['Allocations', f'  {"kind":<24} {"live":>10} {"total":>12}']
+
+        for kind, total in totals.most_common():
+            lines.append(f'  {kind:<24} {live[kind]:>10} {total:>12}')
+
+        if len(classes) != 0:
+            lines.append(f'  {"class":<24} {"live":>10} {"total":>12}')
+
+            for name, total in classes.most_common():
+                lines.append(f'  {name:<24} {live_classes[name]:>10} {total:>12}')
+
+        if len(sites) != 0:
+            lines.append(
+                f'  {"site (1 in " + str(self.__sample_interval) + " sampled)":<24} '
+                f'{"live":>10} {"total":>12}'
+            )
+
+            for (line, kind), count in sites.most_common(AllocationProfiler.MAX_SITES):
+                site = f'line {line} {kind}' if line != None else f'? {kind}'
+                estimate = count * self.__sample_interval
+                live_estimate = live_sites[(line, kind)] * self.__sample_interval
+
+                lines.append(f'  {site:<24} {live_estimate:>10} {estimate:>12}')
+
+        output.write('\n'.join(lines) + '\n')
+        output.flush()
+
+
+    def start(
+        self,
+        report_interval: float = None,
+        output: TextIO = None,
+    ) -> None:
+        if AllocationProfiler.active != None:
+            raise ValueError('Another allocation profiler is already running.')
+
+        AllocationProfiler.active = self
+
+        for cls, kind in AllocationProfiler.KINDS.items():
+            self.__originals[cls] = cls.__init__
+
+            cls.__init__ = self.__wrap(cls.__init__, kind)
+
+        if report_interval != None:
+            self.__reporter = threading.Event()
+
+            threading.Thread(
+                target=self.__report_periodically,
+                args=(self.__reporter, report_interval, output),
+                daemon=True,
+            ).start()
+
+
+    def stop(
+        self,
+    ) -> None:
+        if AllocationProfiler.active is not self:
+            return
+
+        for cls, original in self.__originals.items():
+            cls.__init__ = original
+
+        self.__originals.clear()
+
+        if self.__reporter != None:
+            self.__reporter.set()
+            self.__reporter = None
+
+        AllocationProfiler.active = None
+
+
+    # Private methods
+
+    def __count_live(
+        self,
+    ) -> tuple[collections.Counter, collections.Counter]:
+        live = collections.Counter()
+        live_classes = collections.Counter()
+        kinds = AllocationProfiler.KINDS
+
+        for obj in gc.get_objects():
+            kind = kinds.get(type(obj))
+
+            if kind == None:
+                continue
+
+            live[AllocationProfiler.__kind_of(obj, kind)] += 1
+
+            if kind == 'instance':
+                klass = getattr(obj, 'klass', None)
+
+                if klass != None:
+                    live_classes[klass.name] += 1
+
+        return live, live_classes
+
+
+    def __count_live_sites(
+        self,
+    ) -> collections.Counter:
+        self.__samples = [(ref, site) for ref, site in self.__samples if ref() is not None]
+
+        return collections.Counter(site for ref, site in self.__samples)
+
+
+    @staticmethod
+    def __find_line(
+    ) -> Optional[int]:
+        frame = sys._getframe(3)
+
+        for _ in range(AllocationProfiler.MAX_FRAMES):
+            if frame == None:
+                return None
+
+            local_variables = frame.f_locals
+
+            for name in ('expr', 'stmt'):
+                node = local_variables.get(name)
+
+                if isinstance(node, (Expr.Expr, Stmt.Stmt)):
+                    line = AllocationProfiler.__node_line(node)
+
+                    if line != None:
+                        return line
+
+            frame = frame.f_back
+
+        return None
+
+
+    @staticmethod
+    def __kind_of(
+        obj: Any,
+        kind: str,
+    ) -> str:
+        if kind == 'function' and getattr(obj, '_VeloxFunction__this', None) != None:
+            return 'bound method'
+
+        return kind
+
+
+    @staticmethod
+    def __node_line(
+        node: Any,
+    ) -> Optional[int]:
+        children = []
+
+        for name in type(node).fields:
+            value = getattr(node, name)
+
+            if isinstance(value, Token):
+                return value.line
+
+            if isinstance(value, (Expr.Expr, Stmt.Stmt)):
+                children.append(value)
+
+        for child in children:
+            line = AllocationProfiler.__node_line(child)
+
+            if line != None:
+                return line
+
+        return None
+
+
+    def __record_sample(
+        self,
+        obj: Any,
+        kind: str,
+    ) -> None:
+        site = (AllocationProfiler.__find_line(), kind)
+
+        self.__sites[site] += 1
+        self.__samples.append((weakref.ref(obj), site))
+
+        if len(self.__samples) > 1 << 16:
+            self.__count_live_sites()
+
+
+    def __report_periodically(
+        self,
+        stopped: threading.Event,
+        interval: float,
+        output: TextIO,
+    ) -> None:
+        while not stopped.wait(interval):
+            self.report(output)
+
+
+    def __wrap(
+        self,
+        init: Callable[..., None],
+        kind: str,
+    ) -> Callable[..., None]:
+        lock = self.__lock
+        classes = self.__classes
+        record_sample = self.__record_sample
+        count = self.__totals.setdefault(kind, [0])
+        bound_count = self.__totals.setdefault('bound method', [0])
+        sample_interval = self.__sample_interval
+        countdown = sample_interval
+        is_function = kind == 'function'
+        is_instance = kind == 'instance'
+
+        def profiled_init(
+            obj: Any,
+            *args: Any,
+            **kwargs: Any,
+        ) -> None:
+            nonlocal countdown
+
+            init(obj, *args, **kwargs)
+
+            if is_function and obj.is_bound():
+                obj_kind = 'bound method'
+                bound_count[0] += 1
+            else:
+                obj_kind = kind
+                count[0] += 1
+
+            if is_instance:
+                with lock:
+                    classes[obj.klass.name] += 1
+
+            countdown -= 1
+
+            if countdown == 0:
+                countdown = sample_interval
+
+                with lock:
+                    record_sample(obj, obj_kind)
+
+        return profiled_init
@@ -0,0 +1,158 @@
+import asyncio
+import sys
+import threading
+import time
+from typing import Awaitable, Callable
+
+from output_sink import OutputSink
+from velox import Velox
+from velox_token import Token
+
+
+class ExecutionCancelled(Exception):
+    pass
+
+
+class AsyncOutput(OutputSink):
+    # Public methods
+
+    def flush(
+        self,
+    ) -> None:
+        pass
+
+
+class AsyncRunner:
+    CLOCK_INTERVAL = 64
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        steps_per_slice: int = 1000,
+        time_slice: float = None,
+        print_sink: Callable[[str], Awaitable[None]] = None,
+        lazy_functions: bool = False,
+    ) -> None:
+        self.__steps_per_slice = steps_per_slice
+        self.__time_slice = time_slice
+        self.__print_sink = print_sink
+        self.__lazy_functions = lazy_functions
+
+        self.__slice_lock = asyncio.Lock()
+
+
+    # Public methods
+
+    async def run(
+        self,
+        source: str,
+    ) -> int:
+        loop = asyncio.get_running_loop()
+
+        output = AsyncOutput()
+        resume = threading.Event()
+        cancelled = False
+        steps = 0
+        interval = min(self.__steps_per_slice, AsyncRunner.CLOCK_INTERVAL)
+        slice_start = time.perf_counter()
+
+        paused = loop.create_future()
+        done = loop.create_future()
+
+        def release(
+            future: asyncio.Future,
+        ) -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def checkpoint(
+            token: Token,
+        ) -> int:
+            nonlocal steps, interval, slice_start
+
+            steps += interval
+
+            if steps < self.__steps_per_slice and (
+                self.__time_slice == None
+                or time.perf_counter() - slice_start < self.__time_slice
+            ):
+                interval = min(self.__steps_per_slice - steps, AsyncRunner.CLOCK_INTERVAL)
+
+                return interval
+
+            if cancelled:
+                raise ExecutionCancelled()
+
+            loop.call_soon_threadsafe(release, paused)
+
+            resume.wait()
+            resume.clear()
+
+            if cancelled:
+                raise ExecutionCancelled()
+
+            steps = 0
+            interval = min(self.__steps_per_slice, AsyncRunner.CLOCK_INTERVAL)
+
+            return interval
+
+        def execute() -> None:
+            velox = Velox(self.__lazy_functions, output)
+            velox.interpreter.checkpoint = checkpoint
+            velox.interpreter.countdown = interval
+
+            try:
+                result = velox.execute_source(source)
+            except ExecutionCancelled:
+                result = None
+            except BaseException as error:
+                loop.call_soon_threadsafe(done.set_exception, error)
+                return
+
+            loop.call_soon_threadsafe(done.set_result, result)
+
+        thread = threading.Thread(target=execute, daemon=True)
+
+        try:
+            async with self.__slice_lock:
+                thread.start()
+
+                await asyncio.wait((paused, done), return_when=asyncio.FIRST_COMPLETED)
+
+            while True:
+                await self.__emit(output.drain())
+
+                if done.done():
+                    return done.result()
+
+                async with self.__slice_lock:
+                    paused = loop.create_future()
+                    slice_start = time.perf_counter()
+                    resume.set()
+
+                    await asyncio.wait((paused, done), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            cancelled = True
+
+            if thread.is_alive():
+                resume.set()
+
+                await asyncio.wait((done,))
+
+            raise
+
+
+    # Private methods
+
+    async def __emit(
+        self,
+        text: str,
+    ) -> None:
+        if text == '':
+            return
+
+        if self.__print_sink == None:
+            sys.stdout.write(text)
+        else:
+            await self.__print_sink(text)
@@ -0,0 +1,112 @@
+from concurrent.futures import ProcessPoolExecutor
+import io
+import time
+import traceback
+
+from execution_limits import ExecutionLimits
+
+
+class BatchResult:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        path: str,
+        exit_code: int,
+        output: str,
+        duration: float,
+    ) -> None:
+        self.path = path
+        self.exit_code = exit_code
+        self.output = output
+        self.duration = duration
+
+
+class BatchRunner:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        jobs: int,
+        lazy_functions: bool = False,
+        limits: ExecutionLimits = None,
+    ) -> None:
+        self.__jobs = jobs
+        self.__lazy_functions = lazy_functions
+        self.__limits = limits
+
+
+    # Public methods
+
+    def run(
+        self,
+        paths: list[str],
+    ) -> list[BatchResult]:
+        chunk_size = max(1, len(paths) // (self.__jobs * 4))
+
+        with ProcessPoolExecutor(self.__jobs) as executor:
+            return list(
+                executor.map(
+                    BatchRunner.run_script,
+                    paths,
+                    [self.__lazy_functions] * len(paths),
+                    [self.__limits] * len(paths),
+                    chunksize=chunk_size,
+                ),
+            )
+
+
+    def run_and_report(
+        self,
+        paths: list[str],
+    ) -> int:
+        start = time.perf_counter()
+
+        results = self.run(paths)
+
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            print(f'==> {result.path} <==')
+            print(result.output, end='')
+
+        print('==> summary <==')
+
+        for result in results:
+            print(f'{result.exit_code:>3} {result.duration * 1000:>10.1f}ms  {result.path}')
+
+        failed = sum(1 for result in results if result.exit_code != 0)
+        total = sum(result.duration for result in results)
+
+        print(
+            f'{len(results)} scripts, {failed} failed, '
+            f'{total * 1000:.1f}ms total, {elapsed * 1000:.1f}ms wall',
+        )
+
+        return max((result.exit_code for result in results), default=0)
+
+
+    @staticmethod
+    def run_script(
+        path: str,
+        lazy_functions: bool,
+        limits: ExecutionLimits = None,
+    ) -> BatchResult:
+        from velox import Velox
+
+        output = io.StringIO()
+        start = time.perf_counter()
+
+        try:
+            velox = Velox(lazy_functions, output)
+
+            if limits != None:
+                limits.apply(velox.interpreter)
+
+            exit_code = velox.execute_file(path)
+        except Exception:
+            traceback.print_exc(file=output)
+
+            exit_code = 70
+
+        return BatchResult(path, exit_code, output.getvalue(), time.perf_counter() - start)
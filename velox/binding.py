@@ -0,0 +1,13 @@
+class Binding:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+        defined: bool = False,
+    ) -> None:
+        self.name = name
+        self.defined = defined
+        self.captured = False
+        self.reads = 0
+        self.writes = 0
@@ -1,3 +1,4 @@
 from .clock import Clock
+from .native_function import NativeFunction
 from .velox_class import VeloxClass
 from .velox_function import VeloxFunction
@@ -0,0 +1,77 @@
+from typing import Any, Callable, ForwardRef
+
+from native_error import NativeError
+from velox_array import VeloxArray
+from velox_callable import VeloxCallable
+from velox_iterator import VeloxIterator
+from velox_map import VeloxMap
+from velox_rope import VeloxRope
+from velox_vector import VeloxVector
+
+
+class NativeFunction(VeloxCallable):
+    TYPE_NAMES = {
+        VeloxArray: 'an array',
+        VeloxIterator: 'an iterator',
+        VeloxMap: 'a map',
+        VeloxVector: 'a vector',
+        bool: 'a boolean',
+        float: 'a number',
+        str: 'a string',
+    }
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+        params: tuple[type, ...],
+        function: Callable[..., Any],
+    ) -> None:
+        self.name = name
+        self.__params = params
+        self.__arity = len(params)
+        self.__function = function
+
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[[str, str], Any], tuple[str, str]]:
+        from natives import NativeRegistry
+
+        return (NativeRegistry.member, tuple(self.name.split('.', 1)))
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return '<native fn>'
+
+
+    # Public methods
+
+    def arity(
+        self,
+    ) -> int:
+        return self.__arity
+
+
+    def call(
+        self,
+        interpreter: ForwardRef('Interpreter'),
+        arguments: list[Any],
+    ) -> Any:
+        for index, param in enumerate(self.__params):
+            argument = arguments[index]
+
+            if param == str and isinstance(argument, VeloxRope):
+                arguments[index] = str(argument)
+            elif param != object and not isinstance(argument, param):
+                type_name = self.TYPE_NAMES.get(param, param.__name__)
+
+                raise NativeError(
+                    f'Argument {index + 1} of \'{self.name}\' must be {type_name}.',
+                )
+
+        return self.__function(*arguments)
@@ -17,6 +17,8 @@ class VeloxClass(VeloxCallable):
         self.name = name
         self.__superclass = superclass
         self.__methods = methods
+        self.__initializer = self.find_method('init')
+        self.__arity = self.__initializer.arity() if self.__initializer != None else 0
 
 
     def __str__(
@@ -30,12 +32,7 @@ class VeloxClass(VeloxCallable):
     def arity(
         self,
     ) -> int:
-        initializer = self.find_method('init')
-
-        if initializer == None:
-            return 0
-
-        return initializer.arity()
+        return self.__arity
 
 
 
@@ -46,10 +43,10 @@ class VeloxClass(VeloxCallable):
     ): # TODO
         instance = VeloxInstance(self)
 
-        initializer = self.find_method('init')
+        initializer = self.__initializer
 
         if initializer != None:
-            initializer.bind(instance).call(interpreter, arguments)
+            initializer.invoke(interpreter, instance, arguments)
 
         return instance
 
@@ -58,8 +55,10 @@ class VeloxClass(VeloxCallable):
         self,
         name: str,
     ) -> VeloxFunction:
-        if name in self.__methods:
-            return self.__methods[name]
+        method = self.__methods.get(name)
+
+        if method != None:
+            return method
 
         if self.__superclass != None:
             return self.__superclass.find_method(name)
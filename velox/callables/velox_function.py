@@ -3,6 +3,8 @@ from typing import Any, ForwardRef
 from environment import Environment
 import stmt as Stmt
 from velox_callable import VeloxCallable
+from velox_generator import VeloxGenerator
+from velox_parser import LazyBody
 from velox_return import VeloxReturn
 
 
@@ -13,11 +15,16 @@ class VeloxFunction(VeloxCallable):
         self,
         declaration: Stmt.StmtFunction,
         closure: Environment,
-        is_initializer: bool
+        is_initializer: bool,
+        module: ForwardRef('VeloxModule') = None,
+        this: ForwardRef('VeloxInstance') = None,
     ) -> None:
         self.__declaration = declaration
         self.__closure = closure
         self.__is_initializer = is_initializer
+        self.__module = module
+        self.__this = this
+        self.__arity = len(declaration.params)
 
 
     def __str__(
@@ -31,41 +38,133 @@ class VeloxFunction(VeloxCallable):
     def arity(
         self,
     ) -> int:
-        return len(self.__declaration.params)
+        return self.__arity
 
 
     def bind(
         self,
         instance: ForwardRef('VeloxInstance'),
     ) -> ForwardRef('VeloxFunction'):
-        environment = Environment(self.__closure)
-
-        environment.define('this', instance)
-
         return VeloxFunction(
             self.__declaration,
-            environment,
+            self.__closure,
             self.__is_initializer,
+            self.__module,
+            instance,
         )
 
 
+    def is_bound(
+        self,
+    ) -> bool:
+        return self.__this is not None
+
+
     def call(
         self,
         interpreter: ForwardRef('Interpreter'),
         arguments: list[Any],
     ) -> Any:
-        environment = Environment(self.__closure)
+        if interpreter.module is self.__module:
+            return self.__invoke(interpreter, self.__this, arguments)
+
+        previous = interpreter.switch_module(self.__module)
+
+        try:
+            return self.__invoke(interpreter, self.__this, arguments)
+        finally:
+            interpreter.switch_module(previous)
+
+
+    def invoke(
+        self,
+        interpreter: ForwardRef('Interpreter'),
+        this: ForwardRef('VeloxInstance'),
+        arguments: list[Any],
+    ) -> Any:
+        if interpreter.module is self.__module:
+            return self.__invoke(interpreter, this, arguments)
+
+        previous = interpreter.switch_module(self.__module)
+
+        try:
+            return self.__invoke(interpreter, this, arguments)
+        finally:
+            interpreter.switch_module(previous)
+
+
+    # Private methods
+
+    def __invoke(
+        self,
+        interpreter: ForwardRef('Interpreter'),
+        this: ForwardRef('VeloxInstance'),
+        arguments: list[Any],
+    ) -> Any:
+        declaration = self.__declaration
+        body = declaration.body
+
+        if isinstance(body, LazyBody):
+            body = declaration.body = body.parse(interpreter.reporter)
+
+        arity = self.__arity
+        names = declaration.names
+
+        if arity == 0:
+            values = {}
+        elif arity == 1:
+            values = {names[0]: arguments[0]}
+        elif arity == 2:
+            values = {names[0]: arguments[0], names[1]: arguments[1]}
+        elif arity == 3:
+            values = {names[0]: arguments[0], names[1]: arguments[1], names[2]: arguments[2]}
+        else:
+            values = dict(zip(names, arguments))
+
+        if this is not None:
+            values['this'] = this
+
+        environment = Environment(self.__closure, values)
+
+        if declaration.is_generator:
+            return VeloxGenerator(
+                declaration.name.lexeme,
+                interpreter,
+                environment,
+                body,
+            )
+
+        compiled = declaration.compiled
+
+        if compiled is None:
+            declaration.heat += 1
+
+            hot_threshold = interpreter.hot_threshold
+
+            if hot_threshold is not None and declaration.heat >= hot_threshold:
+                compiled = interpreter.compile_function(declaration, body)
+
+        if compiled is not None:
+            value = compiled(interpreter, environment)
+
+            if self.__is_initializer:
+                return this
+
+            return value
 
-        for param, argument in zip(self.__declaration.params, arguments):
-            environment.define(param.lexeme, argument)
+        previous = interpreter.environment
+        interpreter.environment = environment
 
         try:
-            interpreter.execute_block(self.__declaration.body, environment)
+            for statement in body:
+                statement.accept(interpreter)
         except VeloxReturn as return_value:
             if self.__is_initializer:
-                return self.__closure.get_at(0, 'this')
+                return this
 
             return return_value.value
+        finally:
+            interpreter.environment = previous
 
         if self.__is_initializer:
-            return self.__closure.get_at(0, 'this')
+            return this
@@ -0,0 +1,969 @@
+from typing import Any, Callable, ForwardRef, Optional
+
+from callables import VeloxFunction
+from environment import Environment
+from execution_limit_error import ExecutionLimitError
+import expr as Expr
+from native_error import NativeError
+from natives import NativeModule
+from runtime_error import RuntimeError
+import stmt as Stmt
+from token_type import TokenType
+from type_inference import TypeInference
+from velox_callable import VeloxCallable
+from velox_instance import VeloxInstance
+from velox_module import VeloxModule
+from velox_rope import VeloxRope
+from velox_token import Token
+
+
+class ClosureCompiler(Expr.Visitor[Callable], Stmt.Visitor[Callable]):
+    RETURN_NIL = (None,)
+
+
+    # Public methods
+
+    def compile_function(
+        self,
+        body: list[Stmt.Stmt],
+    ) -> Callable[[ForwardRef('Interpreter'), Environment], Any]:
+        run_body = self.__sequence(body)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+            environment: Environment,
+        ) -> Any:
+            previous = interpreter.environment
+            interpreter.environment = environment
+
+            try:
+                result = run_body(interpreter)
+            finally:
+                interpreter.environment = previous
+
+            if result is not None:
+                return result[0]
+
+            return None
+
+        return run
+
+
+    def compile_statement(
+        self,
+        stmt: Stmt.Stmt,
+    ) -> Callable[[ForwardRef('Interpreter')], Optional[tuple]]:
+        return self.__statement(stmt)
+
+
+    def visit_ExprAssign(
+        self,
+        expr: Expr.ExprAssign,
+    ) -> Callable:
+        value = self.__expression(expr.value)
+        name = expr.name
+        distance = expr.depth
+
+        if distance is None:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Any:
+                result = value(interpreter)
+
+                interpreter.globals.assign(name, result)
+
+                return result
+
+            return run
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            result = value(interpreter)
+
+            interpreter.environment.assign_at(distance, name, result)
+
+            return result
+
+        return run
+
+
+    def visit_ExprBinary(
+        self,
+        expr: Expr.ExprBinary,
+    ) -> Callable:
+        left = self.__expression(expr.left)
+        right = self.__expression(expr.right)
+        operator = expr.operator
+        operator_type = operator.type
+
+        if expr.numeric is not None:
+            return ClosureCompiler.__numeric(operator_type, left, right)
+
+        if operator_type == TokenType.PLUS:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Any:
+                a = left(interpreter)
+                b = right(interpreter)
+
+                if isinstance(a, float) and isinstance(b, float):
+                    return a + b
+
+                if isinstance(a, (str, VeloxRope)) and isinstance(b, (str, VeloxRope)):
+                    return VeloxRope.concat(a, b)
+
+                raise RuntimeError(operator, 'Operands must be two numbers or two strings.')
+
+            return run
+
+        if operator_type == TokenType.EQUAL_EQUAL:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) == right(interpreter)
+
+            return run
+
+        if operator_type == TokenType.BANG_EQUAL:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return not left(interpreter) == right(interpreter)
+
+            return run
+
+        function = TypeInference.ARITHMETIC.get(operator_type) or TypeInference.COMPARISON[operator_type]
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            a = left(interpreter)
+            b = right(interpreter)
+
+            if isinstance(a, float) and isinstance(b, float):
+                return function(a, b)
+
+            raise RuntimeError(operator, 'Operands must be numbers.')
+
+        return run
+
+
+    def visit_ExprCall(
+        self,
+        expr: Expr.ExprCall,
+    ) -> Callable:
+        callee = self.__expression(expr.callee)
+        call = self.__call(expr.paren, expr.arguments)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            return call(interpreter, callee(interpreter), None)
+
+        return run
+
+
+    def visit_ExprGet(
+        self,
+        expr: Expr.ExprGet,
+    ) -> Callable:
+        object = self.__expression(expr.object)
+        name = expr.name
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            value = object(interpreter)
+
+            if isinstance(value, (VeloxInstance, NativeModule, VeloxModule)):
+                return value.get(name)
+
+            raise RuntimeError(name, 'Only instances have properties.')
+
+        return run
+
+
+    def visit_ExprGrouping(
+        self,
+        expr: Expr.ExprGrouping,
+    ) -> Callable:
+        return self.__expression(expr.expression)
+
+
+    def visit_ExprInvoke(
+        self,
+        expr: Expr.ExprInvoke,
+    ) -> Callable:
+        object = self.__expression(expr.object)
+        call = self.__call(expr.paren, expr.arguments)
+        name = expr.name
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            value = object(interpreter)
+
+            if isinstance(value, VeloxInstance):
+                method = value.method(name)
+
+                if method is not None:
+                    return call(interpreter, method, value)
+
+                return call(interpreter, value.get(name), None)
+
+            if isinstance(value, (NativeModule, VeloxModule)):
+                return call(interpreter, value.get(name), None)
+
+            raise RuntimeError(name, 'Only instances have properties.')
+
+        return run
+
+
+    def visit_ExprLiteral(
+        self,
+        expr: Expr.ExprLiteral,
+    ) -> Callable:
+        value = expr.value
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            return value
+
+        return run
+
+
+    def visit_ExprLogical(
+        self,
+        expr: Expr.ExprLogical,
+    ) -> Callable:
+        left = self.__expression(expr.left)
+        right = self.__expression(expr.right)
+
+        if expr.operator.type == TokenType.OR:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Any:
+                value = left(interpreter)
+
+                if value is not None and value is not False:
+                    return value
+
+                return right(interpreter)
+
+            return run
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            value = left(interpreter)
+
+            if value is None or value is False:
+                return value
+
+            return right(interpreter)
+
+        return run
+
+
+    def visit_ExprSet(
+        self,
+        expr: Expr.ExprSet,
+    ) -> Callable:
+        object = self.__expression(expr.object)
+        value = self.__expression(expr.value)
+        name = expr.name
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            instance = object(interpreter)
+
+            if not isinstance(instance, VeloxInstance):
+                raise RuntimeError(name, 'Only instances have fields.')
+
+            result = value(interpreter)
+
+            instance.set(name, result)
+
+            return result
+
+        return run
+
+
+    def visit_ExprSuper(
+        self,
+        expr: Expr.ExprSuper,
+    ) -> Callable:
+        distance = expr.depth
+        method_name = expr.method
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            superclass = interpreter.environment.get_at(distance, 'super')
+
+            instance = interpreter.environment.get_at(distance - 1, 'this')
+
+            method = superclass.find_method(method_name.lexeme)
+
+            if method == None:
+                raise RuntimeError(method_name, f'Undefined property \'{method_name.lexeme}\'.')
+
+            return method.bind(instance)
+
+        return run
+
+
+    def visit_ExprThis(
+        self,
+        expr: Expr.ExprThis,
+    ) -> Callable:
+        return ClosureCompiler.__look_up(expr.keyword, expr.depth)
+
+
+    def visit_ExprUnary(
+        self,
+        expr: Expr.ExprUnary,
+    ) -> Callable:
+        right = self.__expression(expr.right)
+        operator = expr.operator
+
+        if operator.type == TokenType.BANG:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                value = right(interpreter)
+
+                return value is None or value is False
+
+            return run
+
+        if expr.numeric:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> float:
+                return -right(interpreter)
+
+            return run
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> float:
+            value = right(interpreter)
+
+            if not isinstance(value, float):
+                raise RuntimeError(operator, 'Operand must be a number.')
+
+            return -value
+
+        return run
+
+
+    def visit_ExprVariable(
+        self,
+        expr: Expr.ExprVariable,
+    ) -> Callable:
+        return ClosureCompiler.__look_up(expr.name, expr.depth)
+
+
+    def visit_StmtBlock(
+        self,
+        stmt: Stmt.StmtBlock,
+    ) -> Callable:
+        body = self.__sequence(stmt.statements)
+
+        if stmt.flat:
+            return body
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            previous = interpreter.environment
+            interpreter.environment = Environment(previous)
+
+            try:
+                return body(interpreter)
+            finally:
+                interpreter.environment = previous
+
+        return run
+
+
+    def visit_StmtExpression(
+        self,
+        stmt: Stmt.StmtExpression,
+    ) -> Callable:
+        expression = self.__expression(stmt.expression)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> None:
+            expression(interpreter)
+
+        return run
+
+
+    def visit_StmtFor(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> Callable:
+        if stmt.compiled is not None:
+            return stmt.compiled
+
+        resume = stmt.resume = self.__for_loop(stmt)
+
+        if stmt.initializer == None:
+            run = resume
+        elif isinstance(stmt.initializer, Stmt.StmtVar):
+            initializer = self.__statement(stmt.initializer)
+
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Optional[tuple]:
+                previous = interpreter.environment
+                interpreter.environment = Environment(previous)
+
+                try:
+                    initializer(interpreter)
+
+                    return resume(interpreter)
+                finally:
+                    interpreter.environment = previous
+        else:
+            initializer = self.__statement(stmt.initializer)
+
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Optional[tuple]:
+                initializer(interpreter)
+
+                return resume(interpreter)
+
+        stmt.compiled = run
+
+        return run
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: Stmt.StmtForIn,
+    ) -> Callable:
+        iterable = self.__expression(stmt.iterable)
+        body = self.__statement(stmt.body)
+        name = stmt.name
+        reusable = stmt.reusable
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            iterator = interpreter.iterate(name, iterable(interpreter))
+
+            previous = interpreter.environment
+            environment = Environment(previous)
+
+            try:
+                for value in iterator:
+                    if not reusable:
+                        environment = Environment(previous)
+
+                    environment.define(name.lexeme, value)
+
+                    interpreter.environment = environment
+
+                    result = body(interpreter)
+
+                    if result is not None:
+                        return result
+
+                    if interpreter.checkpoint is not None:
+                        interpreter.countdown -= 1
+
+                        if interpreter.countdown <= 0:
+                            interpreter.countdown = interpreter.checkpoint(name)
+            finally:
+                interpreter.environment = previous
+
+            return None
+
+        return run
+
+
+    def visit_StmtFunction(
+        self,
+        stmt: Stmt.StmtFunction,
+    ) -> Callable:
+        name = stmt.name.lexeme
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> None:
+            environment = interpreter.environment
+
+            environment.define(name, VeloxFunction(stmt, environment, False, interpreter.module))
+
+        return run
+
+
+    def visit_StmtIf(
+        self,
+        stmt: Stmt.StmtIf,
+    ) -> Callable:
+        condition = self.__expression(stmt.condition)
+        then_branch = self.__statement(stmt.then_branch)
+
+        if stmt.else_branch == None:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Optional[tuple]:
+                value = condition(interpreter)
+
+                if value is not None and value is not False:
+                    return then_branch(interpreter)
+
+                return None
+
+            return run
+
+        else_branch = self.__statement(stmt.else_branch)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            value = condition(interpreter)
+
+            if value is not None and value is not False:
+                return then_branch(interpreter)
+
+            return else_branch(interpreter)
+
+        return run
+
+
+    def visit_StmtPrint(
+        self,
+        stmt: Stmt.StmtPrint,
+    ) -> Callable:
+        expression = self.__expression(stmt.expression)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> None:
+            interpreter.output.write_line(interpreter.stringify(expression(interpreter)))
+
+        return run
+
+
+    def visit_StmtReturn(
+        self,
+        stmt: Stmt.StmtReturn,
+    ) -> Callable:
+        if stmt.value == None:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> tuple:
+                return ClosureCompiler.RETURN_NIL
+
+            return run
+
+        value = self.__expression(stmt.value)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> tuple:
+            return (value(interpreter),)
+
+        return run
+
+
+    def visit_StmtVar(
+        self,
+        stmt: Stmt.StmtVar,
+    ) -> Callable:
+        name = stmt.name.lexeme
+
+        if stmt.initializer == None:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> None:
+                interpreter.environment.define(name, None)
+
+            return run
+
+        initializer = self.__expression(stmt.initializer)
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> None:
+            interpreter.environment.define(name, initializer(interpreter))
+
+        return run
+
+
+    def visit_StmtWhile(
+        self,
+        stmt: Stmt.StmtWhile,
+    ) -> Callable:
+        if stmt.compiled is not None:
+            return stmt.compiled
+
+        condition = self.__expression(stmt.condition)
+        keyword = stmt.keyword
+
+        if isinstance(stmt.body, Stmt.StmtBlock) and stmt.body.reusable:
+            body = self.__sequence(stmt.body.statements)
+
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Optional[tuple]:
+                previous = interpreter.environment
+                environment = Environment(previous)
+
+                try:
+                    while True:
+                        value = condition(interpreter)
+
+                        if value is None or value is False:
+                            return None
+
+                        interpreter.environment = environment
+
+                        result = body(interpreter)
+
+                        if result is not None:
+                            return result
+
+                        interpreter.environment = previous
+
+                        if interpreter.checkpoint is not None:
+                            interpreter.countdown -= 1
+
+                            if interpreter.countdown <= 0:
+                                interpreter.countdown = interpreter.checkpoint(keyword)
+                finally:
+                    interpreter.environment = previous
+        else:
+            body = self.__statement(stmt.body)
+
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Optional[tuple]:
+                while True:
+                    value = condition(interpreter)
+
+                    if value is None or value is False:
+                        return None
+
+                    result = body(interpreter)
+
+                    if result is not None:
+                        return result
+
+                    if interpreter.checkpoint is not None:
+                        interpreter.countdown -= 1
+
+                        if interpreter.countdown <= 0:
+                            interpreter.countdown = interpreter.checkpoint(keyword)
+
+        stmt.compiled = run
+
+        return run
+
+
+    # Private methods
+
+    def __call(
+        self,
+        paren: Token,
+        arguments: list[Expr.Expr],
+    ) -> Callable[[ForwardRef('Interpreter'), Any, VeloxInstance], Any]:
+        arguments = [self.__expression(argument) for argument in arguments]
+        count = len(arguments)
+        first, second, third = (arguments + [None] * 3)[:3]
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+            function: Any,
+            this: VeloxInstance,
+        ) -> Any:
+            if count == 0:
+                values = []
+            elif count == 1:
+                values = [first(interpreter)]
+            elif count == 2:
+                values = [first(interpreter), second(interpreter)]
+            elif count == 3:
+                values = [first(interpreter), second(interpreter), third(interpreter)]
+            else:
+                values = [argument(interpreter) for argument in arguments]
+
+            if not isinstance(function, VeloxCallable):
+                raise RuntimeError(paren, 'Can only call functions and classes.')
+
+            if count != function.arity():
+                raise RuntimeError(paren, f'Expected {function.arity()} arguments but got {count}.')
+
+            if interpreter.checkpoint is not None:
+                interpreter.countdown -= 1
+
+                if interpreter.countdown <= 0:
+                    interpreter.countdown = interpreter.checkpoint(paren)
+
+            interpreter.call_depth += 1
+
+            try:
+                if interpreter.max_call_depth is not None and interpreter.call_depth > interpreter.max_call_depth:
+                    raise ExecutionLimitError(paren, 'Maximum call depth exceeded.')
+
+                if this is not None:
+                    return function.invoke(interpreter, this, values)
+
+                return function.call(interpreter, values)
+            except NativeError as error:
+                raise RuntimeError(paren, error.message)
+            except RecursionError:
+                raise RuntimeError(paren, 'Stack overflow.')
+            finally:
+                interpreter.call_depth -= 1
+
+        return run
+
+
+    def __expression(
+        self,
+        expr: Expr.Expr,
+    ) -> Callable[[ForwardRef('Interpreter')], Any]:
+        compiled = expr.accept(self)
+
+        if compiled != None:
+            return compiled
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            return interpreter.evaluate(expr)
+
+        return run
+
+
+    def __for_loop(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> Callable[[ForwardRef('Interpreter')], Optional[tuple]]:
+        condition = self.__expression(stmt.condition)
+        increment = self.__expression(stmt.increment) if stmt.increment != None else None
+        keyword = stmt.keyword
+        counted = stmt.counted
+
+        if isinstance(stmt.body, Stmt.StmtBlock) and stmt.body.reusable:
+            body = self.__sequence(stmt.body.statements)
+            reusable = True
+        else:
+            body = self.__statement(stmt.body)
+            reusable = False
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            previous = interpreter.environment
+            environment = Environment(previous) if reusable else previous
+
+            try:
+                while True:
+                    value = condition(interpreter)
+
+                    if value is None or value is False:
+                        return None
+
+                    interpreter.environment = environment
+
+                    result = body(interpreter)
+
+                    if result is not None:
+                        return result
+
+                    interpreter.environment = previous
+
+                    if increment is not None:
+                        increment(interpreter)
+
+                    if interpreter.checkpoint is not None:
+                        interpreter.countdown -= 1
+
+                        if interpreter.countdown <= 0:
+                            interpreter.countdown = interpreter.checkpoint(keyword)
+            finally:
+                interpreter.environment = previous
+
+        if counted == None:
+            return run
+
+        iterate = run
+        limit = self.__expression(counted.limit)
+        name = counted.counter.name
+        step = counted.step
+        read = counted.read
+        inclusive = counted.inclusive
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            previous = interpreter.environment
+            value = previous.get_at(0, name)
+            stop = limit(interpreter)
+
+            if type(value) is not float or type(stop) is not float or not counted.applies():
+                return iterate(interpreter)
+
+            environment = Environment(previous) if reusable else previous
+
+            try:
+                while value <= stop if inclusive else value < stop:
+                    if read:
+                        previous.define(name, value)
+
+                    interpreter.environment = environment
+
+                    result = body(interpreter)
+
+                    if result is not None:
+                        return result
+
+                    interpreter.environment = previous
+                    value += step
+
+                    if interpreter.checkpoint is not None:
+                        interpreter.countdown -= 1
+
+                        if interpreter.countdown <= 0:
+                            interpreter.countdown = interpreter.checkpoint(keyword)
+
+                return None
+            finally:
+                interpreter.environment = previous
+
+        return run
+
+
+    @staticmethod
+    def __look_up(
+        name: ForwardRef('Token'),
+        distance: Optional[int],
+    ) -> Callable[[ForwardRef('Interpreter')], Any]:
+        if distance is None:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> Any:
+                return interpreter.globals.get(name)
+
+            return run
+
+        lexeme = name.lexeme
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Any:
+            return interpreter.environment.get_at(distance, lexeme)
+
+        return run
+
+
+    @staticmethod
+    def __numeric(
+        operator_type: TokenType,
+        left: Callable[[ForwardRef('Interpreter')], Any],
+        right: Callable[[ForwardRef('Interpreter')], Any],
+    ) -> Callable[[ForwardRef('Interpreter')], Any]:
+        if operator_type == TokenType.PLUS:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> float:
+                return left(interpreter) + right(interpreter)
+        elif operator_type == TokenType.MINUS:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> float:
+                return left(interpreter) - right(interpreter)
+        elif operator_type == TokenType.STAR:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> float:
+                return left(interpreter) * right(interpreter)
+        elif operator_type == TokenType.SLASH:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> float:
+                return left(interpreter) / right(interpreter)
+        elif operator_type == TokenType.LESS:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) < right(interpreter)
+        elif operator_type == TokenType.LESS_EQUAL:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) <= right(interpreter)
+        elif operator_type == TokenType.GREATER:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) > right(interpreter)
+        elif operator_type == TokenType.GREATER_EQUAL:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) >= right(interpreter)
+        elif operator_type == TokenType.EQUAL_EQUAL:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) == right(interpreter)
+        else:
+            def run(
+                interpreter: ForwardRef('Interpreter'),
+            ) -> bool:
+                return left(interpreter) != right(interpreter)
+
+        return run
+
+
+    def __sequence(
+        self,
+        statements: list[Stmt.Stmt],
+    ) -> Callable[[ForwardRef('Interpreter')], Optional[tuple]]:
+        compiled = [self.__statement(statement) for statement in statements]
+
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> Optional[tuple]:
+            for statement in compiled:
+                result = statement(interpreter)
+
+                if result is not None:
+                    return result
+
+            return None
+
+        return run
+
+
+    def __statement(
+        self,
+        stmt: Stmt.Stmt,
+    ) -> Callable[[ForwardRef('Interpreter')], Optional[tuple]]:
+        compiled = stmt.accept(self)
+
+        if compiled != None:
+            return compiled
+
+        def run(
+            interpreter: ForwardRef('Interpreter'),
+        ) -> None:
+            interpreter.execute(stmt)
+
+        return run
@@ -0,0 +1,94 @@
+from typing import ForwardRef, Optional
+
+from binding import Binding
+import expr as Expr
+from token_type import TokenType
+
+
+class CountedLoop:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        counter: Binding,
+        limit: Expr.Expr,
+        step: float,
+        inclusive: bool,
+    ) -> None:
+        self.counter = counter
+        self.limit = limit
+        self.step = step
+        self.inclusive = inclusive
+        self.read = True
+
+
+    # Public methods
+
+    def applies(
+        self,
+    ) -> bool:
+        if self.counter.captured:
+            return False
+
+        return not isinstance(self.limit, Expr.ExprVariable) or not self.limit.binding.captured
+
+
+    @staticmethod
+    def match(
+        stmt: ForwardRef('StmtFor'),
+    ) -> Optional['CountedLoop']:
+        counter = getattr(stmt.initializer, 'binding', None)
+
+        if counter == None or stmt.initializer.initializer == None:
+            return None
+
+        condition = stmt.condition
+
+        if (
+            not isinstance(condition, Expr.ExprBinary)
+            or condition.operator.type not in (TokenType.LESS, TokenType.LESS_EQUAL)
+            or not CountedLoop.__is_counter(condition.left, counter)
+        ):
+            return None
+
+        limit = condition.right
+
+        if isinstance(limit, Expr.ExprLiteral):
+            if type(limit.value) is not float:
+                return None
+        elif not isinstance(limit, Expr.ExprVariable) or limit.binding in (None, counter):
+            return None
+
+        increment = stmt.increment
+
+        if not isinstance(increment, Expr.ExprAssign) or increment.binding is not counter:
+            return None
+
+        step = increment.value
+
+        if (
+            not isinstance(step, Expr.ExprBinary)
+            or step.operator.type != TokenType.PLUS
+            or not CountedLoop.__is_counter(step.left, counter)
+            or not isinstance(step.right, Expr.ExprLiteral)
+            or type(step.right.value) is not float
+            or not step.right.value > 0
+        ):
+            return None
+
+        return CountedLoop(
+            counter,
+            limit,
+            step.right.value,
+            condition.operator.type == TokenType.LESS_EQUAL,
+        )
+
+
+    # Private methods
+
+    @staticmethod
+    def __is_counter(
+        expr: Expr.Expr,
+        counter: Binding,
+    ) -> bool:
+        return isinstance(expr, Expr.ExprVariable) and expr.binding is counter
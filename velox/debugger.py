@@ -0,0 +1,419 @@
+import functools
+import sys
+from typing import Any, Optional, TextIO
+
+import expr as Expr
+from interpreter import Interpreter
+from runtime_error import RuntimeError
+import stmt as Stmt
+from token_type import TokenType
+from velox_generator import GeneratorExecutor
+from velox_token import Token
+
+
+class Debugger:
+    PROMPT = '(vdb) '
+
+    CONTINUE = 'continue'
+    FINISH = 'finish'
+    NEXT = 'next'
+    STEP = 'step'
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        interpreter: Interpreter,
+        source: str,
+        input: TextIO = None,
+        output: TextIO = None,
+    ) -> None:
+        self.__interpreter = interpreter
+        self.__source = source.splitlines()
+        self.__input = input or sys.stdin
+        self.__output = output or sys.stdout
+
+        self.__builtins = set(name for name, value in Interpreter.create_globals().items())
+        self.__breakpoints = set()
+        self.__lines = {}
+        self.__line_numbers = {}
+        self.__statements = []
+        self.__trapped = set()
+
+        self.__mode = Debugger.CONTINUE
+        self.__depth = 0
+        self.__resumed = None
+        self.__stopped = False
+
+
+    # Public methods
+
+    def add_breakpoint(
+        self,
+        line: int,
+    ) -> bool:
+        if line not in self.__lines:
+            return False
+
+        self.__breakpoints.add(line)
+
+        for statement in self.__lines[line]:
+            self.__trap(statement)
+
+        return True
+
+
+    def remove_breakpoint(
+        self,
+        line: int,
+    ) -> bool:
+        if line not in self.__breakpoints:
+            return False
+
+        self.__breakpoints.discard(line)
+
+        if self.__mode == Debugger.CONTINUE:
+            for statement in self.__lines[line]:
+                self.__untrap(statement)
+
+        return True
+
+
+    def run(
+        self,
+        statements: list[Stmt.Stmt],
+        breakpoints: list[int] = (),
+    ) -> None:
+        self.__index(statements, None)
+
+        self.__interpreter.hot_threshold = None
+
+        for line in breakpoints:
+            if not self.add_breakpoint(line):
+                self.__write(f'No statement on line {line}.')
+
+        try:
+            if len(breakpoints) == 0:
+                self.__write('Type \'help\' for a list of commands.')
+                self.__pause(None)
+
+            if not self.__stopped:
+                self.__interpreter.interpret(statements)
+        except RuntimeError as error:
+            self.__interpreter.reporter.runtime_error(error)
+        finally:
+            for statement in list(self.__trapped):
+                self.__untrap(statement)
+
+
+    # Private methods
+
+    @staticmethod
+    def __children(
+        node: Any,
+    ) -> list[Any]:
+        return [getattr(node, name) for name in type(node).fields]
+
+
+    def __command(
+        self,
+        statement: Optional[Stmt.Stmt],
+        command: str,
+        argument: str,
+    ) -> bool:
+        if command in ('b', 'break'):
+            if not argument.isdigit() or not self.add_breakpoint(int(argument)):
+                self.__write(f'No statement on line {argument or "?"}.')
+            else:
+                self.__write(f'Breakpoint set on line {argument}.')
+
+        elif command in ('d', 'delete'):
+            if not argument.isdigit() or not self.remove_breakpoint(int(argument)):
+                self.__write(f'No breakpoint on line {argument or "?"}.')
+            else:
+                self.__write(f'Breakpoint removed from line {argument}.')
+
+        elif command in ('c', 'continue'):
+            self.__resume(Debugger.CONTINUE)
+            return False
+
+        elif command in ('s', 'step'):
+            self.__resume(Debugger.STEP)
+            return False
+
+        elif command in ('n', 'next'):
+            self.__resume(Debugger.NEXT)
+            return False
+
+        elif command in ('f', 'finish'):
+            self.__resume(Debugger.FINISH)
+            return False
+
+        elif command in ('e', 'env'):
+            self.__print_environments(argument == 'all')
+
+        elif command in ('p', 'print'):
+            self.__print_variable(statement, argument)
+
+        elif command in ('l', 'list'):
+            self.__print_source(self.__line_numbers.get(statement, 1))
+
+        elif command in ('q', 'quit'):
+            self.__resume(Debugger.CONTINUE)
+            self.__stopped = True
+
+            if statement != None:
+                raise RuntimeError(
+                    Token(TokenType.IDENTIFIER, 'quit', None, self.__line_numbers[statement]),
+                    'Execution stopped by the debugger.',
+                )
+
+            return False
+
+        elif command in ('h', 'help'):
+            self.__write('break LINE, delete LINE   set or remove a breakpoint')
+            self.__write('continue, step, next      resume, stop at the next statement or the next one in this call')
+            self.__write('finish                    resume until the current call returns')
+            self.__write('env [all], print NAME     show the environment chain or a single variable')
+            self.__write('list, quit                show the surrounding source or stop the program')
+
+        elif command != '':
+            self.__write(f'Unknown command \'{command}\'.')
+
+        return True
+
+
+    def __index(
+        self,
+        statements: list[Stmt.Stmt],
+        enclosing_line: Optional[int],
+    ) -> None:
+        for statement in statements:
+            if statement == None:
+                continue
+
+            line = Debugger.__line(statement)
+
+            self.__statements.append(statement)
+            self.__line_numbers[statement] = line
+
+            if isinstance(statement, Stmt.StmtBlock):
+                line = enclosing_line
+            elif line != None and line != enclosing_line:
+                self.__lines.setdefault(line, []).append(statement)
+
+            if isinstance(statement, Stmt.StmtFor) and statement.counted != None:
+                statement.counted.read = True
+
+            for value in Debugger.__children(statement):
+                if isinstance(value, Stmt.Stmt):
+                    self.__index([value], line)
+                elif isinstance(value, list) and any(isinstance(item, Stmt.Stmt) for item in value):
+                    self.__index(value, line)
+
+
+    @staticmethod
+    def __line(
+        node: Any,
+    ) -> Optional[int]:
+        lines = []
+
+        for value in Debugger.__children(node):
+            if isinstance(value, Token):
+                lines.append(value.line)
+            elif isinstance(value, (Expr.Expr, Stmt.Stmt)):
+                lines.append(Debugger.__line(value))
+            elif isinstance(value, list):
+                lines.extend(
+                    Debugger.__line(item)
+                    for item in value
+                    if isinstance(item, (Expr.Expr, Stmt.Stmt))
+                )
+
+        lines = [line for line in lines if line != None]
+
+        return min(lines) if len(lines) != 0 else None
+
+
+    def __pause(
+        self,
+        statement: Optional[Stmt.Stmt],
+    ) -> None:
+        self.__interpreter.output.flush()
+
+        if statement != None:
+            line = self.__line_numbers[statement]
+
+            self.__write(f'[line {line}] {self.__source_line(line).strip()}')
+
+        while True:
+            self.__output.write(Debugger.PROMPT)
+            self.__output.flush()
+
+            text = self.__input.readline()
+
+            if text == '':
+                self.__write('')
+                self.__breakpoints.clear()
+                self.__resume(Debugger.CONTINUE)
+                return
+
+            command, _, argument = text.strip().partition(' ')
+
+            if not self.__command(statement, command, argument.strip()):
+                return
+
+
+    def __print_environments(
+        self,
+        show_builtins: bool,
+    ) -> None:
+        environment = self.__interpreter.environment
+        level = 0
+
+        while environment != None:
+            if environment is self.__interpreter.globals:
+                self.__write(f'#{level} globals')
+            else:
+                self.__write(f'#{level}')
+
+            for name, value in environment.items():
+                if environment.enclosing == None and name in self.__builtins and not show_builtins:
+                    continue
+
+                self.__write(f'    {name} = {self.__interpreter.stringify(value)}')
+
+            environment = environment.enclosing
+            level += 1
+
+
+    def __print_source(
+        self,
+        line: int,
+    ) -> None:
+        for number in range(max(line - 5, 1), min(line + 5, len(self.__source)) + 1):
+            marker = '>' if number == line else ' '
+
+            self.__write(f'{marker} {number:4} {self.__source_line(number)}')
+
+
+    def __print_variable(
+        self,
+        statement: Optional[Stmt.Stmt],
+        name: str,
+    ) -> None:
+        token = Token(TokenType.IDENTIFIER, name, None, self.__line_numbers.get(statement, 0))
+
+        try:
+            value = self.__interpreter.environment.get(token)
+        except RuntimeError as error:
+            self.__write(error.message)
+            return
+
+        self.__write(f'{name} = {self.__interpreter.stringify(value)}')
+
+
+    def __resume(
+        self,
+        mode: str,
+    ) -> None:
+        self.__mode = mode
+        self.__depth = self.__interpreter.call_depth
+
+        if mode == Debugger.CONTINUE:
+            for statement in list(self.__trapped):
+                if self.__line_numbers[statement] not in self.__breakpoints:
+                    self.__untrap(statement)
+        else:
+            for statement in self.__statements:
+                self.__trap(statement)
+
+
+    def __should_pause(
+        self,
+        statement: Stmt.Stmt,
+    ) -> bool:
+        mode = self.__mode
+        depth = self.__interpreter.call_depth
+
+        if isinstance(statement, Stmt.StmtBlock):
+            mode = Debugger.CONTINUE
+
+        if mode == Debugger.STEP:
+            return True
+
+        if mode == Debugger.NEXT and depth <= self.__depth:
+            return True
+
+        if mode == Debugger.FINISH and depth < self.__depth:
+            return True
+
+        line = self.__line_numbers[statement]
+
+        return line in self.__breakpoints and statement in self.__lines[line]
+
+
+    def __source_line(
+        self,
+        line: int,
+    ) -> str:
+        if line == None or not 1 <= line <= len(self.__source):
+            return ''
+
+        return self.__source[line - 1]
+
+
+    def __trap(
+        self,
+        statement: Stmt.Stmt,
+    ) -> None:
+        if statement in self.__trapped:
+            return
+
+        self.__trapped.add(statement)
+
+        statement.accept = functools.partial(self.__visit, statement)
+
+
+    def __untrap(
+        self,
+        statement: Stmt.Stmt,
+    ) -> None:
+        self.__trapped.discard(statement)
+
+        del statement.accept
+
+
+    def __visit(
+        self,
+        statement: Stmt.Stmt,
+        visitor: Any,
+    ) -> Any:
+        is_generator = isinstance(visitor, GeneratorExecutor)
+
+        if visitor is self.__interpreter or is_generator:
+            if statement is self.__resumed:
+                self.__resumed = None
+            elif self.__should_pause(statement):
+                self.__pause(statement)
+
+        if not is_generator:
+            return type(statement).accept(statement, visitor)
+
+        self.__resumed = statement
+
+        steps = type(statement).accept(statement, visitor)
+
+        if steps != None:
+            self.__resumed = None
+
+        return steps
+
+
+    def __write(
+        self,
+        text: str,
+    ) -> None:
+        self.__output.write(text + '\n')
+        self.__output.flush()
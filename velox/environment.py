@@ -1,7 +1,7 @@
-from typing import Any, ForwardRef
+from typing import Any, ForwardRef, ItemsView
 
 from runtime_error import RuntimeError
-from token import Token
+from velox_token import Token
 
 
 class Environment:
@@ -9,10 +9,11 @@ class Environment:
 
     def __init__(
         self,
-        enclosing: ForwardRef('Environment') = None
+        enclosing: ForwardRef('Environment') = None,
+        values: dict[str, Any] = None,
     ) -> None:
         self.enclosing = enclosing
-        self.__values = {}
+        self.__values = values if values is not None else {}
 
 
     # Public methods
@@ -41,6 +42,16 @@ class Environment:
     ) -> None:
         self.__ancestor(distance).__values[name.lexeme] = value
 
+
+    def copy(
+        self,
+    ) -> ForwardRef('Environment'):
+        environment = Environment(self.enclosing)
+        environment.__values = dict(self.__values)
+
+        return environment
+
+
     def define(
         self,
         name: str,
@@ -53,8 +64,10 @@ class Environment:
         self,
         name: Token,
     ) -> Any:
-        if name.lexeme in self.__values:
+        try:
             return self.__values[name.lexeme]
+        except KeyError:
+            pass
 
         if self.enclosing:
             return self.enclosing.get(name)
@@ -70,6 +83,12 @@ class Environment:
         return self.__ancestor(distance).__values.get(name)
 
 
+    def items(
+        self,
+    ) -> ItemsView[str, Any]:
+        return self.__values.items()
+
+
     # Private methods
 
     def __ancestor(
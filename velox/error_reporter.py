@@ -1,50 +1,77 @@
-from typing import Union
+from typing import TextIO, Union
 
 from runtime_error import RuntimeError
-from token import Token
 from token_type import TokenType
+from velox_token import Token
 
 
 class ErrorReporter:
-    had_error: bool = False
-    had_runtime_error: bool = False
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        output: TextIO = None,
+    ) -> None:
+        self.had_error = False
+        self.had_runtime_error = False
+        self.last_runtime_error = None
+
+        self.__output = output
 
 
     # Public methods
 
-    @staticmethod
     def error(
+        self,
         where: Union[int, Token],
         message: str,
     ) -> None:
         if isinstance(where, int):
-            ErrorReporter.__report(where, '', message)
+            self.__report(where, '', message)
         elif isinstance(where, Token):
             if where.type == TokenType.EOF:
-                ErrorReporter.__report(where.line, ' at end', message)
+                self.__report(where.line, ' at end', message)
             else:
-                ErrorReporter.__report(
+                self.__report(
                     where.line,
                     f' at \'{where.lexeme}\'',
                     message,
                 )
 
-    @staticmethod
+
+    def errors(
+        self,
+        text: str,
+    ) -> None:
+        print(text, end='', file=self.__output)
+        self.had_error = True
+
+
+    def host_error(
+        self,
+        error: Exception,
+    ) -> None:
+        print(f'{type(error).__name__}: {error}', file=self.__output)
+        self.had_runtime_error = True
+
+
     def runtime_error(
+        self,
         error: RuntimeError,
     ) -> None:
-        print(f'{error.message}\n[line {error.token.line}]')
-        ErrorReporter.had_runtime_error = True
+        print(f'{error.message}\n[line {error.token.line}]', file=self.__output)
+        self.had_runtime_error = True
+        self.last_runtime_error = error
 
 
     # Private methods
 
-    @staticmethod
     def __report(
+        self,
         line: int,
         where: str,
         message: str,
     ) -> None:
-        print(f'[line {line}] Error{where}: {message}')
+        print(f'[line {line}] Error{where}: {message}', file=self.__output)
 
-        ErrorReporter.had_error = True
+        self.had_error = True
@@ -0,0 +1,5 @@
+from runtime_error import RuntimeError
+
+
+class ExecutionLimitError(RuntimeError):
+    pass
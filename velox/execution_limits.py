@@ -0,0 +1,98 @@
+import time
+
+from execution_limit_error import ExecutionLimitError
+from interpreter import Interpreter
+from velox_token import Token
+
+
+class ExecutionBudget:
+    CLOCK_INTERVAL = 64
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        interpreter: Interpreter,
+        max_steps: int = None,
+        timeout: float = None,
+    ) -> None:
+        self.steps = 0
+
+        self.__interpreter = interpreter
+        self.__max_steps = max_steps
+        self.__deadline = None
+
+        if timeout != None:
+            self.__deadline = time.perf_counter() + timeout
+
+        self.__interval = self.__next_interval()
+
+        interpreter.countdown = self.__interval
+
+
+    def __call__(
+        self,
+        token: Token,
+    ) -> int:
+        self.steps += self.__interval
+        self.__interval = 0
+
+        if self.__max_steps is not None and self.steps > self.__max_steps:
+            raise ExecutionLimitError(token, 'Instruction budget exceeded.')
+
+        if self.__deadline is not None and time.perf_counter() > self.__deadline:
+            raise ExecutionLimitError(token, 'Time limit exceeded.')
+
+        self.__interval = self.__next_interval()
+
+        return self.__interval
+
+
+    # Public methods
+
+    def settle(
+        self,
+    ) -> None:
+        countdown = max(self.__interpreter.countdown, 0)
+
+        self.steps += self.__interval - countdown
+        self.__interval = countdown
+
+
+    # Private methods
+
+    def __next_interval(
+        self,
+    ) -> int:
+        if self.__max_steps is None:
+            return ExecutionBudget.CLOCK_INTERVAL
+
+        return min(ExecutionBudget.CLOCK_INTERVAL, self.__max_steps - self.steps + 1)
+
+
+class ExecutionLimits:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        max_steps: int = None,
+        timeout: float = None,
+        max_call_depth: int = None,
+    ) -> None:
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_call_depth = max_call_depth
+
+
+    # Public methods
+
+    def apply(
+        self,
+        interpreter: Interpreter,
+    ) -> ExecutionBudget:
+        budget = ExecutionBudget(interpreter, self.max_steps, self.timeout)
+
+        interpreter.checkpoint = budget
+        interpreter.max_call_depth = self.max_call_depth
+
+        return budget
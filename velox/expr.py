@@ -1,12 +1,14 @@
 from typing import Any, ForwardRef, Generic, TypeVar
 
-from token import Token
+from velox_token import Token
 
 
 T = TypeVar('T')
 
 
 class Expr:
+    fields = ()
+
     # Public methods
 
     def accept(
@@ -16,6 +18,8 @@ class Expr:
 
 
 class ExprAssign(Expr):
+    fields = ('name', 'value')
+
     # Lifecycle methods
 
     def __init__(
@@ -26,6 +30,9 @@ class ExprAssign(Expr):
         self.name = name
         self.value = value
 
+        self.depth: int = None
+        self.binding: Binding = None
+
 
     # Public methods
 
@@ -37,6 +44,8 @@ class ExprAssign(Expr):
 
 
 class ExprBinary(Expr):
+    fields = ('left', 'operator', 'right')
+
     # Lifecycle methods
 
     def __init__(
@@ -49,6 +58,8 @@ class ExprBinary(Expr):
         self.operator = operator
         self.right = right
 
+        self.numeric: Callable = None
+
 
     # Public methods
 
@@ -60,6 +71,8 @@ class ExprBinary(Expr):
 
 
 class ExprCall(Expr):
+    fields = ('callee', 'paren', 'arguments')
+
     # Lifecycle methods
 
     def __init__(
@@ -83,6 +96,8 @@ class ExprCall(Expr):
 
 
 class ExprGet(Expr):
+    fields = ('object', 'name')
+
     # Lifecycle methods
 
     def __init__(
@@ -104,6 +119,8 @@ class ExprGet(Expr):
 
 
 class ExprGrouping(Expr):
+    fields = ('expression',)
+
     # Lifecycle methods
 
     def __init__(
@@ -122,7 +139,36 @@ class ExprGrouping(Expr):
         return visitor.visit_ExprGrouping(self)
 
 
+class ExprInvoke(Expr):
+    fields = ('object', 'name', 'paren', 'arguments')
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        object: Expr,
+        name: Token,
+        paren: Token,
+        arguments: list[Expr],
+    ) -> None:
+        self.object = object
+        self.name = name
+        self.paren = paren
+        self.arguments = arguments
+
+
+    # Public methods
+
+    def accept(
+        self,
+        visitor: ForwardRef('Visitor[T]'),
+    ) -> T:
+        return visitor.visit_ExprInvoke(self)
+
+
 class ExprLiteral(Expr):
+    fields = ('value',)
+
     # Lifecycle methods
 
     def __init__(
@@ -142,6 +188,8 @@ class ExprLiteral(Expr):
 
 
 class ExprLogical(Expr):
+    fields = ('left', 'operator', 'right')
+
     # Lifecycle methods
 
     def __init__(
@@ -165,6 +213,8 @@ class ExprLogical(Expr):
 
 
 class ExprSet(Expr):
+    fields = ('object', 'name', 'value')
+
     # Lifecycle methods
 
     def __init__(
@@ -188,6 +238,8 @@ class ExprSet(Expr):
 
 
 class ExprSuper(Expr):
+    fields = ('keyword', 'method')
+
     # Lifecycle methods
 
     def __init__(
@@ -198,6 +250,8 @@ class ExprSuper(Expr):
         self.keyword = keyword
         self.method = method
 
+        self.depth: int = None
+
 
     # Public methods
 
@@ -209,6 +263,8 @@ class ExprSuper(Expr):
 
 
 class ExprThis(Expr):
+    fields = ('keyword',)
+
     # Lifecycle methods
 
     def __init__(
@@ -217,6 +273,8 @@ class ExprThis(Expr):
     ) -> None:
         self.keyword = keyword
 
+        self.depth: int = None
+
 
     # Public methods
 
@@ -228,6 +286,8 @@ class ExprThis(Expr):
 
 
 class ExprUnary(Expr):
+    fields = ('operator', 'right')
+
     # Lifecycle methods
 
     def __init__(
@@ -238,6 +298,8 @@ class ExprUnary(Expr):
         self.operator = operator
         self.right = right
 
+        self.numeric: bool = None
+
 
     # Public methods
 
@@ -249,6 +311,8 @@ class ExprUnary(Expr):
 
 
 class ExprVariable(Expr):
+    fields = ('name',)
+
     # Lifecycle methods
 
     def __init__(
@@ -257,6 +321,9 @@ class ExprVariable(Expr):
     ) -> None:
         self.name = name
 
+        self.depth: int = None
+        self.binding: Binding = None
+
 
     # Public methods
 
@@ -305,6 +372,13 @@ class Visitor(Generic[T]):
         pass
 
 
+    def visit_ExprInvoke(
+        self,
+        expr: ExprInvoke,
+    ) -> T:
+        pass
+
+
     def visit_ExprLiteral(
         self,
         expr: ExprLiteral,
@@ -0,0 +1,76 @@
+import pickle
+import sys
+import threading
+from typing import Any
+
+from environment import Environment
+from interpreter import Interpreter
+
+
+class HeapSnapshot:
+    VERSION = 1
+
+    STACK_SIZE = 256 * 1024 * 1024
+    RECURSION_LIMIT = STACK_SIZE // 512
+
+
+    # Public methods
+
+    @staticmethod
+    def load(
+        interpreter: Interpreter,
+        path: str,
+    ) -> None:
+        with open(path, 'rb') as in_file:
+            version, globals = pickle.load(in_file)
+
+        if version != HeapSnapshot.VERSION or not isinstance(globals, Environment):
+            raise ValueError(f'\'{path}\' is not a compatible heap snapshot.')
+
+        interpreter.globals = globals
+        interpreter.main_globals = globals
+        interpreter.environment = globals
+
+
+    @staticmethod
+    def save(
+        interpreter: Interpreter,
+        path: str,
+    ) -> None:
+        data = HeapSnapshot.__dumps((HeapSnapshot.VERSION, interpreter.globals))
+
+        with open(path, 'wb') as out_file:
+            out_file.write(data)
+
+
+    # Private methods
+
+    @staticmethod
+    def __dumps(
+        value: Any,
+    ) -> bytes:
+        result = []
+
+        def run() -> None:
+            try:
+                result.append(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            except BaseException as error:
+                result.append(error)
+
+        recursion_limit = sys.getrecursionlimit()
+        stack_size = threading.stack_size(HeapSnapshot.STACK_SIZE)
+
+        try:
+            sys.setrecursionlimit(max(recursion_limit, HeapSnapshot.RECURSION_LIMIT))
+
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+        finally:
+            threading.stack_size(stack_size)
+            sys.setrecursionlimit(recursion_limit)
+
+        if isinstance(result[0], BaseException):
+            raise result[0]
+
+        return result[0]
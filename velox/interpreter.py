@@ -1,34 +1,95 @@
-from typing import Any
+from typing import Any, Callable, ForwardRef, Iterator, TextIO
 
 from callables import Clock, VeloxClass, VeloxFunction
+from closure_compiler import ClosureCompiler
 from environment import Environment
 from error_reporter import ErrorReporter
+from execution_limit_error import ExecutionLimitError
 import expr as Expr
+from module_loader import ModuleLoader
+from native_error import NativeError
+from natives import NativeModule, NativeRegistry
+from output_sink import OutputSink
 from runtime_error import RuntimeError
 import stmt as Stmt
-from token import Token
 from token_type import TokenType
+from velox_array import VeloxArray
 from velox_callable import VeloxCallable
 from velox_instance import VeloxInstance
+from velox_iterator import VeloxIterator
+from velox_map import VeloxMap
+from velox_module import VeloxModule
 from velox_return import VeloxReturn
+from velox_rope import VeloxRope
+from velox_token import Token
+from velox_vector import VeloxVector
 
 
 class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
+    HOT_THRESHOLD = 1000
+
+
     # Lifecycle methods
 
     def __init__(
         self,
+        reporter: ErrorReporter,
+        output: TextIO = None,
     ) -> None:
-        self.__globals = Environment()
-        self.__globals.define('clock', Clock)
+        self.reporter = reporter
+        self.checkpoint = None
+        self.countdown = 0
+        self.call_depth = 0
+        self.max_call_depth = None
+        self.hot_threshold = Interpreter.HOT_THRESHOLD
+        self.module = None
+        self.directory = None
+        self.modules = {}
+
+        self.output = OutputSink.wrap(output)
 
-        self.__locals = {}
+        self.globals = Interpreter.create_globals()
+        self.main_globals = self.globals
 
-        self.environment = self.__globals
+        self.environment = self.globals
 
 
     # Public methods
 
+    def compile_function(
+        self,
+        declaration: Stmt.StmtFunction,
+        body: list[Stmt.Stmt],
+    ) -> Callable[[ForwardRef('Interpreter'), Environment], Any]:
+        compiled = declaration.compiled = ClosureCompiler().compile_function(body)
+
+        return compiled
+
+
+    @staticmethod
+    def create_globals(
+    ) -> Environment:
+        globals = Environment()
+        globals.define('clock', Clock())
+
+        NativeRegistry.define(globals)
+
+        return globals
+
+
+    def evaluate(
+        self,
+        expr: Expr.Expr,
+    ) -> Any:
+        return self.__evaluate(expr)
+
+
+    def execute(
+        self,
+        stmt: Stmt.Stmt,
+    ) -> None:
+        self.__execute(stmt)
+
 
     def execute_block(
         self,
@@ -54,15 +115,78 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
             for statement in statements:
                 self.__execute(statement)
         except RuntimeError as error:
-            ErrorReporter.runtime_error(error)
+            self.reporter.runtime_error(error)
+        finally:
+            self.output.flush()
 
 
-    def resolve(
+    def is_truthy(
         self,
-        expr: Expr.Expr,
-        depth: int,
+        obj: Any,
+    ) -> bool:
+        return self.__is_truthy(obj)
+
+
+    def iterate(
+        self,
+        token: Token,
+        obj: Any,
+    ) -> Iterator[Any]:
+        if isinstance(obj, VeloxIterator):
+            return obj
+
+        if isinstance(obj, VeloxArray):
+            return iter(obj.values)
+
+        if isinstance(obj, VeloxVector):
+            return map(float, obj.values)
+
+        if isinstance(obj, VeloxMap):
+            return obj.keys()
+
+        raise RuntimeError(token, 'Can only iterate over iterators, arrays, vectors and maps.')
+
+
+    def reset(
+        self,
+        reporter: ErrorReporter,
+        output: TextIO,
+        globals: Environment,
     ) -> None:
-        self.__locals[expr] = depth
+        self.reporter = reporter
+        self.checkpoint = None
+        self.countdown = 0
+        self.call_depth = 0
+        self.max_call_depth = None
+        self.hot_threshold = Interpreter.HOT_THRESHOLD
+        self.module = None
+        self.directory = None
+        self.modules = {}
+
+        self.output = OutputSink.wrap(output)
+        self.globals = globals
+        self.main_globals = globals
+
+        self.environment = globals
+
+
+    def stringify(
+        self,
+        obj: Any,
+    ) -> str:
+        return self.__stringify(obj)
+
+
+    def switch_module(
+        self,
+        module: VeloxModule,
+    ) -> VeloxModule:
+        previous = self.module
+
+        self.module = module
+        self.globals = self.main_globals if module == None else module.globals
+
+        return previous
 
 
     def visit_ExprAssign(
@@ -71,12 +195,12 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
     ) -> Any:
         value = self.__evaluate(expr.value)
 
-        distance = self.__locals.get(expr)
+        distance = expr.depth
 
-        if distance != None:
+        if distance is not None:
             self.environment.assign_at(distance, expr.name, value)
         else:
-            self.__globals.assign(expr.name, value)
+            self.globals.assign(expr.name, value)
 
         return value
 
@@ -88,24 +212,27 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         left = self.__evaluate(expr.left)
         right = self.__evaluate(expr.right)
 
+        if expr.numeric is not None:
+            return expr.numeric(left, right)
+
         if expr.operator.type == TokenType.MINUS:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) - float(right)
+            return left - right
 
         if expr.operator.type == TokenType.SLASH:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) / float(right)
+            return left / right
 
         if expr.operator.type == TokenType.STAR:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) * float(right)
+            return left * right
 
         if expr.operator.type == TokenType.PLUS:
             if isinstance(left, float) and isinstance(right, float):
-                return float(left) + float(right)
+                return left + right
 
-            if isinstance(left, str) and isinstance(right, str):
-                return str(left) + str(right)
+            if isinstance(left, (str, VeloxRope)) and isinstance(right, (str, VeloxRope)):
+                return VeloxRope.concat(left, right)
 
             raise RuntimeError(
                 expr.operator,
@@ -114,19 +241,19 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
 
         if expr.operator.type == TokenType.GREATER:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) > float(right)
+            return left > right
 
         if expr.operator.type == TokenType.GREATER_EQUAL:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) >= float(right)
+            return left >= right
 
         if expr.operator.type == TokenType.LESS:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) < float(right)
+            return left < right
 
         if expr.operator.type == TokenType.LESS_EQUAL:
             self.__check_number_operands(expr.operator, left, right)
-            return float(left) <= float(right)
+            return left <= right
 
         if expr.operator.type == TokenType.BANG_EQUAL:
             return not self.__is_equal(left, right)
@@ -143,18 +270,7 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
     ) -> Any:
         callee = self.__evaluate(expr.callee)
 
-        arguments = [
-            self.__evaluate(argument) for argument in expr.arguments
-        ]
-
-        if not isinstance(callee, VeloxCallable):
-            raise RuntimeError(expr.paren, 'Can only call functions and classes.')
-
-
-        if len(arguments) != callee.arity():
-            raise RuntimeError(expr.paren, f'Expected {callee.arity()} arguments but got {len(arguments)}.')
-
-        return callee.call(self, arguments)
+        return self.__call(expr.paren, callee, None, expr.arguments)
 
 
     def visit_ExprGet(
@@ -166,6 +282,9 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         if isinstance(object, VeloxInstance):
             return object.get(expr.name)
 
+        if isinstance(object, (NativeModule, VeloxModule)):
+            return object.get(expr.name)
+
         raise RuntimeError(expr.name, 'Only instances have properties.')
 
 
@@ -178,6 +297,26 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         )
 
 
+    def visit_ExprInvoke(
+        self,
+        expr: Expr.ExprInvoke,
+    ) -> Any:
+        object = self.__evaluate(expr.object)
+
+        if isinstance(object, VeloxInstance):
+            method = object.method(expr.name)
+
+            if method is not None:
+                return self.__call(expr.paren, method, object, expr.arguments)
+
+            return self.__call(expr.paren, object.get(expr.name), None, expr.arguments)
+
+        if isinstance(object, (NativeModule, VeloxModule)):
+            return self.__call(expr.paren, object.get(expr.name), None, expr.arguments)
+
+        raise RuntimeError(expr.name, 'Only instances have properties.')
+
+
     def visit_ExprLiteral(
         self,
         expr: Expr.ExprLiteral,
@@ -221,7 +360,7 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         self,
         expr: Expr.ExprSuper,
     ) -> Any:
-        distance = self.__locals.get(expr)
+        distance = expr.depth
 
         superclass = self.environment.get_at(distance, 'super')
 
@@ -248,9 +387,12 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
     ) -> Any:
         right = self.__evaluate(expr.right)
 
+        if expr.numeric:
+            return -right
+
         if expr.operator.type == TokenType.MINUS:
             self.__check_number_operand(expr.operator, right)
-            return -float(right)
+            return -right
 
         if expr.operator.type == TokenType.BANG:
             return not self.__is_truthy(right)
@@ -269,6 +411,12 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         self,
         stmt: Stmt.StmtBlock,
     ) -> None:
+        if stmt.flat:
+            for statement in stmt.statements:
+                self.__execute(statement)
+
+            return
+
         self.execute_block(stmt.statements, Environment(self.environment))
 
 
@@ -295,7 +443,7 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         for method in stmt.methods:
             is_initializer = method.name.lexeme == 'init'
 
-            function = VeloxFunction(method, self.environment, is_initializer)
+            function = VeloxFunction(method, self.environment, is_initializer, self.module)
 
             methods[method.name.lexeme] = function
 
@@ -314,11 +462,148 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         self.__evaluate(stmt.expression)
 
 
+    def visit_StmtFor(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> None:
+        if stmt.compiled is not None:
+            self.__run_compiled(stmt)
+            return
+
+        previous = self.environment
+        hot_threshold = self.hot_threshold
+        iterations = 0
+
+        if hot_threshold is not None:
+            hot_threshold = max(hot_threshold - stmt.heat, 1)
+
+        if isinstance(stmt.initializer, Stmt.StmtVar):
+            self.environment = Environment(previous)
+
+        try:
+            if stmt.initializer != None:
+                self.__execute(stmt.initializer)
+
+            environment = self.environment
+            body = stmt.body
+            block = None
+
+            if isinstance(body, Stmt.StmtBlock) and body.reusable:
+                block = Environment(environment)
+
+            counted = stmt.counted
+            value = stop = None
+
+            if counted is not None and counted.applies():
+                value = environment.get_at(0, counted.counter.name)
+                stop = self.__evaluate(counted.limit)
+
+            if type(value) is float and type(stop) is float:
+                name = counted.counter.name
+                step = counted.step
+                read = counted.read
+                inclusive = counted.inclusive
+
+                while value <= stop if inclusive else value < stop:
+                    if read:
+                        environment.define(name, value)
+
+                    if block is not None:
+                        self.execute_block(body.statements, block)
+                    else:
+                        self.__execute(body)
+
+                    value += step
+                    iterations += 1
+
+                    if self.checkpoint is not None:
+                        self.countdown -= 1
+
+                        if self.countdown <= 0:
+                            self.countdown = self.checkpoint(stmt.keyword)
+
+                    if iterations == hot_threshold:
+                        environment.define(name, value)
+                        break
+                else:
+                    return
+            else:
+                while self.__is_truthy(self.__evaluate(stmt.condition)):
+                    if block is not None:
+                        self.execute_block(body.statements, block)
+                    else:
+                        self.__execute(body)
+
+                    if stmt.increment != None:
+                        self.__evaluate(stmt.increment)
+
+                    iterations += 1
+
+                    if self.checkpoint is not None:
+                        self.countdown -= 1
+
+                        if self.countdown <= 0:
+                            self.countdown = self.checkpoint(stmt.keyword)
+
+                    if iterations == hot_threshold:
+                        break
+                else:
+                    return
+
+            ClosureCompiler().compile_statement(stmt)
+
+            result = stmt.resume(self)
+
+            if result is not None:
+                raise VeloxReturn(result[0])
+        finally:
+            self.environment = previous
+            stmt.heat += iterations
+
+            if stmt.function is not None:
+                stmt.function.heat += iterations
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: Stmt.StmtForIn,
+    ) -> None:
+        iterator = self.iterate(stmt.name, self.__evaluate(stmt.iterable))
+
+        previous = self.environment
+        environment = Environment(previous)
+        iterations = 0
+
+        try:
+            for value in iterator:
+                if not stmt.reusable:
+                    environment = Environment(previous)
+
+                environment.define(stmt.name.lexeme, value)
+
+                self.environment = environment
+
+                self.__execute(stmt.body)
+
+                iterations += 1
+
+                if self.checkpoint is not None:
+                    self.countdown -= 1
+
+                    if self.countdown <= 0:
+                        self.countdown = self.checkpoint(stmt.name)
+        finally:
+            self.environment = previous
+
+            if stmt.function is not None:
+                stmt.function.heat += iterations
+
+
     def visit_StmtFunction(
         self,
         stmt: Stmt.StmtFunction,
     ) -> None:
-        function = VeloxFunction(stmt, self.environment, False)
+        function = VeloxFunction(stmt, self.environment, False, self.module)
 
         self.environment.define(stmt.name.lexeme, function)
 
@@ -333,13 +618,22 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
             self.__execute(stmt.else_branch)
 
 
+    def visit_StmtImport(
+        self,
+        stmt: Stmt.StmtImport,
+    ) -> None:
+        module = ModuleLoader.load(self, stmt.name)
+
+        self.environment.define(stmt.name.lexeme, module)
+
+
     def visit_StmtPrint(
         self,
         stmt: Stmt.StmtPrint,
     ) -> None:
         value = self.__evaluate(stmt.expression)
 
-        print(self.__stringify(value))
+        self.output.write_line(self.__stringify(value))
 
 
     def visit_StmtReturn(
@@ -368,14 +662,124 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
 
     def visit_StmtWhile(
         self,
-        stmt: Stmt.StmtVar,
+        stmt: Stmt.StmtWhile,
+    ) -> None:
+        if stmt.compiled is not None:
+            self.__run_compiled(stmt)
+            return
+
+        body = stmt.body
+        hot_threshold = self.hot_threshold
+        iterations = 0
+
+        if hot_threshold is not None:
+            hot_threshold = max(hot_threshold - stmt.heat, 1)
+
+        try:
+            if isinstance(body, Stmt.StmtBlock) and body.reusable:
+                environment = Environment(self.environment)
+
+                while self.__is_truthy(self.__evaluate(stmt.condition)):
+                    self.execute_block(body.statements, environment)
+
+                    iterations += 1
+
+                    if self.checkpoint is not None:
+                        self.countdown -= 1
+
+                        if self.countdown <= 0:
+                            self.countdown = self.checkpoint(stmt.keyword)
+
+                    if iterations == hot_threshold:
+                        break
+                else:
+                    return
+            else:
+                while self.__is_truthy(self.__evaluate(stmt.condition)):
+                    self.__execute(body)
+
+                    iterations += 1
+
+                    if self.checkpoint is not None:
+                        self.countdown -= 1
+
+                        if self.countdown <= 0:
+                            self.countdown = self.checkpoint(stmt.keyword)
+
+                    if iterations == hot_threshold:
+                        break
+                else:
+                    return
+        finally:
+            stmt.heat += iterations
+
+            if stmt.function is not None:
+                stmt.function.heat += iterations
+
+        ClosureCompiler().compile_statement(stmt)
+
+        self.__run_compiled(stmt)
+
+
+    def visit_StmtYield(
+        self,
+        stmt: Stmt.StmtYield,
     ) -> None:
-        while self.__is_truthy(self.__evaluate(stmt.condition)):
-            self.__execute(stmt.body)
+        raise RuntimeError(stmt.keyword, 'Can\'t yield outside of a generator.')
 
 
     # Private methods
 
+    def __call(
+        self,
+        paren: Token,
+        callee: Any,
+        this: VeloxInstance,
+        arguments: list[Expr.Expr],
+    ) -> Any:
+        count = len(arguments)
+
+        if count == 0:
+            values = []
+        elif count == 1:
+            values = [arguments[0].accept(self)]
+        elif count == 2:
+            values = [arguments[0].accept(self), arguments[1].accept(self)]
+        elif count == 3:
+            values = [arguments[0].accept(self), arguments[1].accept(self), arguments[2].accept(self)]
+        else:
+            values = [argument.accept(self) for argument in arguments]
+
+        if not isinstance(callee, VeloxCallable):
+            raise RuntimeError(paren, 'Can only call functions and classes.')
+
+        if count != callee.arity():
+            raise RuntimeError(paren, f'Expected {callee.arity()} arguments but got {count}.')
+
+        if self.checkpoint is not None:
+            self.countdown -= 1
+
+            if self.countdown <= 0:
+                self.countdown = self.checkpoint(paren)
+
+        self.call_depth += 1
+
+        try:
+            if self.max_call_depth is not None and self.call_depth > self.max_call_depth:
+                raise ExecutionLimitError(paren, 'Maximum call depth exceeded.')
+
+            if this is not None:
+                return callee.invoke(self, this, values)
+
+            return callee.call(self, values)
+        except NativeError as error:
+            raise RuntimeError(paren, error.message)
+        except RecursionError:
+            raise RuntimeError(paren, 'Stack overflow.')
+        finally:
+            self.call_depth -= 1
+
+
     def __check_number_operand(
         self,
         operator: Token,
@@ -439,12 +843,22 @@ class Interpreter(Expr.Visitor[Any], Stmt.Visitor[None]):
         name: Token,
         expr: Expr.Expr,
     ) -> Any:
-        distance = self.__locals.get(expr)
+        distance = expr.depth
 
-        if distance != None:
+        if distance is not None:
             return self.environment.get_at(distance, name.lexeme)
 
-        return self.__globals.get(name)
+        return self.globals.get(name)
+
+
+    def __run_compiled(
+        self,
+        stmt: Stmt.Stmt,
+    ) -> None:
+        result = stmt.compiled(self)
+
+        if result is not None:
+            raise VeloxReturn(result[0])
 
 
     def __stringify(
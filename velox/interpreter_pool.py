@@ -0,0 +1,198 @@
+import threading
+import time
+from typing import Any, TextIO, Union
+
+from error_reporter import ErrorReporter
+from execution_limits import ExecutionLimits
+from interpreter import Interpreter
+from output_sink import MemorySink, OutputSink
+from program import Program
+from runtime_error import RuntimeError
+import stmt as Stmt
+
+
+class RunResult:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        exit_code: int,
+        output: str,
+        errors: str,
+        error: RuntimeError,
+        steps: int,
+        duration: float,
+    ) -> None:
+        self.exit_code = exit_code
+        self.output = output
+        self.errors = errors
+        self.error = error
+        self.steps = steps
+        self.duration = duration
+
+
+class InterpreterPool:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        size: int = 4,
+        prelude: str = None,
+        limits: ExecutionLimits = None,
+        lazy_functions: bool = False,
+    ) -> None:
+        self.__limits = limits or ExecutionLimits()
+        self.__lazy_functions = lazy_functions
+
+        self.__idle = []
+        self.__idle_lock = threading.Lock()
+        self.__slots = threading.BoundedSemaphore(size)
+
+        self.__globals = Interpreter.create_globals()
+        self.__prelude = self.__preload(prelude)
+
+
+    # Public methods
+
+    def compile(
+        self,
+        source: str,
+        reporter: ErrorReporter = None,
+    ) -> Program:
+        return Program.compile(source, reporter or ErrorReporter(MemorySink()), self.__lazy_functions)
+
+
+    def define(
+        self,
+        name: str,
+        value: Any,
+    ) -> None:
+        self.__globals.define(name, value)
+
+
+    def run(
+        self,
+        program: Union[str, Program],
+        limits: ExecutionLimits = None,
+        output: TextIO = None,
+        directory: str = None,
+    ) -> RunResult:
+        start = time.perf_counter()
+
+        capture = output == None
+
+        if capture:
+            output = MemorySink()
+            errors = MemorySink()
+        else:
+            output = OutputSink.wrap(output)
+            errors = output
+
+        reporter = ErrorReporter(errors)
+
+        if isinstance(program, str):
+            program = self.compile(program, reporter)
+
+        if program == None:
+            return RunResult(
+                65,
+                '',
+                errors.getvalue() if capture else '',
+                None,
+                0,
+                time.perf_counter() - start,
+            )
+
+        with self.__slots:
+            interpreter = self.__acquire()
+
+            try:
+                interpreter.reset(reporter, MemorySink(), self.__globals.copy())
+                interpreter.directory = directory
+
+                if self.__prelude != None:
+                    self.__interpret(interpreter, self.__prelude.statements)
+
+                interpreter.output = output
+
+                budget = (limits or self.__limits).apply(interpreter)
+
+                if not reporter.had_runtime_error:
+                    self.__interpret(interpreter, program.statements)
+
+                budget.settle()
+            finally:
+                interpreter.reset(None, None, self.__globals)
+
+                self.__release(interpreter)
+
+        if reporter.had_error:
+            exit_code = 65
+        elif reporter.had_runtime_error:
+            exit_code = 70
+        else:
+            exit_code = 0
+
+        return RunResult(
+            exit_code,
+            output.getvalue() if capture else '',
+            errors.getvalue() if capture else '',
+            reporter.last_runtime_error,
+            budget.steps,
+            time.perf_counter() - start,
+        )
+
+
+    # Private methods
+
+    def __acquire(
+        self,
+    ) -> Interpreter:
+        with self.__idle_lock:
+            if len(self.__idle) != 0:
+                return self.__idle.pop()
+
+        return Interpreter(None)
+
+
+    @staticmethod
+    def __interpret(
+        interpreter: Interpreter,
+        statements: list[Stmt.Stmt],
+    ) -> None:
+        try:
+            interpreter.interpret(statements)
+        except Exception as error:
+            interpreter.reporter.host_error(error)
+
+
+    def __preload(
+        self,
+        prelude: str,
+    ) -> Program:
+        if prelude == None:
+            return None
+
+        errors = MemorySink()
+        reporter = ErrorReporter(errors)
+        interpreter = Interpreter(reporter, MemorySink())
+
+        program = self.compile(prelude, reporter)
+
+        if program != None:
+            interpreter.interpret(program.statements)
+
+        if reporter.had_error or reporter.had_runtime_error:
+            raise ValueError(f'Invalid prelude:\n{errors.getvalue()}')
+
+        self.__release(interpreter)
+
+        return program
+
+
+    def __release(
+        self,
+        interpreter: Interpreter,
+    ) -> None:
+        with self.__idle_lock:
+            self.__idle.append(interpreter)
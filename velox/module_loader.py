@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import ForwardRef
+
+from program import Program
+from runtime_error import RuntimeError
+from velox_module import VeloxModule
+from velox_token import Token
+
+
+class ModuleLoader:
+    EXTENSION = '.lox'
+    PATH_VARIABLE = 'VELOX_PATH'
+
+    __lock = threading.RLock()
+    __programs = {}
+
+
+    # Public methods
+
+    @staticmethod
+    def clear(
+    ) -> None:
+        with ModuleLoader.__lock:
+            ModuleLoader.__programs.clear()
+
+
+    @staticmethod
+    def load(
+        interpreter: ForwardRef('Interpreter'),
+        name: Token,
+    ) -> VeloxModule:
+        path = ModuleLoader.__find(interpreter, name)
+
+        cached = interpreter.modules.get(path)
+
+        if cached != None:
+            return cached
+
+        program = ModuleLoader.__compile(interpreter, name, path)
+
+        module = VeloxModule(name.lexeme, path, interpreter.create_globals())
+
+        interpreter.modules[path] = module
+
+        previous = interpreter.switch_module(module)
+
+        try:
+            interpreter.execute_block(program.statements, module.globals)
+        except BaseException:
+            del interpreter.modules[path]
+
+            raise
+        finally:
+            interpreter.switch_module(previous)
+
+        return module
+
+
+    # Private methods
+
+    @staticmethod
+    def __compile(
+        interpreter: ForwardRef('Interpreter'),
+        name: Token,
+        path: str,
+    ) -> Program:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise RuntimeError(name, f'Could not read module \'{name.lexeme}\'.')
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with ModuleLoader.__lock:
+            cached = ModuleLoader.__programs.get(path)
+
+            if cached != None and cached[0] == stamp:
+                return cached[1]
+
+            try:
+                with open(path, 'r') as in_file:
+                    source = in_file.read()
+            except OSError:
+                raise RuntimeError(name, f'Could not read module \'{name.lexeme}\'.')
+
+            program = Program.compile(source, interpreter.reporter)
+
+            if program == None:
+                raise RuntimeError(name, f'Could not compile module \'{name.lexeme}\'.')
+
+            ModuleLoader.__programs[path] = (stamp, program)
+
+            return program
+
+
+    @staticmethod
+    def __find(
+        interpreter: ForwardRef('Interpreter'),
+        name: Token,
+    ) -> str:
+        if interpreter.module != None:
+            directories = [os.path.dirname(interpreter.module.path)]
+        else:
+            directories = [interpreter.directory or os.getcwd()]
+
+        directories.extend(
+            directory
+            for directory in os.environ.get(ModuleLoader.PATH_VARIABLE, '').split(os.pathsep)
+            if len(directory) != 0
+        )
+
+        for directory in directories:
+            path = os.path.abspath(os.path.join(directory, name.lexeme + ModuleLoader.EXTENSION))
+
+            if os.path.isfile(path):
+                return path
+
+        raise RuntimeError(name, f'Could not find module \'{name.lexeme}\'.')
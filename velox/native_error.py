@@ -0,0 +1,10 @@
+class NativeError(Exception):
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        message: str,
+    ) -> None:
+        super().__init__(message)
+
+        self.message = message
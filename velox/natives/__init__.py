@@ -0,0 +1,3 @@
+from .native_library import NativeLibrary
+from .native_module import NativeModule
+from .native_registry import NativeRegistry
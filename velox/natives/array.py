@@ -0,0 +1,114 @@
+from array import array
+
+from native_error import NativeError
+from velox_array import VeloxArray
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('array')
+
+
+@library.native('copy', VeloxArray)
+def copy(
+    target: VeloxArray,
+) -> VeloxArray:
+    return VeloxArray(array('d', target.values))
+
+
+@library.native('fill', VeloxArray, float)
+def fill(
+    target: VeloxArray,
+    value: float,
+) -> None:
+    values = target.values
+
+    values[:] = array('d', [value]) * len(values)
+
+
+@library.native('get', VeloxArray, float)
+def get(
+    target: VeloxArray,
+    index: float,
+) -> float:
+    return target.values[NativeLibrary.index(index, len(target.values))]
+
+
+@library.native('length', VeloxArray)
+def length(
+    target: VeloxArray,
+) -> float:
+    return float(len(target.values))
+
+
+@library.native('max', VeloxArray)
+def max_(
+    target: VeloxArray,
+) -> float:
+    if len(target.values) == 0:
+        raise NativeError('Array is empty.')
+
+    return max(target.values)
+
+
+@library.native('min', VeloxArray)
+def min_(
+    target: VeloxArray,
+) -> float:
+    if len(target.values) == 0:
+        raise NativeError('Array is empty.')
+
+    return min(target.values)
+
+
+@library.native('new', float)
+def new(
+    size: float,
+) -> VeloxArray:
+    return VeloxArray(array('d', bytes(8 * NativeLibrary.size(size))))
+
+
+@library.native('pop', VeloxArray)
+def pop(
+    target: VeloxArray,
+) -> float:
+    if len(target.values) == 0:
+        raise NativeError('Array is empty.')
+
+    return target.values.pop()
+
+
+@library.native('push', VeloxArray, float)
+def push(
+    target: VeloxArray,
+    value: float,
+) -> None:
+    target.values.append(value)
+
+
+@library.native('set', VeloxArray, float, float)
+def set_(
+    target: VeloxArray,
+    index: float,
+    value: float,
+) -> float:
+    target.values[NativeLibrary.index(index, len(target.values))] = value
+
+    return value
+
+
+@library.native('slice', VeloxArray, float, float)
+def slice_(
+    target: VeloxArray,
+    start: float,
+    end: float,
+) -> VeloxArray:
+    start, end = NativeLibrary.bounds(start, end, len(target.values))
+
+    return VeloxArray(target.values[start:end])
+
+
+@library.native('sum', VeloxArray)
+def sum_(
+    target: VeloxArray,
+) -> float:
+    return float(sum(target.values))
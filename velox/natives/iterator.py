@@ -0,0 +1,25 @@
+from typing import Any
+
+from native_error import NativeError
+from velox_iterator import VeloxIterator
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('iterator')
+
+
+@library.native('has_next', VeloxIterator)
+def has_next(
+    iterator: VeloxIterator,
+) -> bool:
+    return iterator.has_next()
+
+
+@library.native('next', VeloxIterator)
+def next_(
+    iterator: VeloxIterator,
+) -> Any:
+    if not iterator.has_next():
+        raise NativeError('Iterator is exhausted.')
+
+    return next(iterator)
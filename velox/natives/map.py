@@ -0,0 +1,69 @@
+from typing import Any
+
+from velox_iterator import VeloxIterator
+from velox_map import VeloxMap
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('map')
+
+
+@library.native('delete', VeloxMap, object)
+def delete(
+    target: VeloxMap,
+    key: Any,
+) -> bool:
+    key = VeloxMap.key(key)
+
+    if key not in target.entries:
+        return False
+
+    del target.entries[key]
+
+    return True
+
+
+@library.native('get', VeloxMap, object)
+def get(
+    target: VeloxMap,
+    key: Any,
+) -> Any:
+    return target.entries.get(VeloxMap.key(key))
+
+
+@library.native('has', VeloxMap, object)
+def has(
+    target: VeloxMap,
+    key: Any,
+) -> bool:
+    return VeloxMap.key(key) in target.entries
+
+
+@library.native('keys', VeloxMap)
+def keys(
+    target: VeloxMap,
+) -> VeloxIterator:
+    return VeloxIterator(target.keys())
+
+
+@library.native('new')
+def new() -> VeloxMap:
+    return VeloxMap()
+
+
+@library.native('set', VeloxMap, object, object)
+def set_(
+    target: VeloxMap,
+    key: Any,
+    value: Any,
+) -> Any:
+    target.entries[VeloxMap.key(key)] = value
+
+    return value
+
+
+@library.native('size', VeloxMap)
+def size(
+    target: VeloxMap,
+) -> float:
+    return float(len(target.entries))
@@ -0,0 +1,157 @@
+import math
+
+from native_error import NativeError
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('math')
+
+library.constant('e', math.e)
+library.constant('inf', math.inf)
+library.constant('pi', math.pi)
+
+
+@library.native('abs', float)
+def abs_(
+    x: float,
+) -> float:
+    return abs(x)
+
+
+@library.native('atan2', float, float)
+def atan2(
+    y: float,
+    x: float,
+) -> float:
+    return math.atan2(y, x)
+
+
+@library.native('ceil', float)
+def ceil(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return x
+
+    return float(math.ceil(x))
+
+
+@library.native('cos', float)
+def cos(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return math.nan
+
+    return math.cos(x)
+
+
+@library.native('exp', float)
+def exp(
+    x: float,
+) -> float:
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return math.inf
+
+
+@library.native('floor', float)
+def floor(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return x
+
+    return float(math.floor(x))
+
+
+@library.native('log', float)
+def log(
+    x: float,
+) -> float:
+    if x <= 0:
+        raise NativeError('Argument 1 of \'math.log\' must be positive.')
+
+    return math.log(x)
+
+
+@library.native('max', float, float)
+def max_(
+    a: float,
+    b: float,
+) -> float:
+    return max(a, b)
+
+
+@library.native('min', float, float)
+def min_(
+    a: float,
+    b: float,
+) -> float:
+    return min(a, b)
+
+
+@library.native('mod', float, float)
+def mod(
+    a: float,
+    b: float,
+) -> float:
+    if b == 0:
+        raise NativeError('Division by zero.')
+
+    if math.isinf(a):
+        return math.nan
+
+    return math.fmod(a, b)
+
+
+@library.native('pow', float, float)
+def pow_(
+    x: float,
+    y: float,
+) -> float:
+    try:
+        return math.pow(x, y)
+    except (OverflowError, ValueError):
+        raise NativeError('Result of \'math.pow\' is not a number.')
+
+
+@library.native('round', float)
+def round_(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return x
+
+    return float(math.floor(x + 0.5))
+
+
+@library.native('sin', float)
+def sin(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return math.nan
+
+    return math.sin(x)
+
+
+@library.native('sqrt', float)
+def sqrt(
+    x: float,
+) -> float:
+    if x < 0:
+        raise NativeError('Argument 1 of \'math.sqrt\' must not be negative.')
+
+    return math.sqrt(x)
+
+
+@library.native('tan', float)
+def tan(
+    x: float,
+) -> float:
+    if not math.isfinite(x):
+        return math.nan
+
+    return math.tan(x)
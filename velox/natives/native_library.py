@@ -0,0 +1,95 @@
+import math
+from typing import Any, Callable
+
+from callables import NativeFunction
+from native_error import NativeError
+
+
+class NativeLibrary:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        self.name = name
+        self.values = {}
+
+
+    # Public methods
+
+    def constant(
+        self,
+        name: str,
+        value: Any,
+    ) -> None:
+        self.values[name] = value
+
+
+    def native(
+        self,
+        name: str,
+        *params: type,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def define(
+            function: Callable[..., Any],
+        ) -> Callable[..., Any]:
+            self.values[name] = NativeFunction(
+                f'{self.name}.{name}',
+                params,
+                function,
+            )
+
+            return function
+
+        return define
+
+
+    @staticmethod
+    def bounds(
+        start: float,
+        end: float,
+        length: int,
+    ) -> tuple[int, int]:
+        if not NativeLibrary.__is_whole(start) or not NativeLibrary.__is_whole(end):
+            raise NativeError('Slice bounds must be whole numbers.')
+
+        if not 0 <= start <= end <= length:
+            raise NativeError('Slice bounds out of range.')
+
+        return int(start), int(end)
+
+
+    @staticmethod
+    def index(
+        value: float,
+        length: int,
+    ) -> int:
+        if not NativeLibrary.__is_whole(value):
+            raise NativeError('Index must be a whole number.')
+
+        index = int(value)
+
+        if index < 0 or index >= length:
+            raise NativeError('Index out of range.')
+
+        return index
+
+
+    @staticmethod
+    def size(
+        value: float,
+    ) -> int:
+        if not NativeLibrary.__is_whole(value) or value < 0:
+            raise NativeError('Size must be a non-negative whole number.')
+
+        return int(value)
+
+
+    # Private methods
+
+    @staticmethod
+    def __is_whole(
+        value: float,
+    ) -> bool:
+        return math.isfinite(value) and int(value) == value
@@ -0,0 +1,45 @@
+import importlib
+from typing import Any
+
+from runtime_error import RuntimeError
+from velox_token import Token
+
+
+class NativeModule:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+    ) -> None:
+        self.name = name
+        self.__path = path
+        self.__values = None
+
+
+    def __reduce__(
+        self,
+    ) -> tuple[type, tuple[str, str]]:
+        return (NativeModule, (self.name, self.__path))
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<native module {self.name}>'
+
+
+    # Public methods
+
+    def get(
+        self,
+        name: Token,
+    ) -> Any:
+        if self.__values == None:
+            self.__values = importlib.import_module(self.__path).library.values
+
+        if name.lexeme in self.__values:
+            return self.__values[name.lexeme]
+
+        raise RuntimeError(name, f'Undefined property \'{name.lexeme}\'.')
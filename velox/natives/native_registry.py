@@ -0,0 +1,35 @@
+import importlib
+from typing import Any
+
+from environment import Environment
+from .native_module import NativeModule
+
+
+class NativeRegistry:
+    MODULES = {
+        'array': 'natives.array',
+        'iterator': 'natives.iterator',
+        'map': 'natives.map',
+        'math': 'natives.math',
+        'string': 'natives.string',
+        'time': 'natives.time',
+        'vector': 'natives.vector',
+    }
+
+
+    # Public methods
+
+    @staticmethod
+    def define(
+        environment: Environment,
+    ) -> None:
+        for name, path in NativeRegistry.MODULES.items():
+            environment.define(name, NativeModule(name, path))
+
+
+    @staticmethod
+    def member(
+        module: str,
+        name: str,
+    ) -> Any:
+        return importlib.import_module(NativeRegistry.MODULES[module]).library.values[name]
@@ -0,0 +1,124 @@
+from typing import Union
+
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('string')
+
+
+@library.native('char_at', str, float)
+def char_at(
+    text: str,
+    index: float,
+) -> str:
+    return text[NativeLibrary.index(index, len(text))]
+
+
+@library.native('contains', str, str)
+def contains(
+    text: str,
+    part: str,
+) -> bool:
+    return part in text
+
+
+@library.native('ends_with', str, str)
+def ends_with(
+    text: str,
+    suffix: str,
+) -> bool:
+    return text.endswith(suffix)
+
+
+@library.native('from_number', float)
+def from_number(
+    number: float,
+) -> str:
+    text = str(number)
+
+    if text.endswith('.0'):
+        text = text[:-2]
+
+    return text
+
+
+@library.native('index_of', str, str)
+def index_of(
+    text: str,
+    part: str,
+) -> float:
+    return float(text.find(part))
+
+
+@library.native('length', str)
+def length(
+    text: str,
+) -> float:
+    return float(len(text))
+
+
+@library.native('lower', str)
+def lower(
+    text: str,
+) -> str:
+    return text.lower()
+
+
+@library.native('repeat', str, float)
+def repeat(
+    text: str,
+    count: float,
+) -> str:
+    return text * NativeLibrary.size(count)
+
+
+@library.native('replace', str, str, str)
+def replace(
+    text: str,
+    old: str,
+    new: str,
+) -> str:
+    return text.replace(old, new)
+
+
+@library.native('slice', str, float, float)
+def slice_(
+    text: str,
+    start: float,
+    end: float,
+) -> str:
+    start, end = NativeLibrary.bounds(start, end, len(text))
+
+    return text[start:end]
+
+
+@library.native('starts_with', str, str)
+def starts_with(
+    text: str,
+    prefix: str,
+) -> bool:
+    return text.startswith(prefix)
+
+
+@library.native('to_number', str)
+def to_number(
+    text: str,
+) -> Union[float, None]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+@library.native('trim', str)
+def trim(
+    text: str,
+) -> str:
+    return text.strip()
+
+
+@library.native('upper', str)
+def upper(
+    text: str,
+) -> str:
+    return text.upper()
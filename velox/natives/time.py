@@ -0,0 +1,23 @@
+import math
+import time
+
+from native_error import NativeError
+from .native_library import NativeLibrary
+
+
+library = NativeLibrary('time')
+
+
+@library.native('clock')
+def clock() -> float:
+    return time.time()
+
+
+@library.native('sleep', float)
+def sleep(
+    seconds: float,
+) -> None:
+    if not math.isfinite(seconds):
+        raise NativeError('Argument 1 of \'time.sleep\' must be finite.')
+
+    time.sleep(max(seconds, 0.0))
@@ -0,0 +1,355 @@
+from array import array
+from itertools import compress, repeat
+import math
+import operator
+from typing import Any, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from native_error import NativeError
+from velox_array import VeloxArray
+from velox_vector import VeloxVector
+from .native_library import NativeLibrary
+
+
+def divide(
+    left: float,
+    right: float,
+) -> float:
+    if right != 0:
+        return left / right
+
+    if left == 0 or left != left:
+        return math.nan
+
+    return math.copysign(math.inf, left) * math.copysign(1.0, right)
+
+
+class NumpyBackend:
+    OPERATIONS = {
+        'add': operator.add,
+        'div': operator.truediv,
+        'equal': operator.eq,
+        'greater': operator.gt,
+        'less': operator.lt,
+        'mul': operator.mul,
+        'sub': operator.sub,
+    }
+
+
+    # Public methods
+
+    @staticmethod
+    def apply(
+        name: str,
+        left: Any,
+        right: Union[Any, float],
+    ) -> Any:
+        function = NumpyBackend.OPERATIONS[name]
+
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return numpy.asarray(function(left, right), dtype=numpy.float64)
+
+
+    @staticmethod
+    def dot(
+        left: Any,
+        right: Any,
+    ) -> float:
+        return float(numpy.dot(left, right))
+
+
+    @staticmethod
+    def from_array(
+        values: array,
+    ) -> Any:
+        return numpy.frombuffer(values, dtype=numpy.float64).copy()
+
+
+    @staticmethod
+    def full(
+        size: int,
+        value: float,
+    ) -> Any:
+        return numpy.full(size, value, dtype=numpy.float64)
+
+
+    @staticmethod
+    def max(
+        values: Any,
+    ) -> float:
+        return float(values.max())
+
+
+    @staticmethod
+    def min(
+        values: Any,
+    ) -> float:
+        return float(values.min())
+
+
+    @staticmethod
+    def range(
+        size: int,
+    ) -> Any:
+        return numpy.arange(size, dtype=numpy.float64)
+
+
+    @staticmethod
+    def select(
+        values: Any,
+        mask: Any,
+    ) -> Any:
+        return values[mask != 0]
+
+
+    @staticmethod
+    def sum(
+        values: Any,
+    ) -> float:
+        return float(values.sum())
+
+
+    @staticmethod
+    def to_array(
+        values: Any,
+    ) -> array:
+        result = array('d')
+        result.frombytes(values.tobytes())
+
+        return result
+
+
+class PythonBackend:
+    OPERATIONS = {
+        'add': operator.add,
+        'div': divide,
+        'equal': lambda left, right: float(left == right),
+        'greater': lambda left, right: float(left > right),
+        'less': lambda left, right: float(left < right),
+        'mul': operator.mul,
+        'sub': operator.sub,
+    }
+
+
+    # Public methods
+
+    @staticmethod
+    def apply(
+        name: str,
+        left: array,
+        right: Union[array, float],
+    ) -> array:
+        function = PythonBackend.OPERATIONS[name]
+
+        if isinstance(right, float):
+            right = repeat(right, len(left))
+
+        return array('d', map(function, left, right))
+
+
+    @staticmethod
+    def dot(
+        left: array,
+        right: array,
+    ) -> float:
+        return float(sum(map(operator.mul, left, right)))
+
+
+    @staticmethod
+    def from_array(
+        values: array,
+    ) -> array:
+        return array('d', values)
+
+
+    @staticmethod
+    def full(
+        size: int,
+        value: float,
+    ) -> array:
+        return array('d', [value]) * size
+
+
+    @staticmethod
+    def max(
+        values: array,
+    ) -> float:
+        return max(values)
+
+
+    @staticmethod
+    def min(
+        values: array,
+    ) -> float:
+        return min(values)
+
+
+    @staticmethod
+    def range(
+        size: int,
+    ) -> array:
+        return array('d', map(float, range(size)))
+
+
+    @staticmethod
+    def select(
+        values: array,
+        mask: array,
+    ) -> array:
+        return array('d', compress(values, mask))
+
+
+    @staticmethod
+    def sum(
+        values: array,
+    ) -> float:
+        return float(sum(values))
+
+
+    @staticmethod
+    def to_array(
+        values: array,
+    ) -> array:
+        return array('d', values)
+
+
+Backend = PythonBackend if numpy == None else NumpyBackend
+
+library = NativeLibrary('vector')
+
+
+def operand(
+    vector: VeloxVector,
+    other: Any,
+    name: str,
+) -> Any:
+    if isinstance(other, float):
+        return other
+
+    if not isinstance(other, VeloxVector):
+        raise NativeError(f'Argument 2 of \'vector.{name}\' must be a vector or a number.')
+
+    if len(other.values) != len(vector.values):
+        raise NativeError('Vectors must have the same length.')
+
+    return other.values
+
+
+def define_operation(
+    name: str,
+) -> None:
+    @library.native(name, VeloxVector, object)
+    def operation(
+        vector: VeloxVector,
+        other: Any,
+    ) -> VeloxVector:
+        return VeloxVector(
+            Backend.apply(name, vector.values, operand(vector, other, name)),
+        )
+
+
+for name in PythonBackend.OPERATIONS:
+    define_operation(name)
+
+
+@library.native('dot', VeloxVector, VeloxVector)
+def dot(
+    left: VeloxVector,
+    right: VeloxVector,
+) -> float:
+    return Backend.dot(left.values, operand(left, right, 'dot'))
+
+
+@library.native('from_array', VeloxArray)
+def from_array(
+    source: VeloxArray,
+) -> VeloxVector:
+    return VeloxVector(Backend.from_array(source.values))
+
+
+@library.native('get', VeloxVector, float)
+def get(
+    vector: VeloxVector,
+    index: float,
+) -> float:
+    return float(vector.values[NativeLibrary.index(index, len(vector.values))])
+
+
+@library.native('length', VeloxVector)
+def length(
+    vector: VeloxVector,
+) -> float:
+    return float(len(vector.values))
+
+
+@library.native('max', VeloxVector)
+def max_(
+    vector: VeloxVector,
+) -> float:
+    if len(vector.values) == 0:
+        raise NativeError('Vector is empty.')
+
+    return Backend.max(vector.values)
+
+
+@library.native('mean', VeloxVector)
+def mean(
+    vector: VeloxVector,
+) -> float:
+    if len(vector.values) == 0:
+        raise NativeError('Vector is empty.')
+
+    return Backend.sum(vector.values) / len(vector.values)
+
+
+@library.native('min', VeloxVector)
+def min_(
+    vector: VeloxVector,
+) -> float:
+    if len(vector.values) == 0:
+        raise NativeError('Vector is empty.')
+
+    return Backend.min(vector.values)
+
+
+@library.native('new', float, float)
+def new(
+    size: float,
+    value: float,
+) -> VeloxVector:
+    return VeloxVector(Backend.full(NativeLibrary.size(size), value))
+
+
+@library.native('range', float)
+def range_(
+    size: float,
+) -> VeloxVector:
+    return VeloxVector(Backend.range(NativeLibrary.size(size)))
+
+
+@library.native('select', VeloxVector, VeloxVector)
+def select(
+    vector: VeloxVector,
+    selection: VeloxVector,
+) -> VeloxVector:
+    return VeloxVector(
+        Backend.select(vector.values, operand(vector, selection, 'select')),
+    )
+
+
+@library.native('sum', VeloxVector)
+def sum_(
+    vector: VeloxVector,
+) -> float:
+    return Backend.sum(vector.values)
+
+
+@library.native('to_array', VeloxVector)
+def to_array(
+    vector: VeloxVector,
+) -> VeloxArray:
+    return VeloxArray(Backend.to_array(vector.values))
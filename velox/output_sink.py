@@ -0,0 +1,109 @@
+import sys
+from typing import ForwardRef, TextIO
+
+
+class OutputSink:
+    BUFFER_SIZE = 1 << 16
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        self.__stream = stream
+        self.__buffer_size = buffer_size
+        self.__chunks = []
+        self.__size = 0
+
+
+    # Public methods
+
+    def drain(
+        self,
+    ) -> str:
+        chunks, self.__chunks = self.__chunks, []
+        self.__size = 0
+
+        return ''.join(chunks)
+
+
+    def flush(
+        self,
+    ) -> None:
+        text = self.drain()
+
+        if len(text) == 0:
+            return
+
+        stream = self.__stream or sys.stdout
+
+        stream.write(text)
+        stream.flush()
+
+
+    def write(
+        self,
+        text: str,
+    ) -> int:
+        self.__chunks.append(text)
+        self.__size += len(text)
+
+        if self.__size >= self.__buffer_size:
+            self.flush()
+
+        return len(text)
+
+
+    def write_line(
+        self,
+        text: str,
+    ) -> None:
+        self.__chunks.append(text)
+        self.__chunks.append('\n')
+        self.__size += len(text) + 1
+
+        if self.__size >= self.__buffer_size:
+            self.flush()
+
+
+    @staticmethod
+    def wrap(
+        output: TextIO,
+    ) -> ForwardRef('OutputSink'):
+        if isinstance(output, OutputSink):
+            return output
+
+        return OutputSink(output)
+
+
+class MemorySink(OutputSink):
+    # Lifecycle methods
+
+    def __init__(
+        self,
+    ) -> None:
+        super().__init__()
+
+        self.__captured = []
+
+
+    # Public methods
+
+    def flush(
+        self,
+    ) -> None:
+        text = self.drain()
+
+        if len(text) != 0:
+            self.__captured.append(text)
+
+
+    def getvalue(
+        self,
+    ) -> str:
+        self.flush()
+
+        return ''.join(self.__captured)
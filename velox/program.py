@@ -0,0 +1,46 @@
+from typing import Optional
+
+from error_reporter import ErrorReporter
+from resolver import Resolver
+from scanner import Scanner
+import stmt as Stmt
+from type_inference import TypeInference
+from velox_parser import Parser
+
+
+class Program:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        statements: list[Stmt.Stmt],
+    ) -> None:
+        self.statements = statements
+
+
+    # Public methods
+
+    @staticmethod
+    def compile(
+        source: str,
+        reporter: ErrorReporter,
+        lazy_functions: bool = False,
+    ) -> Optional['Program']:
+        scanner = Scanner(source, reporter)
+        tokens = scanner.scan_tokens()
+
+        parser = Parser(tokens, reporter, lazy_functions)
+        statements = parser.parse()
+
+        if reporter.had_error:
+            return None
+
+        resolver = Resolver(reporter)
+        resolver.resolve(*statements)
+
+        if reporter.had_error:
+            return None
+
+        TypeInference().infer(*statements)
+
+        return Program(statements)
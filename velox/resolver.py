@@ -1,12 +1,15 @@
 from typing import Any, Union
 
+from binding import Binding
 from class_type import ClassType
+from counted_loop import CountedLoop
 from error_reporter import ErrorReporter
 import expr as Expr
 from function_type import FunctionType
-from interpreter import Interpreter
 import stmt as Stmt
-from token import Token
+from type_inference import TypeInference
+from velox_parser import LazyBody
+from velox_token import Token
 
 
 class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
@@ -14,13 +17,17 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
 
     def __init__(
         self,
-        interpreter: Interpreter,
+        reporter: ErrorReporter,
     ) -> None:
-        self.__interpreter = interpreter
+        self.__reporter = reporter
 
         self.__current_class = ClassType.NONE
+        self.__current_declaration = None
         self.__current_function = FunctionType.NONE
+        self.__function_scope = 0
+        self.__in_generator = False
         self.__scopes = []
+        self.__captured = []
 
 
     # Public methods
@@ -39,7 +46,10 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
     ) -> None:
         self.resolve(expr.value)
 
-        self.__resolve_local(expr, expr.name)
+        expr.binding = self.__resolve_local(expr, expr.name)
+
+        if expr.binding != None:
+            expr.binding.writes += 1
 
 
     def visit_ExprBinary(
@@ -75,6 +85,16 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         self.resolve(expr.expression)
 
 
+    def visit_ExprInvoke(
+        self,
+        expr: Expr.ExprInvoke,
+    ) -> None:
+        self.resolve(expr.object)
+
+        for argument in expr.arguments:
+            self.resolve(argument)
+
+
     def visit_ExprLiteral(
         self,
         expr: Expr.ExprLiteral,
@@ -105,9 +125,9 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         expr: Expr.ExprSuper,
     ) -> None:
         if self.__current_class == ClassType.NONE:
-            ErrorReporter.error(expr.keyword, 'Can\'t use \'super\' outside of a class.')
+            self.__reporter.error(expr.keyword, 'Can\'t use \'super\' outside of a class.')
         elif self.__current_class != ClassType.SUBCLASS:
-            ErrorReporter.error(expr.keyword, 'Can\'t use \'super\' in a class with no superclass.')
+            self.__reporter.error(expr.keyword, 'Can\'t use \'super\' in a class with no superclass.')
 
 
         self.__resolve_local(expr, expr.keyword)
@@ -118,7 +138,7 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         expr: Expr.ExprThis,
     ) -> None:
         if self.__current_class == ClassType.NONE:
-            ErrorReporter.error(expr.keyword, 'Can\'t use \'this\' outside of a class.')
+            self.__reporter.error(expr.keyword, 'Can\'t use \'this\' outside of a class.')
 
         self.__resolve_local(expr, expr.keyword)
 
@@ -134,21 +154,36 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         self,
         expr: Expr.ExprVariable,
     ) -> None:
-        if len(self.__scopes) != 0 and self.__scopes[-1].get(expr.name.lexeme) == False:
-            ErrorReporter.error(expr.name, 'Can\'t read local variable in it\'s own initializer.')
+        if len(self.__scopes) != 0:
+            binding = self.__scopes[-1].get(expr.name.lexeme)
+
+            if binding != None and not binding.defined:
+                self.__reporter.error(expr.name, 'Can\'t read local variable in it\'s own initializer.')
 
-        self.__resolve_local(expr, expr.name)
+        expr.binding = self.__resolve_local(expr, expr.name)
+
+        if expr.binding != None:
+            expr.binding.reads += 1
 
 
     def visit_StmtBlock(
         self,
         stmt: Stmt.StmtBlock,
     ) -> None:
+        stmt.flat = not any(
+            isinstance(statement, (Stmt.StmtClass, Stmt.StmtFunction, Stmt.StmtImport, Stmt.StmtVar))
+            for statement in stmt.statements
+        )
+
+        if stmt.flat:
+            self.resolve(*stmt.statements)
+            return
+
         self.__begin_scope()
 
         self.resolve(*stmt.statements)
 
-        self.__end_scope()
+        stmt.reusable = not self.__end_scope()
 
 
     def visit_StmtClass(
@@ -164,7 +199,7 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
 
         if stmt.superclass != None:
             if stmt.name.lexeme == stmt.superclass.name.lexeme:
-                ErrorReporter.error(stmt.superclass.name, 'A class can\'t inherit from itself.')
+                self.__reporter.error(stmt.superclass.name, 'A class can\'t inherit from itself.')
 
             self.__current_class = ClassType.SUBCLASS
 
@@ -172,11 +207,7 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
 
             self.__begin_scope()
 
-            self.__scopes[-1]['super'] = True
-
-        self.__begin_scope()
-
-        self.__scopes[-1]['this'] = True
+            self.__scopes[-1]['super'] = Binding('super', True)
 
         for method in stmt.methods:
             declaration = FunctionType.METHOD
@@ -186,8 +217,6 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
 
             self.__resolve_function(method, declaration)
 
-        self.__end_scope()
-
         if stmt.superclass != None:
             self.__end_scope()
 
@@ -201,6 +230,60 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         self.resolve(stmt.expression)
 
 
+    def visit_StmtFor(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> None:
+        stmt.function = self.__current_declaration
+
+        scoped = isinstance(stmt.initializer, Stmt.StmtVar)
+
+        if scoped:
+            self.__begin_scope()
+
+        if stmt.initializer != None:
+            self.resolve(stmt.initializer)
+
+        self.resolve(stmt.condition)
+
+        if stmt.increment != None:
+            self.resolve(stmt.increment)
+
+        counted = CountedLoop.match(stmt)
+
+        if counted != None:
+            reads, writes = counted.counter.reads, Resolver.__writes(counted)
+
+        self.resolve(stmt.body)
+
+        if counted != None and Resolver.__writes(counted) == writes:
+            counted.read = counted.counter.reads != reads
+
+            stmt.counted = counted
+
+        if scoped:
+            self.__end_scope()
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: Stmt.StmtForIn,
+    ) -> None:
+        stmt.function = self.__current_declaration
+
+        self.resolve(stmt.iterable)
+
+        self.__begin_scope()
+
+        stmt.binding = self.__declare(stmt.name)
+
+        self.__define(stmt.name)
+
+        self.resolve(stmt.body)
+
+        stmt.reusable = not self.__end_scope()
+
+
     def visit_StmtFunction(
         self,
         stmt: Stmt.StmtFunction,
@@ -224,6 +307,15 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
              self.resolve(stmt.else_branch)
 
 
+    def visit_StmtImport(
+        self,
+        stmt: Stmt.StmtImport,
+    ) -> None:
+        stmt.binding = self.__declare(stmt.name)
+
+        self.__define(stmt.name)
+
+
     def visit_StmtPrint(
         self,
         stmt: Stmt.StmtPrint,
@@ -236,11 +328,14 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         stmt: Stmt.StmtReturn,
     ) -> None:
         if self.__current_function == FunctionType.NONE:
-            ErrorReporter.error(stmt.keyword, 'Can\'t return from top-level code.')
+            self.__reporter.error(stmt.keyword, 'Can\'t return from top-level code.')
 
         if stmt.value != None:
             if self.__current_function == FunctionType.INITIALIZER:
-                ErrorReporter.error(stmt.keyword, 'Can\'t return a value from an initializer.')
+                self.__reporter.error(stmt.keyword, 'Can\'t return a value from an initializer.')
+
+            if self.__in_generator:
+                self.__reporter.error(stmt.keyword, 'Can\'t return a value from a generator.')
 
             self.resolve(stmt.value)
 
@@ -249,7 +344,7 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         self,
         stmt: Stmt.StmtVar,
     ) -> None:
-        self.__declare(stmt.name)
+        stmt.binding = self.__declare(stmt.name)
 
         if stmt.initializer != None:
             self.resolve(stmt.initializer)
@@ -261,32 +356,86 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         self,
         stmt: Stmt.StmtWhile,
     ) -> None:
+        stmt.function = self.__current_declaration
+
         self.resolve(stmt.condition)
 
         self.resolve(stmt.body)
 
 
+    def visit_StmtYield(
+        self,
+        stmt: Stmt.StmtYield,
+    ) -> None:
+        if self.__current_function == FunctionType.NONE:
+            self.__reporter.error(stmt.keyword, 'Can\'t yield from top-level code.')
+
+        if self.__current_function == FunctionType.INITIALIZER:
+            self.__reporter.error(stmt.keyword, 'Can\'t yield from an initializer.')
+
+        if stmt.value != None:
+            self.resolve(stmt.value)
+
+
     # Private methods
 
     def __begin_scope(
         self,
     ) -> None:
         self.__scopes.append({})
+        self.__captured.append(False)
 
 
     def __declare(
         self,
         name: Token,
-    ) -> None:
+    ) -> Binding:
         if len(self.__scopes) == 0:
-            return
+            return None
 
         scope = self.__scopes[-1]
 
         if name in scope:
-            ErrorReporter.error(name, 'Already a variable with this name in this scope.')
+            self.__reporter.error(name, 'Already a variable with this name in this scope.')
+
+        binding = scope.get(name.lexeme)
+
+        if binding == None:
+            binding = scope[name.lexeme] = Binding(name.lexeme)
+
+        binding.defined = False
+
+        return binding
+
+
+    def __defer_function(
+        self,
+        function: Stmt.StmtFunction,
+        type: FunctionType,
+    ) -> None:
+        scopes = [dict(scope) for scope in self.__scopes]
+        current_class = self.__current_class
+
+        self.__captured = [True] * len(self.__captured)
+
+        for scope in self.__scopes:
+            for binding in scope.values():
+                binding.captured = True
+
+        def resolve(
+            body: list[Stmt.Stmt],
+            reporter: ErrorReporter,
+        ) -> None:
+            resolver = Resolver(reporter)
+            resolver.__scopes = scopes
+            resolver.__captured = [True] * len(scopes)
+            resolver.__current_class = current_class
+
+            resolver.__resolve_body(function, type, body)
+
+            TypeInference().infer(*body)
 
-        scope[name.lexeme] = False
+        function.body.defer(resolve)
 
 
     def __define(
@@ -296,42 +445,103 @@ class Resolver(Expr.Visitor[None], Stmt.Visitor[None]):
         if len(self.__scopes) == 0:
             return
 
-        self.__scopes[-1][name.lexeme] = True
+        self.__scopes[-1][name.lexeme].defined = True
 
 
     def __end_scope(
         self,
-    ) -> None:
+    ) -> bool:
         self.__scopes.pop()
 
+        return self.__captured.pop()
 
-    def __resolve_function(
+
+    def __resolve_body(
         self,
         function: Stmt.StmtFunction,
         type: FunctionType,
+        body: list[Stmt.Stmt],
     ) -> None:
+        enclosing_declaration = self.__current_declaration
+        self.__current_declaration = function
+
         enclosing_function = self.__current_function
         self.__current_function = type
 
+        enclosing_generator = self.__in_generator
+        self.__in_generator = function.is_generator
+
+        enclosing_scope = self.__function_scope
+        self.__function_scope = len(self.__scopes)
+
         self.__begin_scope()
 
+        if type in (FunctionType.METHOD, FunctionType.INITIALIZER):
+            self.__scopes[-1]['this'] = Binding('this', True)
+
         for param in function.params:
             self.__declare(param)
 
             self.__define(param)
 
-        self.resolve(*function.body)
+        self.resolve(*body)
 
         self.__end_scope()
 
+        self.__current_declaration = enclosing_declaration
         self.__current_function = enclosing_function
+        self.__in_generator = enclosing_generator
+        self.__function_scope = enclosing_scope
+
+
+    def __resolve_function(
+        self,
+        function: Stmt.StmtFunction,
+        type: FunctionType,
+    ) -> None:
+        function.names = tuple(param.lexeme for param in function.params)
+
+        if isinstance(function.body, LazyBody) and not function.body.is_parsed():
+            self.__defer_function(function, type)
+            return
+
+        body = function.body
+
+        if isinstance(body, LazyBody):
+            body = body.parse(self.__reporter)
+
+        self.__resolve_body(function, type, body)
 
 
     def __resolve_local(
         self,
         expr: Expr.Expr,
         name: Token,
-    ) -> None:
+    ) -> Binding:
         for i, scope in enumerate(self.__scopes[::-1]):
             if name.lexeme in scope:
-                self.__interpreter.resolve(expr, i)
+                expr.depth = i
+
+                binding = scope[name.lexeme]
+                index = len(self.__scopes) - 1 - i
+
+                if index < self.__function_scope:
+                    binding.captured = True
+
+                    self.__captured[index] = True
+
+                return binding
+
+        return None
+
+
+    @staticmethod
+    def __writes(
+        counted: CountedLoop,
+    ) -> int:
+        writes = counted.counter.writes
+
+        if isinstance(counted.limit, Expr.ExprVariable):
+            writes += counted.limit.binding.writes
+
+        return writes
@@ -1,4 +1,4 @@
-from token import Token
+from velox_token import Token
 
 
 class RuntimeError(Exception):
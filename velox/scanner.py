@@ -1,8 +1,9 @@
+import sys
 from typing import Any
 
 from error_reporter import ErrorReporter
-from token import Token
 from token_type import TokenType
+from velox_token import Token
 
 
 class Scanner:
@@ -14,6 +15,8 @@ class Scanner:
         'fun': TokenType.FUN,
         'for': TokenType.FOR,
         'if': TokenType.IF,
+        'import': TokenType.IMPORT,
+        'in': TokenType.IN,
         'nil': TokenType.NIL,
         'or': TokenType.OR,
         'print': TokenType.PRINT,
@@ -23,6 +26,7 @@ class Scanner:
         'true': TokenType.TRUE,
         'var': TokenType.VAR,
         'while': TokenType.WHILE,
+        'yield': TokenType.YIELD,
     }
 
 
@@ -30,9 +34,11 @@ class Scanner:
 
     def __init__(
         self,
-        source: str
+        source: str,
+        reporter: ErrorReporter,
     ) -> None:
         self.__source = source
+        self.__reporter = reporter
         self.__start = 0
         self.__current = 0
         self.__line = 1
@@ -95,11 +101,11 @@ class Scanner:
         while self.__is_alpha_numeric(self.__peek()):
             self.__advance()
 
-        value = self.__source[self.__start: self.__current]
+        value = sys.intern(self.__source[self.__start: self.__current])
 
         token_type = self.KEYWORDS.get(value, TokenType.IDENTIFIER)
 
-        self.__add_token(token_type)
+        self.__tokens.append(Token(token_type, value, None, self.__line))
 
 
     def __is_alpha(
@@ -158,10 +164,10 @@ class Scanner:
     def __peek_next(
         self,
     ) -> str:
-        if self.__current + 1 > len(self.__source):
+        if self.__current + 1 >= len(self.__source):
             return '\0'
 
-        return self.__source[self.__current]
+        return self.__source[self.__current + 1]
 
 
     def __scan_token(
@@ -230,7 +236,7 @@ class Scanner:
         elif self.__is_alpha(c):
             self.__identifier()
         else:
-            ErrorReporter.error(self.__line, 'Unexpected character.')
+            self.__reporter.error(self.__line, 'Unexpected character.')
 
 
     def __string(
@@ -243,7 +249,7 @@ class Scanner:
             self.__advance()
 
         if self.__is_at_end():
-            ErrorReporter.error(self.__line, 'Unterminated string.')
+            self.__reporter.error(self.__line, 'Unterminated string.')
 
         self.__advance()
 
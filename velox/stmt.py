@@ -1,13 +1,16 @@
 from typing import Any, ForwardRef, Generic, TypeVar
 
+from counted_loop import CountedLoop
 from expr import Expr, ExprVariable
-from token import Token
+from velox_token import Token
 
 
 T = TypeVar('T')
 
 
 class Stmt:
+    fields = ()
+
     # Public methods
 
     def accept(
@@ -17,6 +20,8 @@ class Stmt:
 
 
 class StmtBlock(Stmt):
+    fields = ('statements',)
+
     # Lifecycle methods
 
     def __init__(
@@ -25,6 +30,9 @@ class StmtBlock(Stmt):
     ) -> None:
         self.statements = statements
 
+        self.flat: bool = None
+        self.reusable: bool = None
+
 
     # Public methods
 
@@ -36,6 +44,8 @@ class StmtBlock(Stmt):
 
 
 class StmtClass(Stmt):
+    fields = ('name', 'superclass', 'methods')
+
     # Lifecycle methods
 
     def __init__(
@@ -59,6 +69,8 @@ class StmtClass(Stmt):
 
 
 class StmtExpression(Stmt):
+    fields = ('expression',)
+
     # Lifecycle methods
 
     def __init__(
@@ -77,7 +89,83 @@ class StmtExpression(Stmt):
         return visitor.visit_StmtExpression(self)
 
 
+class StmtFor(Stmt):
+    fields = ('keyword', 'initializer', 'condition', 'increment', 'body')
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        keyword: Token,
+        initializer: Stmt,
+        condition: Expr,
+        increment: Expr,
+        body: Stmt,
+    ) -> None:
+        self.keyword = keyword
+        self.initializer = initializer
+        self.condition = condition
+        self.increment = increment
+        self.body = body
+
+        self.heat: int = 0
+        self.counted: CountedLoop = None
+        self.function: StmtFunction = None
+        self.compiled: Callable = None
+        self.resume: Callable = None
+
+
+    def __getstate__(
+        self,
+    ) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state['compiled'] = None
+        state['resume'] = None
+
+        return state
+
+
+    # Public methods
+
+    def accept(
+        self,
+        visitor: ForwardRef('Visitor[T]'),
+    ) -> T:
+        return visitor.visit_StmtFor(self)
+
+
+class StmtForIn(Stmt):
+    fields = ('name', 'iterable', 'body')
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: Token,
+        iterable: Expr,
+        body: Stmt,
+    ) -> None:
+        self.name = name
+        self.iterable = iterable
+        self.body = body
+
+        self.reusable: bool = None
+        self.binding: Binding = None
+        self.function: StmtFunction = None
+
+
+    # Public methods
+
+    def accept(
+        self,
+        visitor: ForwardRef('Visitor[T]'),
+    ) -> T:
+        return visitor.visit_StmtForIn(self)
+
+
 class StmtFunction(Stmt):
+    fields = ('name', 'params', 'body', 'is_generator')
+
     # Lifecycle methods
 
     def __init__(
@@ -85,10 +173,25 @@ class StmtFunction(Stmt):
         name: Token,
         params: list[Token],
         body: list[Stmt],
+        is_generator: bool,
     ) -> None:
         self.name = name
         self.params = params
         self.body = body
+        self.is_generator = is_generator
+
+        self.names: tuple = None
+        self.heat: int = 0
+        self.compiled: Callable = None
+
+
+    def __getstate__(
+        self,
+    ) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state['compiled'] = None
+
+        return state
 
 
     # Public methods
@@ -101,6 +204,8 @@ class StmtFunction(Stmt):
 
 
 class StmtIf(Stmt):
+    fields = ('condition', 'then_branch', 'else_branch')
+
     # Lifecycle methods
 
     def __init__(
@@ -123,13 +228,42 @@ class StmtIf(Stmt):
         return visitor.visit_StmtIf(self)
 
 
+class StmtImport(Stmt):
+    fields = ('keyword', 'name')
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        keyword: Token,
+        name: Token,
+    ) -> None:
+        self.keyword = keyword
+        self.name = name
+
+        self.binding: Binding = None
+
+
+    # Public methods
+
+    def accept(
+        self,
+        visitor: ForwardRef('Visitor[T]'),
+    ) -> T:
+        return visitor.visit_StmtImport(self)
+
+
 class StmtPrint(Stmt):
+    fields = ('keyword', 'expression')
+
     # Lifecycle methods
 
     def __init__(
         self,
+        keyword: Token,
         expression: Expr,
     ) -> None:
+        self.keyword = keyword
         self.expression = expression
 
 
@@ -143,6 +277,8 @@ class StmtPrint(Stmt):
 
 
 class StmtReturn(Stmt):
+    fields = ('keyword', 'value')
+
     # Lifecycle methods
 
     def __init__(
@@ -164,6 +300,8 @@ class StmtReturn(Stmt):
 
 
 class StmtVar(Stmt):
+    fields = ('name', 'initializer')
+
     # Lifecycle methods
 
     def __init__(
@@ -174,6 +312,8 @@ class StmtVar(Stmt):
         self.name = name
         self.initializer = initializer
 
+        self.binding: Binding = None
+
 
     # Public methods
 
@@ -185,16 +325,33 @@ class StmtVar(Stmt):
 
 
 class StmtWhile(Stmt):
+    fields = ('keyword', 'condition', 'body')
+
     # Lifecycle methods
 
     def __init__(
         self,
+        keyword: Token,
         condition: Expr,
         body: Stmt,
     ) -> None:
+        self.keyword = keyword
         self.condition = condition
         self.body = body
 
+        self.heat: int = 0
+        self.function: StmtFunction = None
+        self.compiled: Callable = None
+
+
+    def __getstate__(
+        self,
+    ) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state['compiled'] = None
+
+        return state
+
 
     # Public methods
 
@@ -205,6 +362,29 @@ class StmtWhile(Stmt):
         return visitor.visit_StmtWhile(self)
 
 
+class StmtYield(Stmt):
+    fields = ('keyword', 'value')
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        keyword: Token,
+        value: Expr,
+    ) -> None:
+        self.keyword = keyword
+        self.value = value
+
+
+    # Public methods
+
+    def accept(
+        self,
+        visitor: ForwardRef('Visitor[T]'),
+    ) -> T:
+        return visitor.visit_StmtYield(self)
+
+
 class Visitor(Generic[T]):
     # Public methods
 
@@ -229,6 +409,20 @@ class Visitor(Generic[T]):
         pass
 
 
+    def visit_StmtFor(
+        self,
+        stmt: StmtFor,
+    ) -> T:
+        pass
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: StmtForIn,
+    ) -> T:
+        pass
+
+
     def visit_StmtFunction(
         self,
         stmt: StmtFunction,
@@ -243,6 +437,13 @@ class Visitor(Generic[T]):
         pass
 
 
+    def visit_StmtImport(
+        self,
+        stmt: StmtImport,
+    ) -> T:
+        pass
+
+
     def visit_StmtPrint(
         self,
         stmt: StmtPrint,
@@ -271,3 +472,10 @@ class Visitor(Generic[T]):
         pass
 
 
+    def visit_StmtYield(
+        self,
+        stmt: StmtYield,
+    ) -> T:
+        pass
+
+
@@ -45,6 +45,8 @@ class TokenType(Enum):
     FUN = auto()
     FOR = auto()
     IF = auto()
+    IMPORT = auto()
+    IN = auto()
     NIL = auto()
     OR = auto()
     PRINT = auto()
@@ -54,5 +56,6 @@ class TokenType(Enum):
     TRUE = auto()
     VAR = auto()
     WHILE = auto()
+    YIELD = auto()
 
     EOF = auto()
@@ -0,0 +1,416 @@
+import operator
+from typing import Callable, Union
+
+from binding import Binding
+import expr as Expr
+import stmt as Stmt
+from token_type import TokenType
+from value_type import ValueType
+from velox_parser import LazyBody
+
+
+class TypeInference(Expr.Visitor[ValueType], Stmt.Visitor[None]):
+    ARITHMETIC = {
+        TokenType.MINUS: operator.sub,
+        TokenType.PLUS: operator.add,
+        TokenType.SLASH: operator.truediv,
+        TokenType.STAR: operator.mul,
+    }
+    COMPARISON = {
+        TokenType.BANG_EQUAL: operator.ne,
+        TokenType.EQUAL_EQUAL: operator.eq,
+        TokenType.GREATER: operator.gt,
+        TokenType.GREATER_EQUAL: operator.ge,
+        TokenType.LESS: operator.lt,
+        TokenType.LESS_EQUAL: operator.le,
+    }
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+    ) -> None:
+        self.__types = {}
+
+
+    # Public methods
+
+    def infer(
+        self,
+        *statements: list[Union[Expr.Expr, Stmt.Stmt]],
+    ) -> None:
+        for statement in statements:
+            statement.accept(self)
+
+
+    def visit_ExprAssign(
+        self,
+        expr: Expr.ExprAssign,
+    ) -> ValueType:
+        type = self.__infer(expr.value)
+
+        self.__set(expr.binding, type)
+
+        return type
+
+
+    def visit_ExprBinary(
+        self,
+        expr: Expr.ExprBinary,
+    ) -> ValueType:
+        left = self.__infer(expr.left)
+        right = self.__infer(expr.right)
+
+        numeric = left == ValueType.NUMBER and right == ValueType.NUMBER
+        operator_type = expr.operator.type
+
+        if operator_type in TypeInference.COMPARISON:
+            expr.numeric = TypeInference.COMPARISON[operator_type] if numeric else None
+
+            return ValueType.BOOLEAN
+
+        expr.numeric = TypeInference.ARITHMETIC[operator_type] if numeric else None
+
+        if operator_type != TokenType.PLUS:
+            return ValueType.NUMBER
+
+        if ValueType.STRING in (left, right):
+            return ValueType.STRING
+
+        if ValueType.NUMBER in (left, right):
+            return ValueType.NUMBER
+
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprCall(
+        self,
+        expr: Expr.ExprCall,
+    ) -> ValueType:
+        self.__infer(expr.callee)
+
+        for argument in expr.arguments:
+            self.__infer(argument)
+
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprGet(
+        self,
+        expr: Expr.ExprGet,
+    ) -> ValueType:
+        self.__infer(expr.object)
+
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprGrouping(
+        self,
+        expr: Expr.ExprGrouping,
+    ) -> ValueType:
+        return self.__infer(expr.expression)
+
+
+    def visit_ExprInvoke(
+        self,
+        expr: Expr.ExprInvoke,
+    ) -> ValueType:
+        self.__infer(expr.object)
+
+        for argument in expr.arguments:
+            self.__infer(argument)
+
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprLiteral(
+        self,
+        expr: Expr.ExprLiteral,
+    ) -> ValueType:
+        if expr.value == None:
+            return ValueType.NIL
+
+        if isinstance(expr.value, bool):
+            return ValueType.BOOLEAN
+
+        if isinstance(expr.value, float):
+            return ValueType.NUMBER
+
+        if isinstance(expr.value, str):
+            return ValueType.STRING
+
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprLogical(
+        self,
+        expr: Expr.ExprLogical,
+    ) -> ValueType:
+        left = self.__infer(expr.left)
+
+        types = dict(self.__types)
+
+        right = self.__infer(expr.right)
+
+        self.__types = TypeInference.__join(types, self.__types)
+
+        return left if left == right else ValueType.UNKNOWN
+
+
+    def visit_ExprSet(
+        self,
+        expr: Expr.ExprSet,
+    ) -> ValueType:
+        self.__infer(expr.object)
+
+        return self.__infer(expr.value)
+
+
+    def visit_ExprSuper(
+        self,
+        expr: Expr.ExprSuper,
+    ) -> ValueType:
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprThis(
+        self,
+        expr: Expr.ExprThis,
+    ) -> ValueType:
+        return ValueType.UNKNOWN
+
+
+    def visit_ExprUnary(
+        self,
+        expr: Expr.ExprUnary,
+    ) -> ValueType:
+        right = self.__infer(expr.right)
+
+        if expr.operator.type == TokenType.BANG:
+            expr.numeric = False
+
+            return ValueType.BOOLEAN
+
+        expr.numeric = right == ValueType.NUMBER
+
+        return ValueType.NUMBER
+
+
+    def visit_ExprVariable(
+        self,
+        expr: Expr.ExprVariable,
+    ) -> ValueType:
+        return self.__types.get(expr.binding, ValueType.UNKNOWN)
+
+
+    def visit_StmtBlock(
+        self,
+        stmt: Stmt.StmtBlock,
+    ) -> None:
+        self.infer(*stmt.statements)
+
+
+    def visit_StmtClass(
+        self,
+        stmt: Stmt.StmtClass,
+    ) -> None:
+        for method in stmt.methods:
+            self.__infer_function(method)
+
+
+    def visit_StmtExpression(
+        self,
+        stmt: Stmt.StmtExpression,
+    ) -> None:
+        self.__infer(stmt.expression)
+
+
+    def visit_StmtFor(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> None:
+        if stmt.initializer != None:
+            self.infer(stmt.initializer)
+
+        def condition() -> None:
+            self.__infer(stmt.condition)
+
+        def body() -> None:
+            self.infer(stmt.body)
+
+            if stmt.increment != None:
+                self.__infer(stmt.increment)
+
+        self.__loop(condition, body)
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: Stmt.StmtForIn,
+    ) -> None:
+        self.__infer(stmt.iterable)
+
+        def iterate() -> None:
+            self.__set(stmt.binding, ValueType.UNKNOWN)
+
+        def body() -> None:
+            self.infer(stmt.body)
+
+        self.__loop(iterate, body)
+
+
+    def visit_StmtFunction(
+        self,
+        stmt: Stmt.StmtFunction,
+    ) -> None:
+        self.__infer_function(stmt)
+
+
+    def visit_StmtIf(
+        self,
+        stmt: Stmt.StmtIf,
+    ) -> None:
+        self.__infer(stmt.condition)
+
+        types = dict(self.__types)
+
+        self.infer(stmt.then_branch)
+
+        then_types, self.__types = self.__types, types
+
+        if stmt.else_branch != None:
+            self.infer(stmt.else_branch)
+
+        self.__types = TypeInference.__join(then_types, self.__types)
+
+
+    def visit_StmtImport(
+        self,
+        stmt: Stmt.StmtImport,
+    ) -> None:
+        self.__set(stmt.binding, ValueType.UNKNOWN)
+
+
+    def visit_StmtPrint(
+        self,
+        stmt: Stmt.StmtPrint,
+    ) -> None:
+        self.__infer(stmt.expression)
+
+
+    def visit_StmtReturn(
+        self,
+        stmt: Stmt.StmtReturn,
+    ) -> None:
+        if stmt.value != None:
+            self.__infer(stmt.value)
+
+
+    def visit_StmtVar(
+        self,
+        stmt: Stmt.StmtVar,
+    ) -> None:
+        type = ValueType.NIL
+
+        if stmt.initializer != None:
+            type = self.__infer(stmt.initializer)
+
+        self.__set(stmt.binding, type)
+
+
+    def visit_StmtWhile(
+        self,
+        stmt: Stmt.StmtWhile,
+    ) -> None:
+        def condition() -> None:
+            self.__infer(stmt.condition)
+
+        def body() -> None:
+            self.infer(stmt.body)
+
+        self.__loop(condition, body)
+
+
+    def visit_StmtYield(
+        self,
+        stmt: Stmt.StmtYield,
+    ) -> None:
+        if stmt.value != None:
+            self.__infer(stmt.value)
+
+
+    # Private methods
+
+    def __infer(
+        self,
+        expr: Expr.Expr,
+    ) -> ValueType:
+        return expr.accept(self)
+
+
+    def __infer_function(
+        self,
+        function: Stmt.StmtFunction,
+    ) -> None:
+        body = function.body
+
+        if isinstance(body, LazyBody):
+            if not body.is_parsed():
+                return
+
+            body = body.parse(None)
+
+        enclosing_types = self.__types
+        self.__types = {}
+
+        self.infer(*body)
+
+        self.__types = enclosing_types
+
+
+    @staticmethod
+    def __join(
+        left: dict[Binding, ValueType],
+        right: dict[Binding, ValueType],
+    ) -> dict[Binding, ValueType]:
+        return {
+            binding: type for binding, type in left.items() if right.get(binding) == type
+        }
+
+
+    def __loop(
+        self,
+        head: Callable[[], None],
+        body: Callable[[], None],
+    ) -> None:
+        while True:
+            entry = dict(self.__types)
+
+            head()
+
+            exit = dict(self.__types)
+
+            body()
+
+            types = TypeInference.__join(entry, self.__types)
+
+            if types == entry:
+                self.__types = exit
+                return
+
+            self.__types = types
+
+
+    def __set(
+        self,
+        binding: Binding,
+        type: ValueType,
+    ) -> None:
+        if binding == None or binding.captured:
+            return
+
+        if type == ValueType.UNKNOWN:
+            self.__types.pop(binding, None)
+        else:
+            self.__types[binding] = type
@@ -0,0 +1,9 @@
+from enum import Enum, auto
+
+
+class ValueType(Enum):
+    UNKNOWN = auto()
+    BOOLEAN = auto()
+    NIL = auto()
+    NUMBER = auto()
+    STRING = auto()
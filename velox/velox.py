@@ -1,77 +1,262 @@
+import argparse
+import atexit
+import os
+import pickle
 import sys
+from typing import TextIO
 
+from debugger import Debugger
 from error_reporter import ErrorReporter
+from execution_limits import ExecutionLimits
+from heap_snapshot import HeapSnapshot
 from interpreter import Interpreter
-from resolver import Resolver
-from velox_parser import Parser
-from scanner import Scanner
+from output_sink import OutputSink
+from program import Program
 
 
 class Velox:
-    __interpreter: Interpreter = Interpreter()
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        lazy_functions: bool = False,
+        output: TextIO = None,
+    ) -> None:
+        self.lazy_functions = lazy_functions
+
+        self.output = OutputSink.wrap(output)
+
+        self.reporter = ErrorReporter(self.output)
+        self.interpreter = Interpreter(self.reporter, self.output)
 
 
     # Public methods
 
-    @staticmethod
-    def run_file(
+    def debug_file(
+        self,
+        path: str,
+        breakpoints: list[int] = (),
+    ) -> int:
+        source = self.__read(path)
+
+        if source == None:
+            return 66
+
+        self.interpreter.directory = os.path.dirname(os.path.abspath(path))
+
+        self.reporter.had_error = False
+        self.reporter.had_runtime_error = False
+
+        try:
+            program = Program.compile(source, self.reporter)
+
+            if program != None:
+                Debugger(self.interpreter, source).run(program.statements, breakpoints)
+        finally:
+            self.output.flush()
+
+        return self.__exit_code()
+
+
+    def execute_file(
+        self,
+        path: str,
+    ) -> int:
+        source = self.__read(path)
+
+        if source == None:
+            return 66
+
+        self.interpreter.directory = os.path.dirname(os.path.abspath(path))
+
+        return self.execute_source(source)
+
+
+    def execute_source(
+        self,
+        source: str,
+    ) -> int:
+        self.reporter.had_error = False
+        self.reporter.had_runtime_error = False
+
+        try:
+            self.__run(source)
+        finally:
+            self.output.flush()
+
+        return self.__exit_code()
+
+
+    def load_snapshot(
+        self,
         path: str,
     ) -> None:
-        with open(path, 'r') as in_file:
-            source = in_file.read()
+        HeapSnapshot.load(self.interpreter, path)
+
 
-            Velox.__run(source)
+    def run_file(
+        self,
+        path: str,
+    ) -> None:
+        exit_code = self.execute_file(path)
 
-            if ErrorReporter.had_error:
-                sys.exit(65)
-            elif ErrorReporter.had_runtime_error:
-                sys.exit(70)
+        if exit_code != 0:
+            sys.exit(exit_code)
 
 
-    @staticmethod
-    def run_prompt() -> None:
+    def run_prompt(
+        self,
+    ) -> None:
         try:
             while True:
                 line = input('> ')
 
-                Velox.__run(line)
+                self.__run(line)
+
+                self.output.flush()
 
-                ErrorReporter.had_error = False
+                self.reporter.had_error = False
         except EOFError:
             pass
 
 
+    def save_snapshot(
+        self,
+        path: str,
+    ) -> None:
+        HeapSnapshot.save(self.interpreter, path)
+
+
     # Private methods
 
-    @staticmethod
+    def __exit_code(
+        self,
+    ) -> int:
+        if self.reporter.had_error:
+            return 65
+        elif self.reporter.had_runtime_error:
+            return 70
+
+        return 0
+
+
+    def __read(
+        self,
+        path: str,
+    ) -> str:
+        try:
+            with open(path, 'r') as in_file:
+                return in_file.read()
+        except OSError:
+            print(f'Could not read \'{os.path.abspath(path)}\'.', file=self.output)
+
+            self.output.flush()
+
+            return None
+
+
     def __run(
+        self,
         source: str,
     ) -> None:
-        scanner = Scanner(source)
-        tokens = scanner.scan_tokens()
-
-        parser = Parser(tokens)
-        statements = parser.parse()
+        program = Program.compile(source, self.reporter, self.lazy_functions)
 
-        if ErrorReporter.had_error:
+        if program == None:
             return
 
-        resolver = Resolver(Velox.__interpreter)
-        resolver.resolve(*statements)
+        self.interpreter.interpret(program.statements)
 
-        if ErrorReporter.had_error:
-            return
 
-        Velox.__interpreter.interpret(statements)
+class VeloxArgumentParser(argparse.ArgumentParser):
+    # Public methods
+
+    def error(
+        self,
+        message: str,
+    ) -> None:
+        self.print_usage()
+        sys.exit(64)
 
 
 if __name__ == '__main__':
-    _, *args = sys.argv
+    parser = VeloxArgumentParser(prog='velox')
+    parser.add_argument('scripts', nargs='*', metavar='script')
+    parser.add_argument('--break', type=int, action='append', default=[], dest='breakpoints', metavar='LINE')
+    parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--hot-threshold', type=int, metavar='N')
+    parser.add_argument('--jobs', type=int, metavar='N')
+    parser.add_argument('--lazy', action='store_true')
+    parser.add_argument('--load-snapshot', metavar='PATH')
+    parser.add_argument('--max-call-depth', type=int, metavar='N')
+    parser.add_argument('--max-steps', type=int, metavar='N')
+    parser.add_argument('--profile-allocations', action='store_true')
+    parser.add_argument('--profile-interval', type=float, metavar='SECONDS')
+    parser.add_argument('--save-snapshot', metavar='PATH')
+    parser.add_argument('--timeout', type=float, metavar='SECONDS')
 
-    if len(args) > 1:
-        print('Usage: velox [script]')
-        sys.exit(64)
-    elif len(args) == 1:
-        Velox.run_file(args[0])
+    args = parser.parse_args()
+
+    limits = None
+
+    if args.max_steps != None or args.timeout != None or args.max_call_depth != None:
+        limits = ExecutionLimits(args.max_steps, args.timeout, args.max_call_depth)
+
+    if args.jobs != None or len(args.scripts) > 1:
+        if args.load_snapshot != None or args.save_snapshot != None:
+            parser.error('snapshots need a single script')
+
+        if args.debug or len(args.breakpoints) != 0:
+            parser.error('the debugger needs a single script')
+
+        from batch_runner import BatchRunner
+
+        runner = BatchRunner(max(args.jobs or 1, 1), args.lazy, limits)
+
+        sys.exit(runner.run_and_report(args.scripts))
+
+    profiling = args.profile_allocations or args.profile_interval != None
+
+    if profiling:
+        from allocation_profiler import AllocationProfiler
+
+        profiler = AllocationProfiler()
+        profiler.start(args.profile_interval)
+
+        atexit.register(profiler.report)
+
+    velox = Velox(args.lazy)
+
+    if limits != None:
+        limits.apply(velox.interpreter)
+
+    if profiling:
+        velox.interpreter.hot_threshold = None
+    elif args.hot_threshold != None:
+        velox.interpreter.hot_threshold = args.hot_threshold if args.hot_threshold > 0 else None
+
+    if args.load_snapshot != None:
+        try:
+            velox.load_snapshot(args.load_snapshot)
+        except (AttributeError, ImportError, KeyError, OSError, ValueError, pickle.UnpicklingError) as error:
+            print(f'Could not load snapshot: {error}')
+            sys.exit(66)
+
+    if args.debug or len(args.breakpoints) != 0:
+        if len(args.scripts) != 1:
+            parser.error('the debugger needs a single script')
+
+        exit_code = velox.debug_file(args.scripts[0], args.breakpoints)
+
+        if exit_code != 0:
+            sys.exit(exit_code)
+    elif len(args.scripts) == 1:
+        velox.run_file(args.scripts[0])
     else:
-        Velox.run_prompt()
+        velox.run_prompt()
+
+    if args.save_snapshot != None:
+        try:
+            velox.save_snapshot(args.save_snapshot)
+        except (AttributeError, OSError, RecursionError, TypeError, pickle.PicklingError) as error:
+            print(f'Could not save snapshot: {error}')
+            sys.exit(74)
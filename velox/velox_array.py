@@ -0,0 +1,17 @@
+from array import array
+
+
+class VeloxArray:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        values: array,
+    ) -> None:
+        self.values = values
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<array {len(self.values)}>'
@@ -0,0 +1,97 @@
+import json
+import os
+import socket
+import sys
+from typing import TextIO
+
+
+class VeloxClient:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        socket_path: str = None,
+    ) -> None:
+        self.__socket_path = socket_path or VeloxClient.default_socket_path()
+
+
+    # Public methods
+
+    @staticmethod
+    def default_socket_path(
+    ) -> str:
+        return os.environ.get('VELOX_SOCKET') or f'/tmp/velox-{os.getuid()}.sock'
+
+
+    def run(
+        self,
+        request: dict,
+        output: TextIO,
+    ) -> int:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.__socket_path)
+            connection.sendall(json.dumps(request).encode() + b'\n')
+
+            with connection.makefile('r', encoding='utf-8') as reader:
+                for line in reader:
+                    message = json.loads(line)
+
+                    if 'output' in message:
+                        output.write(message['output'])
+                    elif 'exit_code' in message:
+                        return message['exit_code']
+
+        raise ConnectionError('Daemon closed the connection without an exit code.')
+
+
+    def run_file(
+        self,
+        path: str,
+        lazy_functions: bool = False,
+        output: TextIO = None,
+    ) -> int:
+        return self.run(
+            {
+                'path': os.path.abspath(path),
+                'lazy': lazy_functions,
+            },
+            output or sys.stdout,
+        )
+
+
+    def run_source(
+        self,
+        source: str,
+        lazy_functions: bool = False,
+        output: TextIO = None,
+    ) -> int:
+        return self.run(
+            {
+                'source': source,
+                'lazy': lazy_functions,
+            },
+            output or sys.stdout,
+        )
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    lazy_functions = '--lazy' in arguments
+    scripts = [argument for argument in arguments if argument != '--lazy']
+
+    if len(scripts) == 1 and not scripts[0].startswith('-'):
+        try:
+            exit_code = VeloxClient().run_file(scripts[0], lazy_functions)
+        except (ConnectionRefusedError, FileNotFoundError):
+            exit_code = None
+        except ConnectionError as error:
+            print(f'Lost connection to the daemon: {error}', file=sys.stderr)
+            sys.exit(74)
+
+        if exit_code != None:
+            sys.stdout.flush()
+            sys.exit(exit_code)
+
+    velox = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'velox.py')
+
+    os.execv(sys.executable, [sys.executable, velox, *arguments])
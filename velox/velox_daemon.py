@@ -0,0 +1,256 @@
+import argparse
+import collections
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from typing import BinaryIO, Callable
+
+from error_reporter import ErrorReporter
+from interpreter_pool import InterpreterPool
+from output_sink import OutputSink
+from program import Program
+from velox_client import VeloxClient
+
+
+class ProgramCache:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        capacity: int = 256,
+    ) -> None:
+        self.__capacity = capacity
+        self.__programs = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+
+    # Public methods
+
+    def get(
+        self,
+        key: tuple,
+    ) -> Program:
+        with self.__lock:
+            program = self.__programs.get(key)
+
+            if program != None:
+                self.__programs.move_to_end(key)
+
+            return program
+
+
+    def put(
+        self,
+        key: tuple,
+        program: Program,
+    ) -> None:
+        with self.__lock:
+            self.__programs[key] = program
+
+            if len(self.__programs) > self.__capacity:
+                self.__programs.popitem(last=False)
+
+
+class SocketOutput(OutputSink):
+    FLUSH_INTERVAL = 0.05
+    FLUSH_SIZE = 8192
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        writer: BinaryIO,
+    ) -> None:
+        super().__init__(None, SocketOutput.FLUSH_SIZE)
+
+        self.__writer = writer
+        self.__flushed_at = time.perf_counter()
+
+
+    # Public methods
+
+    def finish(
+        self,
+        exit_code: int,
+    ) -> None:
+        self.flush()
+
+        self.__send({'exit_code': exit_code})
+
+
+    def flush(
+        self,
+    ) -> None:
+        text = self.drain()
+
+        if len(text) != 0:
+            self.__send({'output': text})
+
+        self.__flushed_at = time.perf_counter()
+
+
+    def write(
+        self,
+        text: str,
+    ) -> int:
+        count = super().write(text)
+
+        if time.perf_counter() - self.__flushed_at >= SocketOutput.FLUSH_INTERVAL:
+            self.flush()
+
+        return count
+
+
+    def write_line(
+        self,
+        text: str,
+    ) -> None:
+        super().write_line(text)
+
+        if time.perf_counter() - self.__flushed_at >= SocketOutput.FLUSH_INTERVAL:
+            self.flush()
+
+
+    # Private methods
+
+    def __send(
+        self,
+        message: dict,
+    ) -> None:
+        self.__writer.write(json.dumps(message).encode() + b'\n')
+        self.__writer.flush()
+
+
+class VeloxDaemon:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        socket_path: str,
+        pool_size: int = 4,
+    ) -> None:
+        self.__socket_path = socket_path
+        self.__cache = ProgramCache()
+        self.__pools = {
+            False: InterpreterPool(pool_size),
+            True: InterpreterPool(pool_size, lazy_functions=True),
+        }
+
+
+    # Public methods
+
+    def execute(
+        self,
+        request: dict,
+        output: SocketOutput,
+    ) -> int:
+        pool = self.__pools[bool(request.get('lazy'))]
+
+        if 'path' in request:
+            path = request['path']
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                output.write(f'Could not read \'{path}\'.\n')
+                return 66
+
+            key = (path, stat.st_mtime_ns, stat.st_size, request.get('lazy'))
+            directory = os.path.dirname(path)
+
+            def read() -> str:
+                with open(path, 'r') as in_file:
+                    return in_file.read()
+        else:
+            key = (request.get('source', ''), request.get('lazy'))
+            directory = None
+
+            def read() -> str:
+                return key[0]
+
+        try:
+            program = self.__compile(pool, key, read, output)
+        except OSError:
+            output.write(f'Could not read \'{request["path"]}\'.\n')
+            return 66
+
+        if program == None:
+            return 65
+
+        return pool.run(program, output=output, directory=directory).exit_code
+
+
+    def serve_forever(
+        self,
+    ) -> None:
+        if os.path.exists(self.__socket_path):
+            os.unlink(self.__socket_path)
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(
+                self,
+            ) -> None:
+                output = SocketOutput(self.wfile)
+
+                try:
+                    exit_code = daemon.execute(json.loads(self.rfile.readline()), output)
+                except Exception as error:
+                    ErrorReporter(output).host_error(error)
+
+                    exit_code = 70
+
+                try:
+                    output.finish(exit_code)
+                except BrokenPipeError:
+                    pass
+
+        with socketserver.ThreadingUnixStreamServer(self.__socket_path, Handler) as server:
+            server.daemon_threads = True
+
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(self.__socket_path)
+
+
+    # Private methods
+
+    def __compile(
+        self,
+        pool: InterpreterPool,
+        key: tuple,
+        read: Callable[[], str],
+        output: SocketOutput,
+    ) -> Program:
+        program = self.__cache.get(key)
+
+        if program != None:
+            return program
+
+        program = pool.compile(read(), ErrorReporter(output))
+
+        if program != None:
+            self.__cache.put(key, program)
+
+        return program
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='velox_daemon')
+    parser.add_argument('--socket', default=VeloxClient.default_socket_path(), metavar='PATH')
+    parser.add_argument('--pool', type=int, default=4, metavar='N')
+
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, lambda signal_number, frame: sys.exit(0))
+
+    try:
+        VeloxDaemon(args.socket, max(args.pool, 1)).serve_forever()
+    except KeyboardInterrupt:
+        sys.exit(0)
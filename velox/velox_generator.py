@@ -0,0 +1,208 @@
+from typing import Any, ForwardRef, Iterator
+
+from environment import Environment
+import stmt as Stmt
+from velox_iterator import VeloxIterator
+from velox_return import VeloxReturn
+
+
+class GeneratorExecutor(Stmt.Visitor[Iterator[Any]]):
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        interpreter: ForwardRef('Interpreter'),
+    ) -> None:
+        self.__interpreter = interpreter
+
+
+    # Public methods
+
+    def run(
+        self,
+        statements: list[Stmt.Stmt],
+    ) -> Iterator[Any]:
+        for statement in statements:
+            yield from self.__generate(statement)
+
+
+    def visit_StmtBlock(
+        self,
+        stmt: Stmt.StmtBlock,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        if stmt.flat:
+            for statement in stmt.statements:
+                yield from self.__generate(statement)
+
+            return
+
+        previous = interpreter.environment
+        interpreter.environment = Environment(previous)
+
+        for statement in stmt.statements:
+            yield from self.__generate(statement)
+
+        interpreter.environment = previous
+
+
+    def visit_StmtFor(
+        self,
+        stmt: Stmt.StmtFor,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        previous = interpreter.environment
+
+        if isinstance(stmt.initializer, Stmt.StmtVar):
+            interpreter.environment = Environment(previous)
+
+        if stmt.initializer != None:
+            interpreter.execute(stmt.initializer)
+
+        while interpreter.is_truthy(interpreter.evaluate(stmt.condition)):
+            yield from self.__generate(stmt.body)
+
+            if stmt.increment != None:
+                interpreter.evaluate(stmt.increment)
+
+            if interpreter.checkpoint is not None:
+                interpreter.countdown -= 1
+
+                if interpreter.countdown <= 0:
+                    interpreter.countdown = interpreter.checkpoint(stmt.keyword)
+
+        interpreter.environment = previous
+
+
+    def visit_StmtForIn(
+        self,
+        stmt: Stmt.StmtForIn,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        iterator = interpreter.iterate(stmt.name, interpreter.evaluate(stmt.iterable))
+
+        previous = interpreter.environment
+
+        for value in iterator:
+            interpreter.environment = Environment(previous)
+            interpreter.environment.define(stmt.name.lexeme, value)
+
+            yield from self.__generate(stmt.body)
+
+            if interpreter.checkpoint is not None:
+                interpreter.countdown -= 1
+
+                if interpreter.countdown <= 0:
+                    interpreter.countdown = interpreter.checkpoint(stmt.name)
+
+        interpreter.environment = previous
+
+
+    def visit_StmtIf(
+        self,
+        stmt: Stmt.StmtIf,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        if interpreter.is_truthy(interpreter.evaluate(stmt.condition)):
+            yield from self.__generate(stmt.then_branch)
+        elif stmt.else_branch != None:
+            yield from self.__generate(stmt.else_branch)
+
+
+    def visit_StmtWhile(
+        self,
+        stmt: Stmt.StmtWhile,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        while interpreter.is_truthy(interpreter.evaluate(stmt.condition)):
+            yield from self.__generate(stmt.body)
+
+            if interpreter.checkpoint is not None:
+                interpreter.countdown -= 1
+
+                if interpreter.countdown <= 0:
+                    interpreter.countdown = interpreter.checkpoint(stmt.keyword)
+
+
+    def visit_StmtYield(
+        self,
+        stmt: Stmt.StmtYield,
+    ) -> Iterator[Any]:
+        value = None
+
+        if stmt.value != None:
+            value = self.__interpreter.evaluate(stmt.value)
+
+        yield value
+
+
+    # Private methods
+
+    def __generate(
+        self,
+        stmt: Stmt.Stmt,
+    ) -> Iterator[Any]:
+        steps = stmt.accept(self)
+
+        if steps == None:
+            self.__interpreter.execute(stmt)
+
+            return ()
+
+        return steps
+
+
+class VeloxGenerator(VeloxIterator):
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+        interpreter: ForwardRef('Interpreter'),
+        environment: Environment,
+        body: list[Stmt.Stmt],
+    ) -> None:
+        self.__name = name
+        self.__interpreter = interpreter
+        self.__environment = environment
+        self.__module = interpreter.module
+        self.__frames = GeneratorExecutor(interpreter).run(body)
+
+        super().__init__(self.__resume())
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<generator {self.__name}>'
+
+
+    # Private methods
+
+    def __resume(
+        self,
+    ) -> Iterator[Any]:
+        interpreter = self.__interpreter
+
+        while True:
+            previous = interpreter.environment
+            interpreter.environment = self.__environment
+
+            previous_module = interpreter.switch_module(self.__module)
+
+            try:
+                value = next(self.__frames)
+            except (StopIteration, VeloxReturn):
+                return
+            finally:
+                interpreter.switch_module(previous_module)
+
+                self.__environment = interpreter.environment
+                interpreter.environment = previous
+
+            yield value
@@ -1,6 +1,7 @@
-from typing import Any, ForwardRef
+from typing import Any, ForwardRef, Optional
 
-from token import Token
+from runtime_error import RuntimeError
+from velox_token import Token
 
 
 class VeloxInstance:
@@ -36,6 +37,16 @@ class VeloxInstance:
         raise RuntimeError(name, f'Undefined property \'{name.lexeme}\'.')
 
 
+    def method(
+        self,
+        name: Token,
+    ) -> Optional[ForwardRef('VeloxFunction')]:
+        if name.lexeme in self.__fields:
+            return None
+
+        return self.klass.find_method(name.lexeme)
+
+
     def set(
         self,
         name: Token,
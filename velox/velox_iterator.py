@@ -0,0 +1,50 @@
+from typing import Any, ForwardRef, Iterator
+
+
+class VeloxIterator:
+    __EXHAUSTED = object()
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        values: Iterator[Any],
+    ) -> None:
+        self.__values = values
+        self.__pending = VeloxIterator.__EXHAUSTED
+
+
+    def __iter__(
+        self,
+    ) -> ForwardRef('VeloxIterator'):
+        return self
+
+
+    def __next__(
+        self,
+    ) -> Any:
+        if self.__pending is not VeloxIterator.__EXHAUSTED:
+            value = self.__pending
+            self.__pending = VeloxIterator.__EXHAUSTED
+
+            return value
+
+        return next(self.__values)
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return '<iterator>'
+
+
+    # Public methods
+
+    def has_next(
+        self,
+    ) -> bool:
+        if self.__pending is VeloxIterator.__EXHAUSTED:
+            self.__pending = next(self.__values, VeloxIterator.__EXHAUSTED)
+
+        return self.__pending is not VeloxIterator.__EXHAUSTED
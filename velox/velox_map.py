@@ -0,0 +1,77 @@
+from typing import Any, Hashable, Iterator
+
+from velox_rope import VeloxRope
+
+
+class VeloxMap:
+    __FALSE = object()
+    __TRUE = object()
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+    ) -> None:
+        self.entries = {}
+
+
+    def __getstate__(
+        self,
+    ) -> list[tuple[Any, Any]]:
+        return [
+            (VeloxMap.value(key), value) for key, value in self.entries.items()
+        ]
+
+
+    def __setstate__(
+        self,
+        state: list[tuple[Any, Any]],
+    ) -> None:
+        self.entries = {
+            VeloxMap.key(key): value for key, value in state
+        }
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<map {len(self.entries)}>'
+
+
+    # Public methods
+
+    def keys(
+        self,
+    ) -> Iterator[Any]:
+        for key in list(self.entries):
+            yield VeloxMap.value(key)
+
+
+    @staticmethod
+    def key(
+        value: Any,
+    ) -> Hashable:
+        if value is True:
+            return VeloxMap.__TRUE
+
+        if value is False:
+            return VeloxMap.__FALSE
+
+        if isinstance(value, VeloxRope):
+            return str(value)
+
+        return value
+
+
+    @staticmethod
+    def value(
+        key: Hashable,
+    ) -> Any:
+        if key is VeloxMap.__TRUE:
+            return True
+
+        if key is VeloxMap.__FALSE:
+            return False
+
+        return key
@@ -0,0 +1,37 @@
+from typing import Any
+
+from environment import Environment
+from runtime_error import RuntimeError
+from velox_token import Token
+
+
+class VeloxModule:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        globals: Environment,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.globals = globals
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<module {self.name}>'
+
+
+    # Public methods
+
+    def get(
+        self,
+        name: Token,
+    ) -> Any:
+        try:
+            return self.globals.get(name)
+        except RuntimeError:
+            raise RuntimeError(name, f'Undefined property \'{name.lexeme}\'.')
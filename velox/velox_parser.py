@@ -1,23 +1,140 @@
+import io
+import threading
+from typing import Any, Callable
+
 from error_reporter import ErrorReporter
 import expr as Expr
+from runtime_error import RuntimeError
 import stmt as Stmt
-from token import Token
 from token_type import TokenType
+from velox_token import Token
 
 
 class ParseError(Exception):
     pass
 
 
+class LazyBody:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        function: Stmt.StmtFunction,
+        tokens: list[Token],
+    ) -> None:
+        self.__function = function
+        self.__name = function.name
+        self.__tokens = tokens
+        self.__statements = None
+        self.__deferred = []
+        self.__errors = None
+        self.__lock = threading.Lock()
+
+
+    def __getstate__(
+        self,
+    ) -> dict[str, Any]:
+        if self.__statements == None and self.__errors == None:
+            try:
+                self.parse(ErrorReporter(io.StringIO()))
+            except RuntimeError:
+                pass
+
+        state = dict(self.__dict__)
+
+        del state['_LazyBody__deferred']
+        del state['_LazyBody__lock']
+
+        return state
+
+
+    def __setstate__(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        self.__dict__.update(state)
+
+        self.__deferred = None
+        self.__lock = threading.Lock()
+
+
+    # Public methods
+
+    def defer(
+        self,
+        callback: Callable[[list[Stmt.Stmt], ErrorReporter], None],
+    ) -> None:
+        self.__deferred.append(callback)
+
+
+    def is_parsed(
+        self,
+    ) -> bool:
+        return self.__statements != None
+
+
+    def parse(
+        self,
+        reporter: ErrorReporter,
+    ) -> list[Stmt.Stmt]:
+        if self.__statements != None:
+            return self.__statements
+
+        with self.__lock:
+            return self.__parse(reporter)
+
+
+    # Private methods
+
+    def __parse(
+        self,
+        reporter: ErrorReporter,
+    ) -> list[Stmt.Stmt]:
+        if self.__statements != None:
+            return self.__statements
+
+        if self.__errors == None:
+            errors = io.StringIO()
+            body_reporter = ErrorReporter(errors)
+
+            statements = Parser(self.__tokens, body_reporter, True).parse_body(self.__function)
+
+            if not body_reporter.had_error:
+                for callback in self.__deferred:
+                    callback(statements, body_reporter)
+
+            if body_reporter.had_error:
+                self.__errors = errors.getvalue()
+                self.__function = None
+                self.__tokens = None
+
+        if self.__errors != None:
+            reporter.errors(self.__errors)
+
+            raise RuntimeError(self.__name, f'Invalid body for \'{self.__name.lexeme}\'.')
+
+        self.__statements = statements
+        self.__function = None
+        self.__tokens = None
+        self.__deferred = None
+
+        return statements
+
+
 class Parser:
     # Lifecycle methods
 
     def __init__(
         self,
         tokens: list[Token],
+        reporter: ErrorReporter,
+        lazy: bool = False,
     ) -> None:
         self.__tokens = tokens
+        self.__reporter = reporter
         self.__current = 0
+        self.__lazy = lazy
+        self.__yields = []
 
 
     # Public methods
@@ -33,6 +150,16 @@ class Parser:
         return statements
 
 
+    def parse_body(
+        self,
+        function: Stmt.StmtFunction,
+    ) -> list[Stmt.Stmt]:
+        try:
+            return self.__function_body(function)
+        except ParseError:
+            return []
+
+
     # Private methods
 
     def __advance(
@@ -181,6 +308,9 @@ class Parser:
             if self.__match(TokenType.FUN):
                 return self.__function('function')
 
+            if self.__match(TokenType.IMPORT):
+                return self.__import_declaration()
+
             if self.__match(TokenType.VAR):
                 return self.__var_declaration()
 
@@ -207,7 +337,7 @@ class Parser:
         token: Token,
         message: str,
     ) -> ParseError:
-        ErrorReporter.error(token, message)
+        self.__reporter.error(token, message)
         return ParseError()
 
 
@@ -244,6 +374,9 @@ class Parser:
 
         paren = self.__consume(TokenType.RIGHT_PAREN, 'Expected \')\' after arguments.')
 
+        if isinstance(expr, Expr.ExprGet):
+            return Expr.ExprInvoke(expr.object, expr.name, paren, arguments)
+
         return Expr.ExprCall(expr, paren, arguments)
 
 
@@ -275,9 +408,26 @@ class Parser:
 
         self.__consume(TokenType.LEFT_BRACE, f'Expected \'{{\' before {kind} body.')
 
-        body = self.__block()
+        function = Stmt.StmtFunction(name, parameters, None, False)
 
-        return Stmt.StmtFunction(name, parameters, body)
+        if self.__lazy:
+            function.body = self.__lazy_block(function)
+        else:
+            function.body = self.__function_body(function)
+
+        return function
+
+
+    def __function_body(
+        self,
+        function: Stmt.StmtFunction,
+    ) -> list[Stmt.Stmt]:
+        self.__yields.append(False)
+
+        try:
+            return self.__block()
+        finally:
+            function.is_generator = self.__yields.pop()
 
 
     def __if_statement(
@@ -311,11 +461,34 @@ class Parser:
         return expr
 
 
+    def __for_in_statement(
+        self,
+    ) -> Stmt.Stmt:
+        self.__consume(TokenType.VAR, 'Expected \'var\' in for-in loop.')
+
+        name = self.__consume(TokenType.IDENTIFIER, 'Expected variable name.')
+
+        self.__consume(TokenType.IN, 'Expected \'in\' after loop variable.')
+
+        iterable = self.__expression()
+
+        self.__consume(TokenType.RIGHT_PAREN, 'Expected \')\' after for-in clause.')
+
+        body = self.__statement()
+
+        return Stmt.StmtForIn(name, iterable, body)
+
+
     def __for_statement(
         self,
     ) -> Stmt.Stmt:
+        keyword = self.__previous()
+
         self.__consume(TokenType.LEFT_PAREN, 'Expected \'(\' after \'for\'.')
 
+        if self.__check(TokenType.VAR) and self.__peek_at(2).type == TokenType.IN:
+            return self.__for_in_statement()
+
         initializer = None
         if self.__match(TokenType.SEMICOLON):
             initializer = None
@@ -339,24 +512,25 @@ class Parser:
 
         body = self.__statement()
 
-        if increment is not None:
-            body = Stmt.StmtBlock([
-                body,
-                Stmt.StmtExpression(increment),
-            ])
-
-        body = Stmt.StmtWhile(
+        return Stmt.StmtFor(
+            keyword,
+            initializer,
             condition,
+            increment,
             body,
         )
 
-        if initializer is not None:
-            body = Stmt.StmtBlock([
-                initializer,
-                body,
-            ])
 
-        return body
+    def __import_declaration(
+        self,
+    ) -> Stmt.Stmt:
+        keyword = self.__previous()
+
+        name = self.__consume(TokenType.IDENTIFIER, 'Expected module name.')
+
+        self.__consume(TokenType.SEMICOLON, 'Expected \';\' after module name.')
+
+        return Stmt.StmtImport(keyword, name)
 
 
     def __is_at_end(
@@ -365,6 +539,30 @@ class Parser:
         return self.__peek().type == TokenType.EOF
 
 
+    def __lazy_block(
+        self,
+        function: Stmt.StmtFunction,
+    ) -> LazyBody:
+        start = self.__current
+        depth = 1
+
+        while not self.__is_at_end():
+            token = self.__advance()
+
+            if token.type == TokenType.LEFT_BRACE:
+                depth += 1
+            elif token.type == TokenType.RIGHT_BRACE:
+                depth -= 1
+
+                if depth == 0:
+                    tokens = self.__tokens[start:self.__current]
+                    tokens.append(Token(TokenType.EOF, '', None, token.line))
+
+                    return LazyBody(function, tokens)
+
+        raise self.__error(self.__peek(), 'Expected \'}\' after block.')
+
+
     def __match(
         self,
         *types: list[TokenType],
@@ -397,6 +595,13 @@ class Parser:
         return self.__tokens[self.__current]
 
 
+    def __peek_at(
+        self,
+        offset: int,
+    ) -> Token:
+        return self.__tokens[min(self.__current + offset, len(self.__tokens) - 1)]
+
+
     def __previous(
         self,
     ) -> Token:
@@ -447,11 +652,13 @@ class Parser:
     def __print_statement(
         self,
     ) -> Stmt.Stmt:
+        keyword = self.__previous()
+
         value = self.__expression()
 
         self.__consume(TokenType.SEMICOLON, 'Expected \';\' after value.')
 
-        return Stmt.StmtPrint(value)
+        return Stmt.StmtPrint(keyword, value)
 
 
     def __return_statement(
@@ -486,6 +693,9 @@ class Parser:
         if self.__match(TokenType.WHILE):
             return self.__while_statement()
 
+        if self.__match(TokenType.YIELD):
+            return self.__yield_statement()
+
         if self.__match(TokenType.LEFT_BRACE):
             return Stmt.StmtBlock(self.__block())
 
@@ -507,9 +717,11 @@ class Parser:
                 TokenType.VAR,
                 TokenType.FOR,
                 TokenType.IF,
+                TokenType.IMPORT,
                 TokenType.WHILE,
                 TokenType.PRINT,
                 TokenType.RETURN,
+                TokenType.YIELD,
             ]:
                 return
 
@@ -557,6 +769,8 @@ class Parser:
     def __while_statement(
         self,
     ) -> Stmt.Stmt:
+        keyword = self.__previous()
+
         self.__consume(TokenType.LEFT_PAREN, 'Expected \'(\' after \'while\'.')
 
         condition = self.__expression()
@@ -565,4 +779,21 @@ class Parser:
 
         body = self.__statement()
 
-        return Stmt.StmtWhile(condition, body)
+        return Stmt.StmtWhile(keyword, condition, body)
+
+
+    def __yield_statement(
+        self,
+    ) -> Stmt.Stmt:
+        keyword = self.__previous()
+
+        value = None
+        if not self.__check(TokenType.SEMICOLON):
+            value = self.__expression()
+
+        self.__consume(TokenType.SEMICOLON, 'Expected \';\' after yield value.')
+
+        if len(self.__yields) != 0:
+            self.__yields[-1] = True
+
+        return Stmt.StmtYield(keyword, value)
@@ -0,0 +1,94 @@
+from typing import Any, ForwardRef, Union
+
+
+class VeloxRope:
+    MIN_LENGTH = 256
+
+
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        parts: list[str],
+        count: int,
+        length: int,
+    ) -> None:
+        self.__parts = parts
+        self.__count = count
+        self.__length = length
+        self.__text = None
+
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        if isinstance(other, (str, VeloxRope)):
+            return str(self) == str(other)
+
+        return NotImplemented
+
+
+    def __hash__(
+        self,
+    ) -> int:
+        return hash(str(self))
+
+
+    def __reduce__(
+        self,
+    ) -> tuple[type, tuple[str]]:
+        return (str, (str(self),))
+
+
+    def __len__(
+        self,
+    ) -> int:
+        return self.__length
+
+
+    def __str__(
+        self,
+    ) -> str:
+        if self.__text == None:
+            self.__text = ''.join(self.__parts[:self.__count])
+
+            self.__parts = [self.__text]
+            self.__count = 1
+
+        return self.__text
+
+
+    # Public methods
+
+    @staticmethod
+    def concat(
+        left: Union[str, ForwardRef('VeloxRope')],
+        right: Union[str, ForwardRef('VeloxRope')],
+    ) -> Union[str, ForwardRef('VeloxRope')]:
+        if isinstance(left, VeloxRope):
+            return left.__append(str(right))
+
+        right = str(right)
+        length = len(left) + len(right)
+
+        if length < VeloxRope.MIN_LENGTH:
+            return left + right
+
+        return VeloxRope([left, right], 2, length)
+
+
+    # Private methods
+
+    def __append(
+        self,
+        text: str,
+    ) -> ForwardRef('VeloxRope'):
+        parts = self.__parts
+
+        if len(parts) != self.__count:
+            parts = parts[:self.__count]
+
+        parts.append(text)
+
+        return VeloxRope(parts, self.__count + 1, self.__length + len(text))
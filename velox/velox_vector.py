@@ -0,0 +1,17 @@
+from typing import Any
+
+
+class VeloxVector:
+    # Lifecycle methods
+
+    def __init__(
+        self,
+        values: Any,
+    ) -> None:
+        self.values = values
+
+
+    def __str__(
+        self,
+    ) -> str:
+        return f'<vector {len(self.values)}>'